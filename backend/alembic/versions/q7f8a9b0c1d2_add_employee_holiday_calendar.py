@@ -0,0 +1,31 @@
+"""add holiday_calendar to employees
+
+Which country's public holidays an employee's working days exclude. Every
+existing employee stays on the Polish calendar, the only one until now.
+
+Revision ID: q7f8a9b0c1d2
+Revises: p6e7f8a9b0c1
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q7f8a9b0c1d2"
+down_revision: Union[str, None] = "p6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "employees",
+        sa.Column("holiday_calendar", sa.String(8), nullable=False, server_default="PL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("employees", "holiday_calendar")
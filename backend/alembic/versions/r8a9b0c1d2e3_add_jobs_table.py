@@ -0,0 +1,66 @@
+"""add jobs table
+
+Background jobs (vacation sync and the like), claimed by workers with
+SELECT ... FOR UPDATE SKIP LOCKED so that several server processes can share
+the queue.
+
+Revision ID: r8a9b0c1d2e3
+Revises: q7f8a9b0c1d2
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "r8a9b0c1d2e3"
+down_revision: Union[str, None] = "q7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    sa.Enum("queued", "running", "succeeded", "failed", name="jobstatus").create(
+        op.get_bind(), checkfirst=True
+    )
+    job_status = postgresql.ENUM(
+        "queued", "running", "succeeded", "failed", name="jobstatus", create_type=False
+    )
+
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", job_status, nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "run_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.String(2000), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_jobs_status_run_at", "jobs", ["status", "run_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_status_run_at", table_name="jobs")
+    op.drop_table("jobs")
+    sa.Enum(name="jobstatus").drop(op.get_bind(), checkfirst=True)
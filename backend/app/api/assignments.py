@@ -4,24 +4,125 @@ from datetime import date, timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from app.core.dependencies import get_current_user, get_db, require_editor
+from app.core.events import (
+    ASSIGNMENT_CREATED,
+    ASSIGNMENT_DELETED,
+    ASSIGNMENT_SPLIT,
+    ASSIGNMENT_UPDATED,
+    assignment_event,
+    broker,
+)
 from app.models.assignment import Assignment
-from app.models.employee import Employee
+from app.models.employee import Employee, Team, employee_technologies
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.assignment import (
     AssignmentCreate,
     AssignmentResponse,
     AssignmentUpdate,
+    BulkAssignmentRequest,
+    BulkAssignmentResponse,
+    BulkCreateOperation,
+    BulkDeleteOperation,
+    BulkOperation,
+    BulkSplitOperation,
+    BulkUpdateOperation,
+    PlaceholderSuggestionRequest,
+    PlaceholderSuggestionResponse,
 )
 from app.services.assignment_service import calculate_daily_hours
+from app.services.occupancy_service import (
+    holidays_between,
+    load_occupancy_inputs,
+    working_days_between,
+)
+from app.services.placeholder_service import (
+    Candidate,
+    CandidateLoad,
+    FillRequirements,
+    suggest_fills,
+)
 from app.utils.working_days import get_working_days
 
 router = APIRouter(prefix="/api/assignments", tags=["assignments"])
 
+# Suggestions load every candidate over the whole batch; keep the span bounded.
+MAX_SUGGESTION_DAYS = 3 * 366
+
+
+def _ensure_assignable_employee(employee: Optional[Employee]) -> None:
+    """Raise unless the employee exists and may take new work."""
+    if not employee:
+        raise HTTPException(status_code=404, detail="Nie znaleziono pracownika")
+    if employee.is_archived:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Nie można przypisać zarchiwizowanego pracownika",
+        )
+
+
+def _ensure_assignable_project(project: Optional[Project]) -> None:
+    """Raise unless the project exists and may take new work."""
+    if not project:
+        raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
+    if project.is_archived:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Nie można przypisać pracownika do zarchiwizowanego projektu",
+        )
+
+
+def _ensure_valid_dates(start_date: date, end_date: date) -> None:
+    """Raise unless the range is ordered and holds at least one working day."""
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+    if get_working_days(start_date, end_date) < 1:
+        raise HTTPException(
+            status_code=400, detail="Assignment must contain at least 1 working day"
+        )
+
+
+def _split(assignment: Assignment, split_date: date) -> Assignment:
+    """Cut `assignment` at split_date, returning the new second half.
+
+    The original keeps start→split_date-1 and is modified in place; the caller
+    adds the returned assignment to the session.
+    """
+    if split_date <= assignment.start_date or split_date > assignment.end_date:
+        raise HTTPException(
+            status_code=400,
+            detail="split_date must be strictly after start_date and not after end_date",
+        )
+
+    original_end = split_date - timedelta(days=1)
+
+    wd1 = get_working_days(assignment.start_date, original_end)
+    wd2 = get_working_days(split_date, assignment.end_date)
+    if wd1 < 1 or wd2 < 1:
+        raise HTTPException(
+            status_code=400,
+            detail="Obie części muszą zawierać co najmniej 1 dzień roboczy",
+        )
+
+    new_assignment = Assignment(
+        employee_id=assignment.employee_id,
+        project_id=assignment.project_id,
+        start_date=split_date,
+        end_date=assignment.end_date,
+        allocation_type=assignment.allocation_type,
+        allocation_value=assignment.allocation_value,
+        note=assignment.note,
+        is_tentative=assignment.is_tentative,
+    )
+    assignment.end_date = original_end
+    return new_assignment
+
 
 def _build_response(a: Assignment) -> dict:
     """Build response dict from assignment with project info and daily_hours."""
@@ -51,6 +152,94 @@ def _build_response(a: Assignment) -> dict:
     }
 
 
+def _apply_update_fields(assignment: Assignment, body: AssignmentUpdate) -> None:
+    """Copy the plain (unvalidated) fields of a PATCH body onto an assignment."""
+    if body.start_date is not None:
+        assignment.start_date = body.start_date
+    if body.end_date is not None:
+        assignment.end_date = body.end_date
+    if body.allocation_type is not None:
+        assignment.allocation_type = body.allocation_type
+    if body.allocation_value is not None:
+        assignment.allocation_value = body.allocation_value
+    if "note" in body.model_fields_set:
+        assignment.note = body.note.strip() if body.note else None
+    if body.is_tentative is not None:
+        assignment.is_tentative = body.is_tentative
+
+
+_BULK_STATUS = {"create": 201, "update": 200, "split": 200, "delete": 204}
+_BULK_EVENTS = {
+    "create": ASSIGNMENT_CREATED,
+    "update": ASSIGNMENT_UPDATED,
+    "split": ASSIGNMENT_SPLIT,
+    "delete": ASSIGNMENT_DELETED,
+}
+
+
+def _apply_bulk_operation(
+    op: BulkOperation,
+    assignments: dict[int, Assignment],
+    employees: dict,
+    projects: dict,
+) -> list[Assignment]:
+    """Validate one bulk operation against preloaded rows, then apply it.
+
+    `employees` and `projects` map id -> row with `is_archived`; `assignments`
+    maps id -> loaded Assignment and loses the entry on delete, so a later
+    operation on the same id gets 404. Raises the same HTTPException as the
+    single-item endpoint would, before changing anything.
+
+    Returns the assignments involved: the new one for create, the updated one
+    for update, both halves for split (the new half last) and the removed one
+    for delete. New assignments are not added to the session here.
+    """
+    if isinstance(op, BulkCreateOperation):
+        _ensure_valid_dates(op.start_date, op.end_date)
+        if op.employee_id is not None:
+            _ensure_assignable_employee(employees.get(op.employee_id))
+        _ensure_assignable_project(projects.get(op.project_id))
+        return [
+            Assignment(
+                employee_id=op.employee_id,
+                project_id=op.project_id,
+                start_date=op.start_date,
+                end_date=op.end_date,
+                allocation_type=op.allocation_type,
+                allocation_value=op.allocation_value,
+                note=op.note,
+                is_tentative=op.is_tentative,
+            )
+        ]
+
+    assignment = assignments.get(op.id)
+    if assignment is None:
+        raise HTTPException(status_code=404, detail="Nie znaleziono assignmentu")
+
+    if isinstance(op, BulkUpdateOperation):
+        assign_employee = "employee_id" in op.model_fields_set
+        if assign_employee and op.employee_id is not None:
+            _ensure_assignable_employee(employees.get(op.employee_id))
+        if op.project_id is not None:
+            _ensure_assignable_project(projects.get(op.project_id))
+        _ensure_valid_dates(
+            op.start_date or assignment.start_date,
+            op.end_date or assignment.end_date,
+        )
+        if assign_employee:
+            assignment.employee_id = op.employee_id
+        if op.project_id is not None:
+            assignment.project_id = op.project_id
+        _apply_update_fields(assignment, op)
+        return [assignment]
+
+    if isinstance(op, BulkSplitOperation):
+        return [assignment, _split(assignment, op.split_date)]
+
+    del assignments[op.id]
+    return [assignment]
+
+
 @router.get("", response_model=list[AssignmentResponse])
 async def list_assignments(
     employee_id: Optional[int] = Query(None),
@@ -82,15 +271,7 @@ async def create_assignment(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(require_editor),
 ):
-    # Validate dates
-    if body.start_date > body.end_date:
-        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
-
-    wd = get_working_days(body.start_date, body.end_date)
-    if wd < 1:
-        raise HTTPException(
-            status_code=400, detail="Assignment must contain at least 1 working day"
-        )
+    _ensure_valid_dates(body.start_date, body.end_date)
 
     # Validate employee exists and is not archived
     # (skipped for placeholder assignments, employee_id is None)
@@ -98,25 +279,11 @@ async def create_assignment(
         emp = await db.execute(
             select(Employee).where(Employee.id == body.employee_id)
         )
-        employee = emp.scalar_one_or_none()
-        if not employee:
-            raise HTTPException(status_code=404, detail="Nie znaleziono pracownika")
-        if employee.is_archived:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Nie można przypisać zarchiwizowanego pracownika",
-            )
+        _ensure_assignable_employee(emp.scalar_one_or_none())
 
     # Validate project exists and is not archived
     proj = await db.execute(select(Project).where(Project.id == body.project_id))
-    project = proj.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
-    if project.is_archived:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Nie można przypisać pracownika do zarchiwizowanego projektu",
-        )
+    _ensure_assignable_project(proj.scalar_one_or_none())
 
     assignment = Assignment(
         employee_id=body.employee_id,
@@ -131,9 +298,301 @@ async def create_assignment(
     db.add(assignment)
     await db.commit()
     await db.refresh(assignment)
+    await broker.publish(assignment_event(ASSIGNMENT_CREATED, [assignment]))
     return _build_response(assignment)
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkAssignmentResponse,
+    responses={400: {"description": "Co najmniej jedna operacja się nie powiodła"}},
+)
+async def bulk_assignments(
+    body: BulkAssignmentRequest,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(require_editor),
+):
+    """Apply a list of create/update/delete/split operations atomically.
+
+    Everything the batch references is loaded up front with one query each for
+    assignments, employees and projects, so validation costs the same few
+    round-trips however many operations there are. Operations are applied in
+    order and written with a single commit.
+
+    If any operation fails nothing is written: the response is 400 with the
+    result of every operation, failed ones carrying the status code and detail
+    their single-item endpoint would have returned.
+    """
+    operations = body.operations
+    assignment_ids = {op.id for op in operations if not isinstance(op, BulkCreateOperation)}
+    employee_ids = {
+        op.employee_id
+        for op in operations
+        if isinstance(op, (BulkCreateOperation, BulkUpdateOperation))
+        and op.employee_id is not None
+    }
+    project_ids = {
+        op.project_id
+        for op in operations
+        if isinstance(op, (BulkCreateOperation, BulkUpdateOperation))
+        and op.project_id is not None
+    }
+
+    # Responses only need the project; skip the employee's selectin chain
+    # (capacities, team, technologies) on both assignment loads.
+    assignments: dict[int, Assignment] = {}
+    if assignment_ids:
+        result = await db.execute(
+            select(Assignment)
+            .where(Assignment.id.in_(assignment_ids))
+            .options(noload(Assignment.employee))
+        )
+        assignments = {a.id: a for a in result.scalars()}
+    # Where each assignment was before the batch, for the change events.
+    previous = {a.id: (a.employee_id, a.project_id) for a in assignments.values()}
+    # Only the archive flag matters for validation, so skip the relationships.
+    employees: dict = {}
+    if employee_ids:
+        result = await db.execute(
+            select(Employee.id, Employee.is_archived).where(Employee.id.in_(employee_ids))
+        )
+        employees = {row.id: row for row in result}
+    projects: dict = {}
+    if project_ids:
+        result = await db.execute(
+            select(Project.id, Project.is_archived).where(Project.id.in_(project_ids))
+        )
+        projects = {row.id: row for row in result}
+
+    results: list[dict] = []
+    touched: list[list[Assignment]] = []
+    deleted: set[Assignment] = set()
+    changed: dict[str, list[Assignment]] = {}
+    for index, op in enumerate(operations):
+        try:
+            involved = _apply_bulk_operation(op, assignments, employees, projects)
+        except HTTPException as exc:
+            results.append(
+                {
+                    "index": index,
+                    "op": op.op,
+                    "ok": False,
+                    "status_code": exc.status_code,
+                    "detail": exc.detail,
+                    "assignments": [],
+                }
+            )
+            touched.append([])
+            continue
+
+        changed.setdefault(op.op, []).extend(involved)
+        if isinstance(op, BulkDeleteOperation):
+            await db.delete(involved[0])
+            deleted.add(involved[0])
+            involved = []
+        elif isinstance(op, (BulkCreateOperation, BulkSplitOperation)):
+            db.add(involved[-1])
+        results.append(
+            {
+                "index": index,
+                "op": op.op,
+                "ok": True,
+                "status_code": _BULK_STATUS[op.op],
+                "assignments": [],
+            }
+        )
+        touched.append(involved)
+
+    failed = sum(1 for r in results if not r["ok"])
+    if failed:
+        await db.rollback()
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "detail": (
+                    f"Nie zapisano zmian: {failed} z {len(results)} operacji "
+                    "zakończyło się błędem"
+                ),
+                "results": results,
+            },
+        )
+
+    await db.commit()
+
+    # One reload for everything the batch left behind, instead of a refresh
+    # per assignment; brings in created_at and the (possibly changed) project.
+    # Results show the state after the whole batch.
+    remaining = {a.id for group in touched for a in group if a not in deleted}
+    if remaining:
+        result = await db.execute(
+            select(Assignment)
+            .where(Assignment.id.in_(remaining))
+            .options(noload(Assignment.employee))
+            .execution_options(populate_existing=True)
+        )
+        result.scalars().all()
+    for entry, group in zip(results, touched):
+        entry["assignments"] = [
+            _build_response(a) for a in group if a not in deleted
+        ]
+
+    for op_name, group in changed.items():
+        before = [previous[a.id] for a in group if a.id in previous]
+        if op_name != "delete":
+            # Updated or split, then deleted later on: reported as deleted.
+            group = [a for a in group if a not in deleted]
+        await broker.publish(
+            assignment_event(
+                _BULK_EVENTS[op_name],
+                dict.fromkeys(group),
+                employee_ids=[employee_id for employee_id, _ in before],
+                project_ids=[project_id for _, project_id in before],
+            )
+        )
+    return {"results": results}
+
+
+@router.post("/placeholders/suggestions", response_model=PlaceholderSuggestionResponse)
+async def suggest_placeholder_fills(
+    body: PlaceholderSuggestionRequest,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    """Propose employees for a batch of placeholder assignments.
+
+    Candidates are active employees, ranked by how many of the wanted
+    technologies they have (when any are given, at least one is required),
+    then by being in a preferred team, then by the share of the placeholder's
+    hours that fits into their free time. The batch is matched greedily (see
+    `suggest_fills`): each placeholder's first suggestion is counted as taken
+    when the next one is matched. Nothing is written.
+
+    Everything is loaded with a handful of column-only queries for the whole
+    batch, and the hours follow the timeline's rules. The batch may span at
+    most 3 years, from its earliest start to its latest end.
+    """
+    targets = {t.assignment_id: t for t in body.placeholders}
+    result = await db.execute(
+        select(
+            Assignment.id,
+            Assignment.project_id,
+            Assignment.start_date,
+            Assignment.end_date,
+            Assignment.allocation_type,
+            Assignment.allocation_value,
+            Assignment.is_tentative,
+            Project.name.label("project_name"),
+        )
+        .join(Project, Project.id == Assignment.project_id)
+        .where(Assignment.id.in_(targets), Assignment.employee_id.is_(None))
+    )
+    placeholders = {row.id: row for row in result}
+    missing = [str(i) for i in targets if i not in placeholders]
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Nie znaleziono przypisań zastępczych: {', '.join(missing)}",
+        )
+
+    start = min(p.start_date for p in placeholders.values())
+    end = max(p.end_date for p in placeholders.values())
+    if (end - start).days > MAX_SUGGESTION_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 3 lata")
+    days = working_days_between(start, end, holidays_between(start, end))
+
+    active = select(Employee.id).where(Employee.is_archived == False)
+    employees = {
+        row.id: row
+        for row in await db.execute(
+            select(
+                Employee.id,
+                Employee.first_name,
+                Employee.last_name,
+                Employee.team_id,
+                Team.name.label("team"),
+            )
+            .outerjoin(Team, Employee.team_id == Team.id)
+            .where(Employee.is_archived == False)
+            .order_by(Employee.last_name, Employee.first_name)
+        )
+    }
+    technologies: dict[int, set[int]] = {emp_id: set() for emp_id in employees}
+    for emp_id, tech_id in await db.execute(
+        select(
+            employee_technologies.c.employee_id, employee_technologies.c.technology_id
+        ).where(employee_technologies.c.employee_id.in_(active))
+    ):
+        technologies[emp_id].add(tech_id)
+    inputs = await load_occupancy_inputs(
+        db, active, start, end, include_tentative=body.include_tentative
+    )
+
+    profiles: dict = {}
+
+    def load_for(emp_id: int) -> CandidateLoad:
+        return CandidateLoad.build(
+            inputs.assignments.get(emp_id, []),
+            inputs.vacations.get(emp_id, []),
+            days,
+            inputs.capacities.get(emp_id, []),
+            profiles,
+            inputs.calendar(emp_id),
+        )
+
+    options = suggest_fills(
+        list(placeholders.values()),
+        {
+            t.assignment_id: FillRequirements(
+                technology_ids=frozenset(t.technology_ids),
+                team_ids=frozenset(t.team_ids),
+            )
+            for t in targets.values()
+        },
+        [
+            Candidate(
+                employee_id=emp.id,
+                team_id=emp.team_id,
+                technology_ids=frozenset(technologies[emp.id]),
+            )
+            for emp in employees.values()
+        ],
+        load_for,
+        days,
+        per_placeholder=body.suggestions_per_placeholder,
+    )
+
+    results = []
+    for assignment_id in targets:
+        p = placeholders[assignment_id]
+        suggestions = []
+        for option in options[assignment_id]:
+            emp = employees[option.employee_id]
+            suggestions.append(
+                {
+                    "employee_id": emp.id,
+                    "name": f"{emp.last_name} {emp.first_name}",
+                    "team": emp.team,
+                    "matched_technologies": option.matched_technologies,
+                    "in_team": option.in_team,
+                    "hours": float(round(option.hours, 1)),
+                    "covered_hours": float(round(option.covered_hours, 1)),
+                    "coverage": float(round(option.coverage * 100, 1)),
+                    "short_days": option.short_days,
+                }
+            )
+        results.append(
+            {
+                "assignment_id": p.id,
+                "project_id": p.project_id,
+                "project_name": p.project_name,
+                "start_date": p.start_date,
+                "end_date": p.end_date,
+                "suggestions": suggestions,
+            }
+        )
+    return {"results": results}
+
+
 @router.patch("/{assignment_id}", response_model=AssignmentResponse)
 async def update_assignment(
     assignment_id: int,
@@ -145,6 +604,8 @@ async def update_assignment(
     assignment = result.scalar_one_or_none()
     if not assignment:
         raise HTTPException(status_code=404, detail="Nie znaleziono assignmentu")
+    # Rows the assignment may be moved away from need a refresh too.
+    previous_employee_id, previous_project_id = assignment.employee_id, assignment.project_id
 
     if "employee_id" in body.model_fields_set:
         if body.employee_id is None:
@@ -154,54 +615,29 @@ async def update_assignment(
             emp = await db.execute(
                 select(Employee).where(Employee.id == body.employee_id)
             )
-            employee = emp.scalar_one_or_none()
-            if not employee:
-                raise HTTPException(status_code=404, detail="Nie znaleziono pracownika")
-            if employee.is_archived:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Nie można przypisać zarchiwizowanego pracownika",
-                )
+            _ensure_assignable_employee(emp.scalar_one_or_none())
             assignment.employee_id = body.employee_id
 
     if body.project_id is not None:
         proj = await db.execute(select(Project).where(Project.id == body.project_id))
-        project = proj.scalar_one_or_none()
-        if not project:
-            raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
-        if project.is_archived:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Nie można przypisać pracownika do zarchiwizowanego projektu",
-            )
+        _ensure_assignable_project(proj.scalar_one_or_none())
         assignment.project_id = body.project_id
 
-    if body.start_date is not None:
-        assignment.start_date = body.start_date
-    if body.end_date is not None:
-        assignment.end_date = body.end_date
-    if body.allocation_type is not None:
-        assignment.allocation_type = body.allocation_type
-    if body.allocation_value is not None:
-        assignment.allocation_value = body.allocation_value
-    if "note" in body.model_fields_set:
-        assignment.note = body.note.strip() if body.note else None
-    if body.is_tentative is not None:
-        assignment.is_tentative = body.is_tentative
-
-    # Re-validate dates
-    if assignment.start_date > assignment.end_date:
-        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+    _apply_update_fields(assignment, body)
 
-    # Validate at least 1 working day (same check as create)
-    wd = get_working_days(assignment.start_date, assignment.end_date)
-    if wd < 1:
-        raise HTTPException(
-            status_code=400, detail="Assignment must contain at least 1 working day"
-        )
+    # Re-validate dates (same checks as create)
+    _ensure_valid_dates(assignment.start_date, assignment.end_date)
 
     await db.commit()
     await db.refresh(assignment)
+    await broker.publish(
+        assignment_event(
+            ASSIGNMENT_UPDATED,
+            [assignment],
+            employee_ids=[previous_employee_id],
+            project_ids=[previous_project_id],
+        )
+    )
     return _build_response(assignment)
 
 
@@ -218,38 +654,12 @@ async def split_assignment(
     if not assignment:
         raise HTTPException(status_code=404, detail="Nie znaleziono assignmentu")
 
-    if split_date <= assignment.start_date or split_date > assignment.end_date:
-        raise HTTPException(
-            status_code=400,
-            detail="split_date must be strictly after start_date and not after end_date",
-        )
-
-    original_end = split_date - timedelta(days=1)
-
-    wd1 = get_working_days(assignment.start_date, original_end)
-    wd2 = get_working_days(split_date, assignment.end_date)
-    if wd1 < 1 or wd2 < 1:
-        raise HTTPException(
-            status_code=400,
-            detail="Obie części muszą zawierać co najmniej 1 dzień roboczy",
-        )
-
-    new_assignment = Assignment(
-        employee_id=assignment.employee_id,
-        project_id=assignment.project_id,
-        start_date=split_date,
-        end_date=assignment.end_date,
-        allocation_type=assignment.allocation_type,
-        allocation_value=assignment.allocation_value,
-        note=assignment.note,
-        is_tentative=assignment.is_tentative,
-    )
-    assignment.end_date = original_end
-
+    new_assignment = _split(assignment, split_date)
     db.add(new_assignment)
     await db.commit()
     await db.refresh(assignment)
     await db.refresh(new_assignment)
+    await broker.publish(assignment_event(ASSIGNMENT_SPLIT, [assignment, new_assignment]))
     return [_build_response(assignment), _build_response(new_assignment)]
 
 
@@ -276,26 +686,12 @@ async def duplicate_assignment(
         emp = await db.execute(
             select(Employee).where(Employee.id == assignment.employee_id)
         )
-        employee = emp.scalar_one_or_none()
-        if not employee:
-            raise HTTPException(status_code=404, detail="Nie znaleziono pracownika")
-        if employee.is_archived:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Nie można przypisać zarchiwizowanego pracownika",
-            )
+        _ensure_assignable_employee(emp.scalar_one_or_none())
 
     proj = await db.execute(
         select(Project).where(Project.id == assignment.project_id)
     )
-    project = proj.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
-    if project.is_archived:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Nie można przypisać pracownika do zarchiwizowanego projektu",
-        )
+    _ensure_assignable_project(proj.scalar_one_or_none())
 
     new_assignment = Assignment(
         employee_id=assignment.employee_id,
@@ -310,6 +706,7 @@ async def duplicate_assignment(
     db.add(new_assignment)
     await db.commit()
     await db.refresh(new_assignment)
+    await broker.publish(assignment_event(ASSIGNMENT_CREATED, [new_assignment]))
     return _build_response(new_assignment)
 
 
@@ -324,5 +721,7 @@ async def delete_assignment(
     if not assignment:
         raise HTTPException(status_code=404, detail="Nie znaleziono assignmentu")
 
+    event = assignment_event(ASSIGNMENT_DELETED, [assignment])
     await db.delete(assignment)
     await db.commit()
+    await broker.publish(event)
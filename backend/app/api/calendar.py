@@ -1,41 +1,84 @@
 from __future__ import annotations
 
-import calendar as cal_mod
-from datetime import date, timedelta
-from decimal import Decimal
+import base64
+import hashlib
+import json
+from datetime import date
+from fractions import Fraction
 from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user, get_db, require_admin
-from app.models.assignment import AllocationType, Assignment
+from app.core.responses import FastJSONResponse, etag_matches
+from app.models.assignment import Assignment
 from app.models.employee import Employee, Technology
 from app.models.user import User
 from app.models.vacation import Vacation
+from app.schemas.job import JobResponse
 from app.services.assignment_service import calculate_daily_hours
 from app.services.capacity_service import (
     assignment_base_daily_hours,
     build_capacity_periods,
-    daily_capacity_hours,
     serialize_capacity,
 )
+from app.services.columnar_service import TimelineColumns
+from app.services.occupancy_service import (
+    GRANULARITIES,
+    CalendarDays,
+    compute_daily_load,
+    is_overbooked,
+    occupancy_metrics,
+    period_windows,
+    week_key,
+    weeks_in_range,
+    working_days_between,
+)
 from app.services.vacation_sync_service import (
+    enqueue_vacation_sync,
     get_calamari_config,
-    get_default_sync_range,
     get_last_sync_timestamp,
-    sync_vacations,
 )
-from app.utils.polish_holidays import get_holiday_name, get_polish_holidays
-from app.utils.query_params import parse_id_csv
+from app.utils.holiday_calendars import (
+    DEFAULT_CALENDAR,
+    calendar_codes,
+    get_provider,
+    named_holidays,
+    working_day_bitmap,
+)
+from app.utils.query_params import parse_choice_csv, parse_id_csv
 from app.utils.working_days import get_working_days, get_working_days_in_month
 
 router = APIRouter(tags=["calendar"])
 
+# Bitmaps are small (46 bytes a year); the cap only guards against abuse.
+MAX_BITMAP_DAYS = 10 * 366
+# Holidays of a given year and calendar do not change between deployments.
+BITMAP_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def _check_calendar(calendar: str) -> None:
+    if calendar not in calendar_codes():
+        raise HTTPException(status_code=400, detail="Nieznany kalendarz świąt")
+
+
+def _serialize_holidays(
+    start_date: date, end_date: date, calendar: str = DEFAULT_CALENDAR
+) -> list[dict]:
+    """Holidays in [start, end] as the timelines return them."""
+    return [
+        {"date": d.isoformat(), "name": name}
+        for d, name in named_holidays(start_date, end_date, calendar)
+    ]
+
 
 def _serialize_timeline_assignment(
-    a: Assignment, range_start: date, capacities: list | None = None
+    a: Assignment,
+    range_start: date,
+    capacities: list | None = None,
+    calendar: str = DEFAULT_CALENDAR,
 ) -> dict:
     """Serialize an assignment for the timeline response.
 
@@ -52,7 +95,10 @@ def _serialize_timeline_assignment(
         first_month_date.month,
         start_date=a.start_date,
         end_date=a.end_date,
-        base_daily_hours=assignment_base_daily_hours(capacities, first_month_date),
+        base_daily_hours=assignment_base_daily_hours(
+            capacities, first_month_date, calendar
+        ),
+        calendar=calendar,
     )
     return {
         "id": a.id,
@@ -69,18 +115,57 @@ def _serialize_timeline_assignment(
     }
 
 
-@router.get("/api/assignments/timeline")
+@router.get("/api/assignments/timeline", response_class=FastJSONResponse)
 async def get_timeline(
     start_date: date = Query(...),
     end_date: date = Query(...),
     team_ids: Optional[str] = Query(None),
     technology_ids: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
-    granularity: Literal["monthly", "weekly"] = Query("monthly"),
+    granularity: str = Query("monthly"),
+    format: Literal["rows", "columnar"] = Query("rows"),
+    min_occupancy: Optional[float] = Query(None),
+    max_occupancy: Optional[float] = Query(None),
+    overbooked_only: bool = Query(False),
+    occupancy_from: Optional[date] = Query(None),
+    occupancy_to: Optional[date] = Query(None),
+    sort: Literal["name", "occupancy_desc", "occupancy_asc"] = Query("name"),
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    """Return timeline data as per CLAUDE.md contract."""
+    """Return timeline data as per CLAUDE.md contract.
+
+    `granularity` may list several of monthly, weekly and daily; occupancy is
+    then reported for each, from the same daily load. `format=columnar`
+    returns the same data dictionary-encoded, see
+    `app.services.columnar_service`.
+
+    The occupancy filters and sorts are evaluated over the occupancy window
+    (`occupancy_from`..`occupancy_to`, the requested range by default) before
+    anything is serialized, so employees that do not match cost no more than
+    their daily load.
+    """
+    granularities = parse_choice_csv(granularity, GRANULARITIES)
+    window_start = occupancy_from or start_date
+    window_end = occupancy_to or end_date
+    if window_start > window_end:
+        raise HTTPException(
+            status_code=400, detail="occupancy_from must be <= occupancy_to"
+        )
+    by_occupancy = (
+        min_occupancy is not None
+        or max_occupancy is not None
+        or overbooked_only
+        or sort != "name"
+    )
+    # The window may reach outside the displayed range ("who is free next
+    # month"); its assignments and vacations are then read as well, but only
+    # the range's are returned.
+    fetch_start, fetch_end = start_date, end_date
+    if by_occupancy:
+        fetch_start = min(start_date, window_start)
+        fetch_end = max(end_date, window_end)
+
     # Build employee query
     # Archived employees leave this view; their assignments stay visible in the
     # project timeline, which is what preserves the projects' history.
@@ -115,23 +200,18 @@ async def get_timeline(
         else:
             current = date(current.year, current.month + 1, 1)
 
-    # Collect holidays
-    holiday_dates = set()
-    for year in range(start_date.year, end_date.year + 1):
-        holiday_dates.update(get_polish_holidays(year))
-    holidays_in_range = sorted(d for d in holiday_dates if start_date <= d <= end_date)
-
     # Working days per month
-    working_days_per_month = {}
-    for y, m in months:
-        key = f"{y}-{m:02d}"
-        working_days_per_month[key] = get_working_days_in_month(y, m)
+    def working_days_per_month(calendar: str) -> dict[str, int]:
+        return {
+            f"{y}-{m:02d}": get_working_days_in_month(y, m, calendar)
+            for y, m in months
+        }
 
     # Fetch all vacations in range
     vac_result = await db.execute(
         select(Vacation).where(
-            Vacation.start_date <= end_date,
-            Vacation.end_date >= start_date,
+            Vacation.start_date <= fetch_end,
+            Vacation.end_date >= fetch_start,
         )
     )
     all_vacations = vac_result.scalars().all()
@@ -150,8 +230,8 @@ async def get_timeline(
             select(Assignment)
             .where(
                 Assignment.employee_id.in_(emp_ids),
-                Assignment.start_date <= end_date,
-                Assignment.end_date >= start_date,
+                Assignment.start_date <= fetch_end,
+                Assignment.end_date >= fetch_start,
             )
             .order_by(Assignment.start_date)
         )
@@ -175,20 +255,110 @@ async def get_timeline(
     # Get vacation sync status
     sync_status = await _get_vacation_sync_status(db)
 
+    # Occupancy periods may reach past the range (whole months, ISO weeks);
+    # every employee's daily load covers all of them, in their own calendar,
+    # and is summed into every requested granularity.
+    periods = [
+        window
+        for g in granularities
+        for window in period_windows(start_date, end_date, g)
+    ]
+    load_days = (
+        CalendarDays(
+            min(fetch_start, *(p[1] for p in periods)),
+            max(fetch_end, *(p[2] for p in periods)),
+        )
+        if periods
+        else None
+    )
+    capacity_profiles: dict = {}
+
+    # Daily loads first, so that filtering and sorting see every employee
+    # before any of them is serialized.
+    loads = []
+    for emp in employees:
+        calendar = emp.holiday_calendar
+        load = compute_daily_load(
+            assignments_by_employee[emp.id],
+            vacations_by_employee.get(emp.id, []),
+            load_days[calendar] if load_days is not None else [],
+            emp.capacities,
+            capacity_profiles,
+            calendar,
+        )
+        if by_occupancy:
+            available, booked, _ = load.unit_totals(window_start, window_end)
+            # Booked with nothing available reports 0%, but is over any limit.
+            if not available and booked > 0:
+                pct = float("inf")
+            else:
+                pct = occupancy_metrics(available, booked)["percentage"]
+            if min_occupancy is not None and pct < min_occupancy:
+                continue
+            if max_occupancy is not None and pct > max_occupancy:
+                continue
+            if overbooked_only and not _has_overbooked_day(
+                load, window_start, window_end
+            ):
+                continue
+            loads.append((emp, load, _occupancy_rank(available, booked)))
+        else:
+            loads.append((emp, load, None))
+    if sort != "name":
+        # Stable, so equal loads stay in name order.
+        loads.sort(key=lambda row: row[2], reverse=sort == "occupancy_desc")
+    employees = [emp for emp, _, _ in loads]
+
+    columns = (
+        TimelineColumns(start_date, [key for key, _, _ in periods])
+        if format == "columnar"
+        else None
+    )
+
     # Build employee data
     employee_data = []
-    for emp in employees:
+    for emp, load, _ in loads:
         assignments = assignments_by_employee[emp.id]
 
         capacities = emp.capacities
+        calendar = emp.holiday_calendar
+        emp_vacations = vacations_by_employee.get(emp.id, [])
+        if (fetch_start, fetch_end) != (start_date, end_date):
+            assignments = [
+                a
+                for a in assignments
+                if a.start_date <= end_date and a.end_date >= start_date
+            ]
+            emp_vacations = [
+                v
+                for v in emp_vacations
+                if v.start_date <= end_date and v.end_date >= start_date
+            ]
+
+        # Occupancy per period (month, week or day), from one pass over the range
+        occupancy = load.summarize_periods(periods)
+        # Run-length encoded contracted hours, so the frontend can size its own
+        # per-day availability figures without re-implementing the capacity
+        # rules.
+        capacity_periods = build_capacity_periods(
+            capacities, start_date, end_date, calendar
+        )
+
+        if columns is not None:
+            columns.add_employee(
+                emp,
+                assignments,
+                emp_vacations,
+                occupancy,
+                capacity_periods,
+                serialize_capacity(emp.current_capacity),
+            )
+            continue
 
         assignment_list = [
-            _serialize_timeline_assignment(a, start_date, capacities)
+            _serialize_timeline_assignment(a, start_date, capacities, calendar)
             for a in assignments
         ]
-
-        # Employee vacations
-        emp_vacations = vacations_by_employee.get(emp.id, [])
         vacation_list = [
             {
                 "start_date": v.start_date.isoformat(),
@@ -200,91 +370,70 @@ async def get_timeline(
             for v in emp_vacations
         ]
 
-        # Calculate occupancy per period (month or week)
-        occupancy: dict = {}
-        if granularity == "weekly":
-            for week_start, week_end in _get_weeks_in_range(start_date, end_date):
-                key = _week_key(week_start)
-                occupancy[key] = _compute_occupancy_for_period(
-                    assignments,
-                    emp_vacations,
-                    week_start,
-                    week_end,
-                    holiday_dates,
-                    capacities,
-                )
-        else:
-            for y, m in months:
-                key = f"{y}-{m:02d}"
-                period_start = date(y, m, 1)
-                period_end = date(y, m, cal_mod.monthrange(y, m)[1])
-                occupancy[key] = _compute_occupancy_for_period(
-                    assignments,
-                    emp_vacations,
-                    period_start,
-                    period_end,
-                    holiday_dates,
-                    capacities,
-                )
-
         employee_data.append(
             {
                 "id": emp.id,
                 "name": f"{emp.last_name} {emp.first_name}",
                 "team": emp.team.name if emp.team else None,
                 "technologies": [t.name for t in emp.technologies],
+                "holiday_calendar": calendar,
                 "assignments": assignment_list,
                 "vacations": vacation_list,
                 "occupancy": occupancy,
-                # Run-length encoded contracted hours, so the frontend can size
-                # its own per-day availability figures without re-implementing
-                # the capacity rules.
-                "capacity_periods": build_capacity_periods(
-                    capacities, start_date, end_date
-                ),
+                "capacity_periods": capacity_periods,
                 "capacity": serialize_capacity(emp.current_capacity),
             }
         )
 
+    # `holidays` and `working_days_per_month` are the default calendar's;
+    # employees on another one are covered by `holiday_calendars`.
+    other_calendars = sorted(
+        {emp.holiday_calendar for emp in employees} - {DEFAULT_CALENDAR}
+    )
+    shared = {
+        "holidays": _serialize_holidays(start_date, end_date),
+        "working_days_per_month": working_days_per_month(DEFAULT_CALENDAR),
+        "holiday_calendars": {
+            code: {
+                "holidays": _serialize_holidays(start_date, end_date, code),
+                "working_days_per_month": working_days_per_month(code),
+            }
+            for code in other_calendars
+        },
+        "vacation_sync_status": sync_status,
+    }
+
     # Placeholder assignments belong to nobody, so percentages fall back to the
     # full-time norm until the work is given to a person.
+    if columns is not None:
+        for a in placeholder_assignments:
+            columns.add_assignment(a)
+        return FastJSONResponse(columns.payload(**shared))
+
     placeholder_list = [
         _serialize_timeline_assignment(a, start_date, None)
         for a in placeholder_assignments
     ]
+    payload = {"employees": employee_data, "placeholders": placeholder_list, **shared}
+    return FastJSONResponse(payload)
 
-    return {
-        "employees": employee_data,
-        "placeholders": placeholder_list,
-        "holidays": [
-            {"date": d.isoformat(), "name": get_holiday_name(d)}
-            for d in holidays_in_range
-        ],
-        "working_days_per_month": working_days_per_month,
-        "vacation_sync_status": sync_status,
-    }
 
+def _has_overbooked_day(load, start_date: date, end_date: date) -> bool:
+    """Whether any working day in [start, end] is overbooked on its own."""
+    lo, hi = load.span(start_date, end_date)
+    return any(
+        is_overbooked(load.available[i], load.committed[i]) for i in range(lo, hi)
+    )
 
-def _week_key(week_start: date) -> str:
-    """Generate week key matching frontend format: 'w-YYYY-WW'."""
-    _, iso_week, _ = week_start.isocalendar()
-    return f"w-{week_start.year}-{iso_week}"
 
+def _occupancy_rank(available: int, booked: int) -> tuple[bool, Fraction]:
+    """Sort key for a load: booked with nothing available ranks highest."""
+    return (not available and booked > 0, Fraction(booked, available or 1))
 
-def _get_weeks_in_range(start_date: date, end_date: date) -> list[tuple[date, date]]:
-    """Return (week_start, week_end) pairs for all ISO weeks touching the range.
 
-    The first window is aligned to the Monday of start_date's week so that
-    windows are always true ISO weeks (Monday–Sunday), matching the frontend's
-    Monday-based week grid regardless of which weekday start_date falls on.
-    """
-    weeks = []
-    current = start_date - timedelta(days=start_date.weekday())
-    while current <= end_date:
-        week_end = current + timedelta(days=6)
-        weeks.append((current, week_end))
-        current = week_end + timedelta(days=1)
-    return weeks
+# Period helpers live with the occupancy engine; kept under their old names.
+_week_key = week_key
+_get_weeks_in_range = weeks_in_range
 
 
 def _compute_occupancy_for_period(
@@ -309,58 +458,14 @@ def _compute_occupancy_for_period(
 
     Zero availability with hours booked (work planned before someone joins) is
     reported as overbooked rather than as 0%, since the ratio is undefined.
-    """
-    net_available = Decimal("0")
-    hours_numerator = Decimal("0")
-
-    d = period_start
-    while d <= period_end:
-        if d.weekday() >= 5 or d in holiday_dates:
-            d += timedelta(days=1)
-            continue
-
-        is_vacation = any(v.start_date <= d <= v.end_date for v in vacations)
-
-        if not is_vacation:
-            net_available += (
-                daily_capacity_hours(capacities, d)
-                if capacities is not None
-                else Decimal("8")
-            )
-
-        for a in assignments:
-            if not (a.start_date <= d <= a.end_date):
-                continue
-            daily = calculate_daily_hours(
-                a.allocation_type.value,
-                a.allocation_value,
-                d.year,
-                d.month,
-                start_date=a.start_date,
-                end_date=a.end_date,
-                base_daily_hours=assignment_base_daily_hours(capacities, d),
-            )
-            if a.allocation_type == AllocationType.percentage:
-                if not is_vacation:
-                    hours_numerator += daily
-            else:
-                hours_numerator += daily
-
-        d += timedelta(days=1)
 
-    if net_available == 0:
-        pct = 0.0
-        overbooked = hours_numerator > 0
-    else:
-        pct = float(round(hours_numerator / net_available * Decimal("100"), 1))
-        overbooked = pct > 100
-
-    return {
-        "percentage": pct,
-        "hours": float(round(hours_numerator, 1)),
-        "available_hours": float(round(net_available, 1)),
-        "is_overbooked": overbooked,
-    }
+    The rules are evaluated by `compute_daily_load`; callers covering several
+    periods should build one load for the whole range and summarize it per
+    period instead of calling this repeatedly.
+    """
+    days = working_days_between(period_start, period_end, holiday_dates)
+    load = compute_daily_load(assignments, vacations, days, capacities)
+    return load.summarize(period_start, period_end)
 
 
 async def _get_vacation_sync_status(db: AsyncSession) -> dict:
@@ -403,30 +508,95 @@ async def get_vacations(
     ]
 
 
-@router.post("/api/calendar/vacations/sync")
+@router.post(
+    "/api/calendar/vacations/sync",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_vacation_sync(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(require_admin),
 ):
-    """Manually trigger vacation sync (admin only)."""
-    start, end = get_default_sync_range()
-    count = await sync_vacations(db, start, end)
-    return {"status": "ok", "synced": count}
+    """Queue a vacation sync (admin only).
+
+    Returns the job at once; poll `GET /api/jobs/{id}` for the outcome, whose
+    `result` is `{"synced": <count>}`. A sync that is still waiting to start
+    is returned instead of queueing a second one.
+    """
+    return await enqueue_vacation_sync(db)
+
+
+@router.get("/api/calendar/holiday-calendars")
+async def list_holiday_calendars(
+    _user: User = Depends(get_current_user),
+):
+    """Holiday calendars employees can be assigned to."""
+    return [
+        {
+            "code": code,
+            "name": get_provider(code).name,
+            "is_default": code == DEFAULT_CALENDAR,
+        }
+        for code in calendar_codes()
+    ]
 
 
 @router.get("/api/calendar/holidays/{year}")
 async def get_holidays(
     year: int,
+    calendar: str = Query(DEFAULT_CALENDAR),
     _user: User = Depends(get_current_user),
 ):
-    holidays = get_polish_holidays(year)
-    return [{"date": d.isoformat(), "name": get_holiday_name(d)} for d in holidays]
+    _check_calendar(calendar)
+    return _serialize_holidays(date(year, 1, 1), date(year, 12, 31), calendar)
 
 
 @router.get("/api/calendar/working-days")
 async def get_working_days_endpoint(
     start_date: date = Query(...),
     end_date: date = Query(...),
+    calendar: str = Query(DEFAULT_CALENDAR),
     _user: User = Depends(get_current_user),
 ):
-    return {"working_days": get_working_days(start_date, end_date)}
+    _check_calendar(calendar)
+    return {"working_days": get_working_days(start_date, end_date, calendar)}
+
+
+@router.get("/api/calendar/working-days/bitmap")
+async def get_working_days_bitmap(
+    start: date = Query(...),
+    end: date = Query(...),
+    calendar: str = Query(DEFAULT_CALENDAR),
+    if_none_match: Optional[str] = Header(None),
+    _user: User = Depends(get_current_user),
+):
+    """Working days of [start, end] as a base64 bitset, plus holiday names.
+
+    Bit `i % 8` of byte `i // 8` is set when `start + i` days is a working
+    day. The answer depends on nothing but the query, so it is sent with a
+    year-long immutable `Cache-Control` and an ETag; asking per calendar
+    year keeps the client's cache keys stable.
+    """
+    _check_calendar(calendar)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+    if (end - start).days > MAX_BITMAP_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 10 lat")
+
+    bitmap = working_day_bitmap(start, end, calendar)
+    body = {
+        "calendar": calendar,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "days": (end - start).days + 1,
+        "bitmap": base64.b64encode(bitmap).decode("ascii"),
+        "holidays": {
+            d.isoformat(): name for d, name in named_holidays(start, end, calendar)
+        },
+    }
+    content = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode()
+    digest = hashlib.sha256(content).hexdigest()[:32]
+    headers = {"Cache-Control": BITMAP_CACHE_CONTROL, "ETag": f'"{digest}"'}
+    if if_none_match and etag_matches(if_none_match, digest):
+        return Response(status_code=304, headers=headers)
+    return Response(content, media_type="application/json", headers=headers)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.employee import Employee, Team, Technology, employee_technologies
+from app.models.user import User
+from app.services.occupancy_service import (
+    CalendarDays,
+    is_overbooked,
+    load_occupancy_inputs,
+    period_day_bounds,
+    period_units,
+    period_windows,
+)
+from app.utils.hour_units import percentage, round_units
+
+router = APIRouter(prefix="/api/capacity", tags=["capacity"])
+
+# Rollups are computed in one request; keep the window bounded.
+MAX_ROLLUP_DAYS = 3 * 366
+
+
+def _group_figures(available: int, booked: int, tentative: int, overbooked: int) -> dict:
+    """Serialize a group's summed figures, given in the engine's hour units."""
+    return {
+        "available_hours": round_units(available),
+        "booked_hours": round_units(booked),
+        "tentative_hours": round_units(tentative),
+        "percentage": percentage(booked, available) if available else 0.0,
+        "overbooked_count": overbooked,
+    }
+
+
+@router.get("/rollup")
+async def get_capacity_rollup(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    group_by: Literal["team", "technology"] = Query("team"),
+    granularity: Literal["monthly", "weekly"] = Query("monthly"),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    """Occupancy summed per team or technology, per period.
+
+    Uses the same rules as the employee timeline (it runs the same daily load
+    engine), for active employees only. Figures per group and period:
+    available, booked and tentative hours, the booked percentage, and how many
+    members are overbooked on their own. An employee with several technologies
+    counts towards each of them; employees without a team or technology form a
+    group with `id` null.
+
+    Only the columns the rules need are loaded — no ORM objects — and each
+    employee's periods are totalled by capacity segment rather than day by
+    day (see `period_units`), so this stays fast for thousands of employees
+    over a couple of years.
+    """
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+    if (end_date - start_date).days > MAX_ROLLUP_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 3 lata")
+
+    periods = period_windows(start_date, end_date, granularity)
+    load_start, load_end = periods[0][1], periods[-1][2]
+
+    active = select(Employee.id).where(Employee.is_archived == False)
+    employee_ids = list((await db.execute(active)).scalars())
+
+    # Group membership and names
+    if group_by == "team":
+        names = {
+            row.id: row.name
+            for row in await db.execute(select(Team.id, Team.name))
+        }
+        membership = await db.execute(
+            select(Employee.id, Employee.team_id).where(Employee.is_archived == False)
+        )
+        members: dict[int | None, list[int]] = {gid: [] for gid in names}
+        for emp_id, team_id in membership:
+            members.setdefault(team_id, []).append(emp_id)
+    else:
+        names = {
+            row.id: row.name
+            for row in await db.execute(select(Technology.id, Technology.name))
+        }
+        membership = await db.execute(
+            select(
+                employee_technologies.c.employee_id,
+                employee_technologies.c.technology_id,
+            ).where(employee_technologies.c.employee_id.in_(active))
+        )
+        members = {gid: [] for gid in names}
+        grouped: set[int] = set()
+        for emp_id, tech_id in membership:
+            members[tech_id].append(emp_id)
+            grouped.add(emp_id)
+        ungrouped = [e for e in employee_ids if e not in grouped]
+        if ungrouped:
+            members[None] = ungrouped
+
+    inputs = await load_occupancy_inputs(db, active, load_start, load_end)
+    days = CalendarDays(load_start, load_end)
+
+    # One pass per employee: (available, booked, tentative, overbooked) per period
+    bounds: dict[str, list[int]] = {}
+    profiles: dict = {}
+    per_employee: dict[int, list[tuple[int, int, int, bool]]] = {}
+    for emp_id in employee_ids:
+        calendar = inputs.calendar(emp_id)
+        if calendar not in bounds:
+            bounds[calendar] = period_day_bounds(days[calendar], periods)
+        totals = period_units(
+            inputs.assignments.get(emp_id, []),
+            inputs.vacations.get(emp_id, []),
+            days[calendar],
+            bounds[calendar],
+            inputs.capacities.get(emp_id, []),
+            profiles,
+            calendar,
+        )
+        per_employee[emp_id] = [
+            (available, booked, tentative, is_overbooked(available, booked))
+            for available, booked, tentative in totals
+        ]
+
+    groups = []
+    for group_id, member_ids in members.items():
+        period_data = {}
+        for p, (key, _, _) in enumerate(periods):
+            available = booked = tentative = 0
+            overbooked = 0
+            for emp_id in member_ids:
+                a, b, t, over = per_employee[emp_id][p]
+                available += a
+                booked += b
+                tentative += t
+                overbooked += over
+            period_data[key] = _group_figures(available, booked, tentative, overbooked)
+        groups.append(
+            {
+                "id": group_id,
+                "name": names.get(group_id),
+                "headcount": len(member_ids),
+                "periods": period_data,
+            }
+        )
+    # Named groups alphabetically, the ungrouped bucket last
+    groups.sort(key=lambda g: (g["id"] is None, (g["name"] or "").lower()))
+
+    return {
+        "group_by": group_by,
+        "granularity": granularity,
+        "periods": [
+            {"key": key, "start_date": s.isoformat(), "end_date": e.isoformat()}
+            for key, s, e in periods
+        ],
+        "groups": groups,
+    }
@@ -8,6 +8,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user, get_db, require_admin, require_editor
+from app.core.events import CAPACITY_CHANGED, EMPLOYEE_CHANGED, PlanEvent, broker
 from app.models.assignment import Assignment
 from app.models.employee import CapacityType, Employee, EmployeeCapacity, Team, Technology
 from app.models.user import User
@@ -19,10 +20,12 @@ from app.schemas.employee import (
     EmployeeResponse,
     EmployeeUpdate,
 )
+from app.schemas.lifecycle import WindDownPreviewResponse
 from app.services.capacity_service import baseline_capacity
 from app.services.lifecycle_service import (
     count_assignments,
     delete_assignments,
+    preview_wind_down,
     wind_down_assignments,
 )
 from app.utils.query_params import parse_id_csv
@@ -221,12 +224,14 @@ async def create_employee(
         last_name=body.last_name,
         team_id=body.team_id,
         email=body.email,
+        holiday_calendar=body.holiday_calendar,
         technologies=technologies,
         capacities=[baseline_capacity()],
     )
     db.add(employee)
     await _commit_handling_email_conflict(db)
     await db.refresh(employee)
+    await broker.publish(PlanEvent(EMPLOYEE_CHANGED, employee_ids=(employee.id,)))
     return employee
 
 
@@ -254,9 +259,12 @@ async def update_employee(
     if body.email is not None:
         await _ensure_email_available(db, body.email, exclude_id=employee_id)
         employee.email = body.email if body.email else None
+    if body.holiday_calendar is not None:
+        employee.holiday_calendar = body.holiday_calendar
 
     await _commit_handling_email_conflict(db)
     await db.refresh(employee)
+    await broker.publish(PlanEvent(EMPLOYEE_CHANGED, employee_ids=(employee_id,)))
     return employee
 
 
@@ -294,6 +302,7 @@ async def delete_employee(
     deleted_assignments = await delete_assignments(db, assignment_filter)
     await db.delete(employee)
     await db.commit()
+    await broker.publish(PlanEvent(EMPLOYEE_CHANGED, employee_ids=(employee_id,)))
     return {"deleted": True, "deleted_assignments": deleted_assignments}
 
 
@@ -340,6 +349,7 @@ async def create_capacity(
         )
     )
     await db.commit()
+    await broker.publish(PlanEvent(CAPACITY_CHANGED, employee_ids=(employee_id,)))
     return await _reload_capacities(db, employee_id)
 
 
@@ -378,6 +388,7 @@ async def update_capacity(
     capacity.capacity_value = body.capacity_value
 
     await db.commit()
+    await broker.publish(PlanEvent(CAPACITY_CHANGED, employee_ids=(employee_id,)))
     return await _reload_capacities(db, employee_id)
 
 
@@ -410,9 +421,28 @@ async def delete_capacity(
 
     await db.delete(target)
     await db.commit()
+    await broker.publish(PlanEvent(CAPACITY_CHANGED, employee_ids=(employee_id,)))
     return await _reload_capacities(db, employee_id)
 
 
+@router.get("/{employee_id}/archive/preview", response_model=WindDownPreviewResponse)
+async def preview_archive_employee(
+    employee_id: int,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(require_editor),
+):
+    """Count the assignments archiving the employee would keep, trim and delete.
+
+    Same rules as the archive itself, evaluated with one aggregate query;
+    nothing is changed.
+    """
+    result = await db.execute(select(Employee.id).where(Employee.id == employee_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Nie znaleziono pracownika")
+
+    return await preview_wind_down(db, Assignment.employee_id == employee_id)
+
+
 @router.post("/{employee_id}/archive", response_model=EmployeeResponse)
 async def archive_employee(
     employee_id: int,
@@ -435,6 +465,7 @@ async def archive_employee(
 
     await db.commit()
     await db.refresh(employee)
+    await broker.publish(PlanEvent(EMPLOYEE_CHANGED, employee_ids=(employee_id,)))
     return employee
 
 
@@ -457,4 +488,5 @@ async def unarchive_employee(
     employee.is_archived = False
     await db.commit()
     await db.refresh(employee)
+    await broker.publish(PlanEvent(EMPLOYEE_CHANGED, employee_ids=(employee_id,)))
     return employee
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import AsyncIterable
+
+from fastapi import APIRouter, Depends
+from fastapi.sse import EventSourceResponse, ServerSentEvent
+
+from app.core.dependencies import get_stream_user
+from app.core.events import broker
+from app.models.user import User
+
+router = APIRouter(prefix="/api/events", tags=["events"])
+
+# How long browsers wait before reconnecting a dropped stream.
+RETRY_MILLISECONDS = 3000
+
+
+@router.get("", response_class=EventSourceResponse)
+async def stream_plan_events(
+    _user: User = Depends(get_stream_user),
+) -> AsyncIterable[ServerSentEvent]:
+    """Stream plan changes as Server-Sent Events.
+
+    Each event is named after the change (`assignment.updated`,
+    `capacity.changed`, ...) and carries the ids of the employees, projects
+    and assignments to refetch; a null list means any of them. `resync`
+    means events may have been missed (the stream fell behind, or workers
+    lost touch): refetch everything. Streams are not resumable, so a client
+    that reconnects should refetch everything as well.
+
+    The token may be passed as `?access_token=`, as EventSource cannot send
+    headers.
+    """
+    with broker.subscription() as queue:
+        yield ServerSentEvent(comment="connected", retry=RETRY_MILLISECONDS)
+        while True:
+            event = await queue.get()
+            yield ServerSentEvent(event=event.type, raw_data=event.to_json())
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import AsyncIterator, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.dependencies import get_current_user
+from app.database import async_session_factory
+from app.models.user import User
+from app.services.employee_filter_service import active_employee_ids
+from app.services.export_service import (
+    ASSIGNMENT_COLUMNS,
+    OCCUPANCY_COLUMNS,
+    assignment_rows,
+    occupancy_rows,
+)
+from app.utils.spreadsheet import stream_csv, stream_xlsx
+
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+# Same bound as the other company-wide reports.
+MAX_EXPORT_DAYS = 3 * 366
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _check_range(start_date: date, end_date: date) -> None:
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+    if (end_date - start_date).days > MAX_EXPORT_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 3 lata")
+
+
+def _spreadsheet_response(
+    name: str,
+    fmt: str,
+    columns: list[str],
+    batches: AsyncIterator[list[tuple]],
+) -> StreamingResponse:
+    if fmt == "xlsx":
+        body = stream_xlsx(name, columns, batches)
+    else:
+        body = stream_csv(columns, batches)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/occupancy")
+async def export_occupancy(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    granularity: Literal["monthly", "weekly"] = Query("monthly"),
+    team_ids: Optional[str] = Query(None),
+    technology_ids: Optional[str] = Query(None),
+    format: Literal["csv", "xlsx"] = Query("csv"),
+    _user: User = Depends(get_current_user),
+):
+    """Occupancy of every active employee per period, as CSV or XLSX.
+
+    One row per employee and period with the timeline's figures. The file is
+    streamed while it is computed, a batch of employees at a time, so even a
+    company-wide export over three years starts downloading at once.
+    """
+    _check_range(start_date, end_date)
+    employee_ids = active_employee_ids(team_ids, technology_ids)
+
+    # The response outlives this handler, so the rows are read in a session
+    # of their own rather than the request's.
+    async def batches():
+        async with async_session_factory() as db:
+            async for rows in occupancy_rows(
+                db, employee_ids, start_date, end_date, granularity
+            ):
+                yield rows
+
+    name = f"occupancy_{start_date.isoformat()}_{end_date.isoformat()}"
+    return _spreadsheet_response(name, format, OCCUPANCY_COLUMNS, batches())
+
+
+@router.get("/assignments")
+async def export_assignments(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    team_ids: Optional[str] = Query(None),
+    technology_ids: Optional[str] = Query(None),
+    format: Literal["csv", "xlsx"] = Query("csv"),
+    _user: User = Depends(get_current_user),
+):
+    """Assignments overlapping the range as a flat CSV or XLSX list.
+
+    Covers active employees and, unless a team or technology filter is
+    given, placeholders (with an empty employee). `daily_hours` is computed
+    as on the timeline. Rows are streamed from a database cursor.
+    """
+    _check_range(start_date, end_date)
+    employee_ids = active_employee_ids(team_ids, technology_ids)
+    include_placeholders = not (team_ids or technology_ids)
+
+    async def batches():
+        async with async_session_factory() as db:
+            async for rows in assignment_rows(
+                db, employee_ids, start_date, end_date, include_placeholders
+            ):
+                yield rows
+
+    name = f"assignments_{start_date.isoformat()}_{end_date.isoformat()}"
+    return _spreadsheet_response(name, format, ASSIGNMENT_COLUMNS, batches())
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_db, require_editor
+from app.core.events import ASSIGNMENT_CREATED, EMPLOYEE_CHANGED, PlanEvent, broker
+from app.models.user import User
+from app.schemas.imports import ImportResponse
+from app.services.import_service import (
+    MAX_REPORTED_ERRORS,
+    ImportFileError,
+    ImportResult,
+    import_assignments,
+    import_employees,
+)
+
+router = APIRouter(prefix="/api/import", tags=["import"])
+
+
+def _import_response(result: ImportResult, dry_run: bool):
+    content = {
+        "dry_run": dry_run,
+        "rows": result.rows,
+        "created": result.created,
+        "error_count": len(result.errors),
+        "errors": [asdict(e) for e in result.errors[:MAX_REPORTED_ERRORS]],
+    }
+    if result.errors:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "detail": f"Nie zaimportowano pliku, liczba błędów: {len(result.errors)}",
+                **content,
+            },
+        )
+    return content
+
+
+async def _run_import(
+    importer, event: PlanEvent, file: UploadFile, dry_run: bool, db: AsyncSession
+):
+    try:
+        result = await importer(db, await file.read(), dry_run=dry_run)
+    except ImportFileError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if result.created:
+        await db.commit()
+        await broker.publish(event)
+    return _import_response(result, dry_run)
+
+
+@router.post(
+    "/assignments",
+    response_model=ImportResponse,
+    responses={400: {"description": "Plik zawiera błędne wiersze"}},
+)
+async def import_assignments_csv(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(require_editor),
+):
+    """Create assignments from a CSV file in one transaction.
+
+    Every row is validated as `POST /api/assignments` would validate it,
+    with one lookup query per kind of reference for the whole file, and the
+    rows are written with multi-row INSERTs. If any row is invalid nothing is
+    written and the response is 400 listing each error with its line number.
+    With `dry_run` the file is only validated.
+    """
+    # The new rows are not read back, so any row may have changed.
+    event = PlanEvent(ASSIGNMENT_CREATED, None, None, None)
+    return await _run_import(import_assignments, event, file, dry_run, db)
+
+
+@router.post(
+    "/employees",
+    response_model=ImportResponse,
+    responses={400: {"description": "Plik zawiera błędne wiersze"}},
+)
+async def import_employees_csv(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(require_editor),
+):
+    """Create employees from a CSV file in one transaction.
+
+    Rows follow the rules of `POST /api/employees` (unique name and email,
+    existing team and technologies, full time from always), checked across
+    the file as well as against the database. All or nothing, like the
+    assignment import.
+    """
+    event = PlanEvent(EMPLOYEE_CHANGED, employee_ids=None)
+    return await _run_import(import_employees, event, file, dry_run, db)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import base64
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_user, get_db
+from app.core.responses import FastJSONResponse
+from app.models.user import User
+from app.services.employee_filter_service import (
+    active_employee_ids,
+    load_named_employees,
+)
+from app.services.occupancy_service import (
+    HUNDRED,
+    CalendarDays,
+    OverbookedInterval,
+    availability_runs,
+    load_occupancy_inputs,
+    overbooked_intervals,
+)
+from app.utils.holiday_calendars import working_day_bitmap
+
+router = APIRouter(prefix="/api/occupancy", tags=["occupancy"])
+
+# Default look-ahead of the overbooking scan
+DEFAULT_SCAN_DAYS = 183
+# Scans are computed in one request; keep the window bounded.
+MAX_SCAN_DAYS = 3 * 366
+# Default span of the availability heatmap
+DEFAULT_HEATMAP_DAYS = 364
+
+
+def _check_range(start_date: date, end_date: date) -> None:
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+    if (end_date - start_date).days > MAX_SCAN_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 3 lata")
+
+
+def _serialize_interval(interval: OverbookedInterval, days: list[date]) -> dict:
+    available = interval.peak_available_hours
+    return {
+        "start_date": days[interval.start].isoformat(),
+        "end_date": days[interval.end - 1].isoformat(),
+        "working_days": interval.end - interval.start,
+        "excess_hours": float(round(interval.excess_hours, 1)),
+        "peak_hours": float(round(interval.peak_booked_hours, 1)),
+        "peak_available_hours": float(round(available, 1)),
+        "peak_percentage": (
+            float(round(interval.peak_booked_hours / available * HUNDRED, 1))
+            if available
+            else None
+        ),
+    }
+
+
+@router.get("/overbookings")
+async def get_overbookings(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    team_ids: Optional[str] = Query(None),
+    technology_ids: Optional[str] = Query(None),
+    include_tentative: bool = Query(True),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    """Every active employee's over-capacity intervals in the range.
+
+    Defaults to today and the following six months. An interval is a maximal
+    run of working days on which the employee is overbooked by the timeline's
+    rules (weekends and holidays inside it do not break it); only employees
+    with at least one interval are returned, sorted like the timeline.
+
+    Each employee's assignments are swept as start/end events against their
+    capacity and vacations (see `overbooked_intervals`), so the cost depends
+    on how many assignments there are, not on the length of the range.
+    """
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=DEFAULT_SCAN_DAYS)
+    _check_range(start_date, end_date)
+
+    emp_query = active_employee_ids(team_ids, technology_ids)
+    employees = await load_named_employees(db, emp_query)
+    inputs = await load_occupancy_inputs(
+        db, emp_query, start_date, end_date, include_tentative=include_tentative
+    )
+    days_by_calendar = CalendarDays(start_date, end_date)
+
+    profiles: dict = {}
+    result = []
+    for emp in employees:
+        assignments = inputs.assignments.get(emp.id)
+        if not assignments:
+            continue
+        calendar = inputs.calendar(emp.id)
+        days = days_by_calendar[calendar]
+        intervals = overbooked_intervals(
+            assignments,
+            inputs.vacations.get(emp.id, []),
+            days,
+            inputs.capacities.get(emp.id, []),
+            profiles,
+            calendar,
+        )
+        if intervals:
+            result.append(
+                {
+                    "id": emp.id,
+                    "name": f"{emp.last_name} {emp.first_name}",
+                    "team": emp.team,
+                    "intervals": [_serialize_interval(i, days) for i in intervals],
+                }
+            )
+
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "include_tentative": include_tentative,
+        "employees": result,
+    }
+
+
+@router.get("/heatmap", response_class=FastJSONResponse)
+async def get_availability_heatmap(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    team_ids: Optional[str] = Query(None),
+    technology_ids: Optional[str] = Query(None),
+    include_tentative: bool = Query(True),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    """Free and booked hours per active employee and working day.
+
+    Defaults to a year from today. Each employee's working days (in their
+    holiday calendar) are run-length encoded as `[day_count, free_hours,
+    booked_hours]` runs, so a steady schedule is a handful of runs however
+    long the range. The runs come from the same stretch sweep as the
+    overbooking scan (see `availability_runs`); working days are sent once
+    per calendar, as the bitmap of `/api/calendar/working-days/bitmap`.
+    """
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=DEFAULT_HEATMAP_DAYS)
+    _check_range(start_date, end_date)
+
+    emp_query = active_employee_ids(team_ids, technology_ids)
+    employees = await load_named_employees(db, emp_query)
+    inputs = await load_occupancy_inputs(
+        db, emp_query, start_date, end_date, include_tentative=include_tentative
+    )
+    days_by_calendar = CalendarDays(start_date, end_date)
+
+    profiles: dict = {}
+    result = []
+    for emp in employees:
+        calendar = inputs.calendar(emp.id)
+        result.append(
+            {
+                "id": emp.id,
+                "name": f"{emp.last_name} {emp.first_name}",
+                "team": emp.team,
+                "holiday_calendar": calendar,
+                "runs": availability_runs(
+                    inputs.assignments.get(emp.id, []),
+                    inputs.vacations.get(emp.id, []),
+                    days_by_calendar[calendar],
+                    inputs.capacities.get(emp.id, []),
+                    profiles,
+                    calendar,
+                ),
+            }
+        )
+
+    return FastJSONResponse(
+        {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "include_tentative": include_tentative,
+            "calendars": {
+                code: {
+                    "working_days": len(days),
+                    "bitmap": base64.b64encode(
+                        working_day_bitmap(start_date, end_date, code)
+                    ).decode("ascii"),
+                }
+                for code, days in sorted(days_by_calendar.items())
+            },
+            "employees": result,
+        }
+    )
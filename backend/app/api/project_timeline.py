@@ -1,30 +1,33 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user, get_db
+from app.core.responses import FastJSONResponse
 from app.models.assignment import Assignment
 from app.models.employee import Employee
 from app.models.project import Project
 from app.models.user import User
 from app.services.assignment_service import calculate_daily_hours
 from app.services.capacity_service import assignment_base_daily_hours
-from app.utils.polish_holidays import get_holiday_name, get_polish_holidays
+from app.services.columnar_service import ProjectTimelineColumns
+from app.utils.holiday_calendars import DEFAULT_CALENDAR, named_holidays
 from app.utils.working_days import get_working_days_in_month
 
 router = APIRouter(tags=["project-timeline"])
 
 
-@router.get("/api/projects/timeline")
+@router.get("/api/projects/timeline", response_class=FastJSONResponse)
 async def get_project_timeline(
     start_date: date = Query(...),
     end_date: date = Query(...),
     search: Optional[str] = Query(None),
+    format: Literal["rows", "columnar"] = Query("rows"),
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
@@ -32,7 +35,8 @@ async def get_project_timeline(
 
     Archived projects are excluded so the project-grouped view stays focused on
     live work; their assignments remain visible in the employee timeline, which
-    is what preserves historical occupancy.
+    is what preserves historical occupancy. `format=columnar` returns the same
+    data dictionary-encoded, see `app.services.columnar_service`.
     """
     proj_query = select(Project).where(Project.is_archived == False)
     if search and search.strip():
@@ -52,12 +56,6 @@ async def get_project_timeline(
         else:
             current = date(current.year, current.month + 1, 1)
 
-    # Holidays
-    holiday_dates = set()
-    for year in range(start_date.year, end_date.year + 1):
-        holiday_dates.update(get_polish_holidays(year))
-    holidays_in_range = sorted(d for d in holiday_dates if start_date <= d <= end_date)
-
     # Working days per month
     working_days_per_month = {
         f"{y}-{m:02d}": get_working_days_in_month(y, m) for y, m in months
@@ -83,6 +81,19 @@ async def get_project_timeline(
         for a in a_result.scalars().all():
             assignments_by_project[a.project_id].append(a)
 
+    shared = {
+        "holidays": [
+            {"date": d.isoformat(), "name": name}
+            for d, name in named_holidays(start_date, end_date)
+        ],
+        "working_days_per_month": working_days_per_month,
+    }
+    if format == "columnar":
+        columns = ProjectTimelineColumns(start_date)
+        for proj in projects:
+            columns.add_project(proj, assignments_by_project[proj.id])
+        return FastJSONResponse(columns.payload(**shared))
+
     # Build project data
     project_data = []
     for proj in projects:
@@ -90,6 +101,7 @@ async def get_project_timeline(
         for a in assignments_by_project[proj.id]:
             first_month_date = max(a.start_date, start_date)
             emp = a.employee
+            calendar = emp.holiday_calendar if emp else DEFAULT_CALENDAR
             # A percentage is a share of the assignee's own time, so the same
             # 50% is fewer hours for a part-timer. Placeholders have no
             # assignee and fall back to the full-time norm.
@@ -101,8 +113,9 @@ async def get_project_timeline(
                 start_date=a.start_date,
                 end_date=a.end_date,
                 base_daily_hours=assignment_base_daily_hours(
-                    emp.capacities if emp else None, first_month_date
+                    emp.capacities if emp else None, first_month_date, calendar
                 ),
+                calendar=calendar,
             )
             assignment_list.append(
                 {
@@ -128,11 +141,5 @@ async def get_project_timeline(
             }
         )
 
-    return {
-        "projects": project_data,
-        "holidays": [
-            {"date": d.isoformat(), "name": get_holiday_name(d)}
-            for d in holidays_in_range
-        ],
-        "working_days_per_month": working_days_per_month,
-    }
+    payload = {"projects": project_data, **shared}
+    return FastJSONResponse(payload)
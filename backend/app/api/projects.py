@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import date
+from itertools import accumulate
 from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -8,18 +10,103 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user, get_db, require_admin, require_editor
+from app.core.events import ASSIGNMENT_UPDATED, PROJECT_CHANGED, PlanEvent, broker
+from app.core.responses import FastJSONResponse
 from app.models.assignment import Assignment
 from app.models.project import Project
 from app.models.user import User
-from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.schemas.lifecycle import WindDownPreviewResponse
+from app.schemas.project import (
+    ProjectCreate,
+    ProjectRescheduleResponse,
+    ProjectResponse,
+    ProjectShiftRequest,
+    ProjectStretchRequest,
+    ProjectUpdate,
+)
+from app.services.burn_service import BurnReport, load_burn
 from app.services.lifecycle_service import (
     count_assignments,
     delete_assignments,
+    preview_wind_down,
     wind_down_assignments,
 )
+from app.services.reschedule_service import (
+    apply_date_maps,
+    load_project_dates,
+    shift_date_map,
+    stretch_date_maps,
+)
+from app.utils.hour_units import round_units
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+# Burn reports are computed in one request; keep the range bounded.
+MAX_BURN_DAYS = 3 * 366
+
+
+def _check_burn_range(start_date: date, end_date: date) -> None:
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+    if (end_date - start_date).days > MAX_BURN_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 3 lata")
+
+
+async def _project_event(db: AsyncSession, type: str, project_id: int) -> PlanEvent:
+    """`type` for every assignment of the project.
+
+    Read before the change: deleting the project's assignments also loses
+    who was on them.
+    """
+    result = await db.execute(
+        select(Assignment.employee_id)
+        .where(Assignment.project_id == project_id, Assignment.employee_id.is_not(None))
+        .distinct()
+    )
+    return PlanEvent(
+        type,
+        employee_ids=tuple(sorted(result.scalars())),
+        project_ids=(project_id,),
+        assignment_ids=None,
+    )
+
+
+def _hours(units: list[int]) -> list[float]:
+    # Most of an assignment's months are empty.
+    return [round_units(u, 2) if u else 0.0 for u in units]
+
+
+def _serialize_burn(
+    report: BurnReport, project: Project, include_assignments: bool = True
+) -> dict:
+    """A project's burn: its planned hours per month and per assignment."""
+    units = report.project_units(project.id)
+    result = {
+        "id": project.id,
+        "name": project.name,
+        "color": project.color,
+        "hours": _hours(units),
+        "cumulative_hours": _hours(list(accumulate(units))),
+        "total_hours": round_units(sum(units), 2),
+    }
+    if include_assignments:
+        result["assignments"] = [
+            {
+                "id": burn.assignment.id,
+                "employee_id": burn.assignment.employee_id,
+                "employee_name": burn.employee_name,
+                "start_date": burn.assignment.start_date.isoformat(),
+                "end_date": burn.assignment.end_date.isoformat(),
+                "allocation_type": burn.assignment.allocation_type.value,
+                "allocation_value": float(burn.assignment.allocation_value),
+                "is_tentative": burn.assignment.is_tentative,
+                "hours": _hours(burn.units),
+                "total_hours": round_units(sum(burn.units), 2),
+            }
+            for burn in report.assignments.get(project.id, [])
+        ]
+    return result
+
 
 @router.get("", response_model=list[ProjectResponse])
 async def list_projects(
@@ -64,6 +151,49 @@ async def create_project(
     return project
 
 
+@router.get("/burn", response_class=FastJSONResponse)
+async def get_projects_burn(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    project_status: Literal["active", "archived", "all"] = Query("active", alias="status"),
+    include_assignments: bool = Query(True),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    """Planned hours per month for every project, as in `/{project_id}/burn`.
+
+    Defaults to the current calendar year. All projects share one `months`
+    list; a project with nothing planned in the range is all zeros. The
+    assignments of every project are evaluated in one pass, so this costs
+    about as much as the projects' assignments, not one request per project.
+    Without `include_assignments` only the per-project figures are returned.
+    """
+    start_date = start_date or date((end_date or date.today()).year, 1, 1)
+    end_date = end_date or date(start_date.year, 12, 31)
+    _check_burn_range(start_date, end_date)
+
+    query = select(Project)
+    if project_status == "active":
+        query = query.where(Project.is_archived == False)
+    elif project_status == "archived":
+        query = query.where(Project.is_archived == True)
+    projects = (await db.execute(query.order_by(Project.name))).scalars().all()
+
+    report = await load_burn(
+        db, query.with_only_columns(Project.id).order_by(None), start_date, end_date
+    )
+    return FastJSONResponse(
+        {
+            "start_date": report.start_date.isoformat(),
+            "end_date": report.end_date.isoformat(),
+            "months": report.months,
+            "projects": [
+                _serialize_burn(report, p, include_assignments) for p in projects
+            ],
+        }
+    )
+
+
 @router.patch("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: int,
@@ -130,12 +260,83 @@ async def delete_project(
             ),
         }
 
+    event = await _project_event(db, PROJECT_CHANGED, project_id)
     deleted_assignments = await delete_assignments(db, assignment_filter)
     await db.delete(project)
     await db.commit()
+    await broker.publish(event)
     return {"deleted": True, "deleted_assignments": deleted_assignments}
 
 
+@router.get("/{project_id}/burn", response_class=FastJSONResponse)
+async def get_project_burn(
+    project_id: int,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    """Planned hours per month for the project and each of its assignments.
+
+    Hours are what the timeline plans: a `total_hours` budget spread over its
+    working days, `monthly_hours` per month, a percentage of the assignee's
+    day; placeholders included. The range is widened to whole months and
+    defaults to the months the project's assignments span, at most 3 years
+    either way. `hours` is per month and `cumulative_hours` their running
+    total, the burn curve.
+    """
+    project = await db.get(Project, project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
+
+    if start_date is None or end_date is None:
+        first, last = (
+            await db.execute(
+                select(
+                    sa_func.min(Assignment.start_date), sa_func.max(Assignment.end_date)
+                ).where(Assignment.project_id == project_id)
+            )
+        ).one()
+        if start_date is None:
+            start_date = first or end_date or date.today()
+            if end_date is not None:
+                start_date = min(start_date, end_date)
+        if end_date is None:
+            end_date = max(last or start_date, start_date)
+    # Defaults included: a long-running placeholder can span decades.
+    _check_burn_range(start_date, end_date)
+
+    report = await load_burn(
+        db, select(Project.id).where(Project.id == project_id), start_date, end_date
+    )
+    return FastJSONResponse(
+        {
+            "start_date": report.start_date.isoformat(),
+            "end_date": report.end_date.isoformat(),
+            "months": report.months,
+            **_serialize_burn(report, project),
+        }
+    )
+
+
+@router.get("/{project_id}/archive/preview", response_model=WindDownPreviewResponse)
+async def preview_archive_project(
+    project_id: int,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(require_editor),
+):
+    """Count the assignments archiving the project would keep, trim and delete.
+
+    Same rules as the archive itself, evaluated with one aggregate query;
+    nothing is changed.
+    """
+    result = await db.execute(select(Project.id).where(Project.id == project_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
+
+    return await preview_wind_down(db, Assignment.project_id == project_id)
+
+
 @router.post("/{project_id}/archive", response_model=ProjectResponse)
 async def archive_project(
     project_id: int,
@@ -154,9 +355,11 @@ async def archive_project(
         raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
 
     project.is_archived = True
+    event = await _project_event(db, PROJECT_CHANGED, project_id)
     await wind_down_assignments(db, Assignment.project_id == project_id)
 
     await db.commit()
+    await broker.publish(event)
     await db.refresh(project)
     return project
 
@@ -181,3 +384,83 @@ async def unarchive_project(
     await db.commit()
     await db.refresh(project)
     return project
+
+
+async def _get_reschedulable_project(db: AsyncSession, project_id: int) -> Project:
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one_or_none()
+    if not project:
+        raise HTTPException(status_code=404, detail="Nie znaleziono projektu")
+    if project.is_archived:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Nie można przeplanować zarchiwizowanego projektu",
+        )
+    return project
+
+
+@router.post("/{project_id}/shift", response_model=ProjectRescheduleResponse)
+async def shift_project(
+    project_id: int,
+    body: ProjectShiftRequest,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(require_editor),
+):
+    """Move every assignment of the project by N working days.
+
+    Start and end move by the same number of working days, so assignment
+    lengths (in working days) and allocations are unchanged. Applied as one
+    UPDATE; see `reschedule_service`.
+    """
+    await _get_reschedulable_project(db, project_id)
+    dates = await load_project_dates(db, project_id)
+    if dates is None:
+        return {"updated_assignments": 0}
+
+    start_map = shift_date_map(dates.starts, body.working_days)
+    end_map = shift_date_map(dates.ends, body.working_days)
+    event = await _project_event(db, ASSIGNMENT_UPDATED, project_id)
+    updated = await apply_date_maps(db, project_id, start_map, end_map)
+    await db.commit()
+    await broker.publish(event)
+    return {
+        "updated_assignments": updated,
+        "start_date": min(start_map.values()),
+        "end_date": max(end_map.values()),
+    }
+
+
+@router.post("/{project_id}/stretch", response_model=ProjectRescheduleResponse)
+async def stretch_project(
+    project_id: int,
+    body: ProjectStretchRequest,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(require_editor),
+):
+    """Rescale the project onto a new window, proportionally in working days.
+
+    The project window is its earliest assignment start to its latest end.
+    Every assignment keeps its relative position and share of the window;
+    `total_hours` budgets keep their total. Applied as one UPDATE; see
+    `reschedule_service`.
+    """
+    await _get_reschedulable_project(db, project_id)
+    dates = await load_project_dates(db, project_id)
+    if dates is None:
+        return {"updated_assignments": 0}
+
+    try:
+        start_map, end_map = stretch_date_maps(dates, body.start_date, body.end_date)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail="Nowy zakres musi zawierać co najmniej 1 dzień roboczy"
+        )
+    event = await _project_event(db, ASSIGNMENT_UPDATED, project_id)
+    updated = await apply_date_maps(db, project_id, start_map, end_map)
+    await db.commit()
+    await broker.publish(event)
+    return {
+        "updated_assignments": updated,
+        "start_date": min(start_map.values()),
+        "end_date": max(end_map.values()),
+    }
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.user import User
+from app.schemas.scenario import ScenarioCreate, ScenarioEditsRequest, ScenarioResponse
+from app.services.scenario_service import (
+    Scenario,
+    ScenarioEditError,
+    load_scenario,
+    scenario_store,
+)
+
+router = APIRouter(prefix="/api/scenarios", tags=["scenarios"])
+
+# Scenarios hold a copy of the plan in memory; keep the window bounded.
+MAX_SCENARIO_DAYS = 3 * 366
+
+
+def _edit_error_response(exc: ScenarioEditError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            "detail": exc.detail,
+            "index": exc.index,
+            "status_code": exc.status_code,
+        },
+    )
+
+
+def _scenario_response(scenario: Scenario) -> dict:
+    recomputed = scenario.evaluate()
+    return {
+        "id": scenario.id,
+        "start_date": scenario.start_date,
+        "end_date": scenario.end_date,
+        "granularity": scenario.granularity,
+        "edit_count": scenario.edit_count,
+        "recomputed": recomputed,
+        **scenario.diff(),
+    }
+
+
+def _get_scenario(scenario_id: str, user: User) -> Scenario:
+    scenario = scenario_store.get(scenario_id, user.id)
+    if scenario is None:
+        raise HTTPException(status_code=404, detail="Nie znaleziono scenariusza")
+    return scenario
+
+
+@router.post(
+    "",
+    response_model=ScenarioResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={400: {"description": "Edycja niemożliwa do zastosowania"}},
+)
+async def create_scenario(
+    body: ScenarioCreate,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Load the plan for a date range into a private what-if scenario.
+
+    Nothing is ever written to the database. The plan is read once; `edits`
+    (and any added later) are applied to the in-memory copy, and the
+    response lists the occupancy of every employee whose periods changed,
+    next to the baseline. Only the creator can see the scenario; it expires
+    after two hours without use.
+
+    An edit the real endpoint would reject makes the whole request fail with
+    400, carrying the failing edit's `index` and its own `status_code`.
+    """
+    if (body.end_date - body.start_date).days > MAX_SCENARIO_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 3 lata")
+    scenario = await load_scenario(
+        db, user.id, body.start_date, body.end_date, body.granularity
+    )
+    try:
+        scenario.apply(body.edits)
+    except ScenarioEditError as exc:
+        return _edit_error_response(exc)
+    scenario_store.add(scenario)
+    return _scenario_response(scenario)
+
+
+@router.get("/{scenario_id}", response_model=ScenarioResponse)
+async def get_scenario(scenario_id: str, user: User = Depends(get_current_user)):
+    """The scenario's current diff against the baseline."""
+    return _scenario_response(_get_scenario(scenario_id, user))
+
+
+@router.post(
+    "/{scenario_id}/edits",
+    response_model=ScenarioResponse,
+    responses={400: {"description": "Edycja niemożliwa do zastosowania"}},
+)
+async def add_scenario_edits(
+    scenario_id: str,
+    body: ScenarioEditsRequest,
+    user: User = Depends(get_current_user),
+):
+    """Apply more edits to a scenario, all or nothing.
+
+    Only employees these edits touch are recomputed (`recomputed` in the
+    response); everyone else's figures are reused.
+    """
+    scenario = _get_scenario(scenario_id, user)
+    try:
+        scenario.apply(body.edits)
+    except ScenarioEditError as exc:
+        return _edit_error_response(exc)
+    return _scenario_response(scenario)
+
+
+@router.delete("/{scenario_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_scenario(scenario_id: str, user: User = Depends(get_current_user)):
+    """Discard a scenario."""
+    if not scenario_store.remove(scenario_id, user.id):
+        raise HTTPException(status_code=404, detail="Nie znaleziono scenariusza")
@@ -8,14 +8,14 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_db, require_admin
+from app.core.events import VACATIONS_SYNCED, PlanEvent, broker
 from app.models.app_settings import AppSettings
 from app.models.user import User
 from app.models.vacation import Vacation
 from app.services.vacation_sync_service import (
+    enqueue_vacation_sync,
     get_calamari_config as get_calamari_config_from_db,
-    get_default_sync_range,
     get_last_sync_timestamp,
-    sync_vacations,
 )
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
@@ -71,13 +71,9 @@ async def update_calamari_config(
 
     await db.commit()
 
-    # Trigger immediate sync
-    start, end = get_default_sync_range()
-    try:
-        count = await sync_vacations(db, start, end)
-        return {"status": "ok", "message": f"Configuration saved. Synced {count} vacations."}
-    except Exception:
-        return {"status": "ok", "message": "Configuration saved. Initial sync will run shortly."}
+    # Sync right away, in the background
+    await enqueue_vacation_sync(db)
+    return {"status": "ok", "message": "Configuration saved. Vacation sync started."}
 
 
 @router.delete("/calamari")
@@ -93,4 +89,5 @@ async def delete_calamari_config(
     )
     await db.execute(delete(Vacation))
     await db.commit()
+    await broker.publish(PlanEvent(VACATIONS_SYNCED, employee_ids=None))
     return {"status": "ok", "message": "Calamari configuration removed and vacation cache cleared."}
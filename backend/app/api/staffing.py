@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.employee import Technology, employee_technologies
+from app.models.user import User
+from app.services.employee_filter_service import (
+    active_employee_ids,
+    load_named_employees,
+)
+from app.services.occupancy_service import (
+    HUNDRED,
+    CalendarDays,
+    free_capacity,
+    load_occupancy_inputs,
+)
+from app.utils.holiday_calendars import DEFAULT_CALENDAR
+
+router = APIRouter(prefix="/api/staffing", tags=["staffing"])
+
+# Staffing windows are computed in one request; keep them bounded.
+MAX_WINDOW_DAYS = 3 * 366
+
+
+@router.get("/available")
+async def get_available_employees(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    hours_per_day: Optional[Decimal] = Query(None, gt=0, le=24),
+    team_ids: Optional[str] = Query(None),
+    technology_ids: Optional[str] = Query(None),
+    include_tentative: bool = Query(True),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    """Active employees with free capacity in a window, most free first.
+
+    Free hours are each working day's available minus booked hours (never
+    below zero), by the timeline's rules: part-time capacity and vacations
+    reduce what is available, and tentative assignments count as booked
+    unless `include_tentative` is false. With `hours_per_day`, `fit_days`
+    counts the days with at least that much free, candidates without any such
+    day are left out, and ranking is by `fit_days` first.
+
+    Team and technology filters run in SQL (an employee needs any one of the
+    technologies), and each candidate's load is taken as constant stretches
+    between assignment, vacation and capacity changes (see
+    `load_stretches`) rather than evaluated day by day.
+    """
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+    if (end_date - start_date).days > MAX_WINDOW_DAYS:
+        raise HTTPException(status_code=400, detail="Zakres może obejmować najwyżej 3 lata")
+
+    emp_query = active_employee_ids(team_ids, technology_ids)
+    employees = await load_named_employees(db, emp_query)
+    inputs = await load_occupancy_inputs(
+        db, emp_query, start_date, end_date, include_tentative=include_tentative
+    )
+    days = CalendarDays(start_date, end_date)
+
+    profiles: dict = {}
+    candidates = []
+    for emp in employees:
+        calendar = inputs.calendar(emp.id)
+        free = free_capacity(
+            inputs.assignments.get(emp.id, []),
+            inputs.vacations.get(emp.id, []),
+            days[calendar],
+            inputs.capacities.get(emp.id, []),
+            profiles,
+            hours_per_day,
+            calendar,
+        )
+        if free.free_hours <= 0 or (hours_per_day is not None and not free.fit_days):
+            continue
+        candidates.append((emp, free))
+    # Stable sort: ties keep the name order from the query.
+    candidates.sort(key=lambda c: (-c[1].fit_days if hours_per_day else 0, -c[1].free_hours))
+    candidates = candidates[:limit]
+
+    technologies: dict[int, list[str]] = {emp.id: [] for emp, _ in candidates}
+    if technologies:
+        for emp_id, name in await db.execute(
+            select(employee_technologies.c.employee_id, Technology.name)
+            .join(Technology, Technology.id == employee_technologies.c.technology_id)
+            .where(employee_technologies.c.employee_id.in_(technologies))
+            .order_by(Technology.name)
+        ):
+            technologies[emp_id].append(name)
+
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "working_days": len(days[DEFAULT_CALENDAR]),
+        "hours_per_day": float(hours_per_day) if hours_per_day is not None else None,
+        "include_tentative": include_tentative,
+        "employees": [
+            {
+                "id": emp.id,
+                "name": f"{emp.last_name} {emp.first_name}",
+                "team": emp.team,
+                "technologies": technologies[emp.id],
+                "available_hours": float(round(free.available_hours, 1)),
+                "booked_hours": float(round(free.booked_hours, 1)),
+                "free_hours": float(round(free.free_hours, 1)),
+                "free_percentage": (
+                    float(round(free.free_hours / free.available_hours * HUNDRED, 1))
+                    if free.available_hours
+                    else 0.0
+                ),
+                "fit_days": free.fit_days,
+            }
+            for emp, free in candidates
+        ],
+    }
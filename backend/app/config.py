@@ -10,6 +10,11 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
     CORS_ORIGINS: str = "http://localhost:5173"
     ENVIRONMENT: str = "development"
+    # Login attempts allowed per client IP per minute.
+    LOGIN_RATE_LIMIT_ATTEMPTS: int = 10
+    # Overrides https://<subdomain>.calamari.io, e.g. to point at a local
+    # stand-in for load tests. Empty means the real service.
+    CALAMARI_BASE_URL: str = ""
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
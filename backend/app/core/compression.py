@@ -0,0 +1,137 @@
+"""Response compression: brotli when the client accepts it, gzip otherwise.
+
+Timeline and export payloads are highly repetitive JSON and CSV (the same
+keys and project names on every row), so they shrink several times over on
+the wire. Bodies below `minimum_size` go out as they are — compressing them
+costs more than it saves — and so do already-compressed media types.
+
+Built on Starlette's `GZipMiddleware` responders, which handle streaming
+bodies, `Vary` and `Content-Length`; this only adds the brotli responder and
+picks the encoding.
+"""
+
+from __future__ import annotations
+
+import anyio.to_thread
+import brotli
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import (
+    DEFAULT_EXCLUDED_CONTENT_TYPES,
+    GZipMiddleware,
+    GZipResponder,
+    IdentityResponder,
+)
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# XLSX files are zip archives already.
+EXCLUDED_CONTENT_TYPES = DEFAULT_EXCLUDED_CONTENT_TYPES + (XLSX_MEDIA_TYPE,)
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Codings listed in an Accept-Encoding header, minus those refused with q=0."""
+    result = set()
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                if float(value) <= 0:
+                    continue
+            except ValueError:
+                continue
+        result.add(coding)
+    return result
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        quality: int,
+        *,
+        thread_minimum_size: int,
+        exclude_content_types: tuple[str, ...],
+    ) -> None:
+        super().__init__(app, minimum_size, exclude_content_types=exclude_content_types)
+        self.quality = quality
+        self.thread_minimum_size = thread_minimum_size
+        self._compressor: brotli.Compressor | None = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if len(body) >= self.thread_minimum_size:
+            # Keep large bodies off the event loop, as the gzip responder does.
+            return await anyio.to_thread.run_sync(self._compress_body, body, more_body)
+        return self._compress_body(body, more_body)
+
+    def _compress_body(self, body: bytes, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(quality=self.quality)
+        data = self._compressor.process(body)
+        if more_body:
+            return data + self._compressor.flush()
+        return data + self._compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """`GZipMiddleware` that prefers brotli when the client accepts `br`.
+
+    The levels are tuned for responses compressed on every request rather than
+    once: brotli quality 4 and gzip level 6 get most of the size reduction of
+    the maximum settings at a fraction of the CPU time.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        compresslevel: int = 6,
+        brotli_quality: int = 4,
+        thread_minimum_size: int = 128 * 1024,
+        *,
+        exclude_content_types: tuple[str, ...] = EXCLUDED_CONTENT_TYPES,
+    ) -> None:
+        super().__init__(
+            app,
+            minimum_size,
+            compresslevel,
+            thread_minimum_size,
+            exclude_content_types=exclude_content_types,
+        )
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        responder: ASGIApp
+        if "br" in accepted:
+            responder = BrotliResponder(
+                self.app,
+                self.minimum_size,
+                self.brotli_quality,
+                thread_minimum_size=self.thread_minimum_size,
+                exclude_content_types=self.exclude_content_types,
+            )
+        elif "gzip" in accepted:
+            responder = GZipResponder(
+                self.app,
+                self.minimum_size,
+                self.compresslevel,
+                thread_minimum_size=self.thread_minimum_size,
+                exclude_content_types=self.exclude_content_types,
+            )
+        else:
+            responder = IdentityResponder(
+                self.app, self.minimum_size, exclude_content_types=self.exclude_content_types
+            )
+        await responder(scope, receive, send)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +23,28 @@ async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
 ) -> User:
+    return await _authenticate(token, db)
+
+
+async def get_stream_user(
+    request: Request,
+    access_token: Optional[str] = Query(None),
+) -> User:
+    """`get_current_user` for long-lived streams.
+
+    Browsers' EventSource cannot set headers, so the token may also come as
+    the `access_token` query parameter. The user is looked up in a session of
+    its own that is closed right away, so an open stream does not hold on to
+    a pooled connection.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        token = access_token or ""
+    async with async_session_factory() as db:
+        return await _authenticate(token, db)
+
+
+async def _authenticate(token: str, db: AsyncSession) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
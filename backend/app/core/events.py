@@ -0,0 +1,214 @@
+"""Plan change notifications for the `/api/events` stream.
+
+Write endpoints publish a `PlanEvent` once their change is committed: what
+happened and which employees, projects and assignments it touched, so that
+clients refetch those rows instead of polling the whole timeline.
+
+Every worker process keeps its own subscribers. With Postgres the workers
+are bridged through LISTEN/NOTIFY: an event is published as a NOTIFY on one
+channel, and each worker (the publishing one included) fans out what it
+hears to its subscribers. Without the bridge — SQLite, or while the listener
+connection is down — events only reach subscribers of the publishing worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Iterable, Iterator
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "plan_events"
+
+ASSIGNMENT_CREATED = "assignment.created"
+ASSIGNMENT_UPDATED = "assignment.updated"
+ASSIGNMENT_SPLIT = "assignment.split"
+ASSIGNMENT_DELETED = "assignment.deleted"
+EMPLOYEE_CHANGED = "employee.changed"
+PROJECT_CHANGED = "project.changed"
+CAPACITY_CHANGED = "capacity.changed"
+VACATIONS_SYNCED = "vacations.synced"
+# Sent to a subscriber that may have missed events: refetch everything.
+RESYNC = "resync"
+
+# Events a subscriber may fall behind by before it is sent RESYNC instead.
+QUEUE_SIZE = 256
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES = 7900
+RECONNECT_SECONDS = 5
+HEALTH_CHECK_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class PlanEvent:
+    """One committed change.
+
+    Id lists name the rows to refetch; None means any row may have changed.
+    An employee-level event (archive, capacity) leaves `project_ids` empty:
+    it affects the employee on every project they work on. A project-wide
+    one (shift, archive) names the project and its assignees, with None for
+    the assignments: any of the project's may have changed.
+    """
+
+    type: str
+    employee_ids: tuple[int, ...] | None = ()
+    project_ids: tuple[int, ...] | None = ()
+    assignment_ids: tuple[int, ...] | None = ()
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "type": self.type,
+                "employee_ids": _listed(self.employee_ids),
+                "project_ids": _listed(self.project_ids),
+                "assignment_ids": _listed(self.assignment_ids),
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, payload: str) -> PlanEvent:
+        data = json.loads(payload)
+        return cls(
+            type=data["type"],
+            employee_ids=_tupled(data["employee_ids"]),
+            project_ids=_tupled(data["project_ids"]),
+            assignment_ids=_tupled(data["assignment_ids"]),
+        )
+
+
+def _listed(ids: tuple[int, ...] | None) -> list[int] | None:
+    return None if ids is None else list(ids)
+
+
+def _tupled(ids: list[int] | None) -> tuple[int, ...] | None:
+    return None if ids is None else tuple(ids)
+
+
+def assignment_event(
+    type: str,
+    assignments: Iterable,
+    employee_ids: Iterable[int | None] = (),
+    project_ids: Iterable[int] = (),
+) -> PlanEvent:
+    """An event for `assignments`, plus rows they were moved away from.
+
+    Placeholders have no employee; they only name their project.
+    """
+    assignments = list(assignments)
+    employees = {a.employee_id for a in assignments} | set(employee_ids)
+    projects = {a.project_id for a in assignments} | set(project_ids)
+    employees.discard(None)
+    return PlanEvent(
+        type=type,
+        employee_ids=tuple(sorted(employees)),
+        project_ids=tuple(sorted(projects)),
+        assignment_ids=tuple(sorted(a.id for a in assignments)),
+    )
+
+
+class EventBroker:
+    """Fans published events out to this process's subscribers."""
+
+    def __init__(self) -> None:
+        self._subscribers: set[asyncio.Queue[PlanEvent]] = set()
+        self._connection = None
+        self._notify_lock = asyncio.Lock()
+
+    @contextmanager
+    def subscription(self) -> Iterator[asyncio.Queue[PlanEvent]]:
+        queue: asyncio.Queue[PlanEvent] = asyncio.Queue(QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def deliver(self, event: PlanEvent) -> None:
+        """Hand `event` to every subscriber of this process, without waiting.
+
+        A subscriber whose queue is full is not waited for: its backlog is
+        replaced by a single RESYNC.
+        """
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(PlanEvent(RESYNC, None, None, None))
+
+    async def publish(self, event: PlanEvent) -> None:
+        """Send `event` to subscribers of every worker; call after committing."""
+        if self._connection is None:
+            self.deliver(event)
+            return
+        payload = event.to_json()
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            payload = replace(
+                event, employee_ids=None, project_ids=None, assignment_ids=None
+            ).to_json()
+        try:
+            async with self._notify_lock:
+                await self._connection.execute("SELECT pg_notify($1, $2)", CHANNEL, payload)
+        except Exception:
+            # The change is committed either way; at least tell this worker.
+            logger.exception("Could not publish %s through Postgres", event.type)
+            self.deliver(event)
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        try:
+            event = PlanEvent.from_json(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed %s notification: %r", channel, payload)
+            return
+        self.deliver(event)
+
+    async def listen(self, dsn: str, stop_event: asyncio.Event) -> None:
+        """Background task: bridge this worker to the others until stopped.
+
+        Reconnects after RECONNECT_SECONDS if the connection is lost; since
+        events may have gone by meanwhile, subscribers are then sent RESYNC.
+        """
+        connected_before = False
+        while not stop_event.is_set():
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(CHANNEL, self._on_notification)
+                self._connection = connection
+                logger.info("Listening for plan events on %s", CHANNEL)
+                if connected_before:
+                    self.deliver(PlanEvent(RESYNC, None, None, None))
+                connected_before = True
+                while not stop_event.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            stop_event.wait(), timeout=HEALTH_CHECK_SECONDS
+                        )
+                    except asyncio.TimeoutError:
+                        # A silently dropped connection only shows on use.
+                        async with self._notify_lock:
+                            await connection.execute("SELECT 1")
+            except Exception:
+                logger.exception("Plan event listener failed")
+            finally:
+                self._connection = None
+                if connection is not None:
+                    # Nothing to flush on a listening connection, and this
+                    # must not await while the task is being cancelled.
+                    connection.terminate()
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=RECONNECT_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+
+broker = EventBroker()
@@ -11,8 +11,10 @@ from threading import Lock
 
 from fastapi import HTTPException, Request, status
 
+from app.config import settings
+
 # Max login attempts per IP within the time window
-MAX_ATTEMPTS = 10
+MAX_ATTEMPTS = settings.LOGIN_RATE_LIMIT_ATTEMPTS
 WINDOW_SECONDS = 60
 
 
@@ -0,0 +1,49 @@
+"""JSON response class for the large read endpoints.
+
+Timelines are tens of thousands of small dicts. Returned as plain dicts,
+FastAPI first walks them with `jsonable_encoder` and Starlette then encodes
+the copy with the stdlib `json` module; together that is a large share of the
+request time. Handlers that return a `FastJSONResponse` directly skip the walk,
+and orjson serializes the payload (dates, Decimals included) in one pass.
+
+`etag_matches` answers conditional requests for the endpoints and assets
+that send an ETag.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """`JSONResponse` rendered with orjson.
+
+    Output matches Starlette's compact UTF-8 JSON. Integer dict keys are
+    written as strings, as the stdlib encoder does.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def etag_matches(if_none_match: str, digest: str) -> bool:
+    """Whether any tag in If-None-Match names `digest`.
+
+    Weak (`W/"..."`) tags match too, as If-None-Match compares weakly, and so
+    does a `"<digest>-<coding>"` tag for an encoded variant of the same body.
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag == "*" or tag.partition("-")[0] == digest:
+            return True
+    return False
@@ -0,0 +1,145 @@
+"""The built frontend, held in memory and served with cache validators.
+
+`frontend/dist` is immutable for the life of a worker, so it is read once at
+startup instead of resolving and stat-ing a path per request. Each file is
+kept with its ETag and, for text types, gzip and brotli variants compressed
+at the highest level once — the per-request middleware never has to touch
+these bodies.
+
+Vite puts content-hashed bundles under `assets/`; a changed file gets a new
+name, so those are cached by browsers for a year without revalidation.
+Everything else (`index.html`, favicons) is revalidated on each use and
+answered with 304 while the ETag still matches.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+
+import brotli
+from fastapi import Request, Response
+
+from app.core.compression import accepted_encodings
+from app.core.responses import etag_matches
+
+HASHED_PREFIX = "assets/"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+    "text/javascript",
+}
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    body: bytes
+    media_type: str
+    digest: str
+    cache_control: str
+    # Only variants noticeably smaller than `body` are kept.
+    encoded: dict[str, bytes]
+
+    def etag(self, coding: str | None) -> str:
+        # Each encoding is its own representation, so it gets its own tag.
+        return f'"{self.digest}-{coding}"' if coding else f'"{self.digest}"'
+
+
+def _media_type(path: Path) -> str:
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/"):
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+def _compressible(media_type: str) -> bool:
+    base = media_type.partition(";")[0]
+    return base.startswith("text/") or base in COMPRESSIBLE_TYPES
+
+
+def load_asset(path: Path, relative: str) -> StaticAsset:
+    body = path.read_bytes()
+    media_type = _media_type(path)
+    encoded = {}
+    if _compressible(media_type):
+        for coding, data in (
+            ("br", brotli.compress(body, quality=11)),
+            ("gzip", gzip.compress(body, compresslevel=9, mtime=0)),
+        ):
+            if len(data) < len(body) * 0.9:
+                encoded[coding] = data
+    return StaticAsset(
+        body=body,
+        media_type=media_type,
+        digest=hashlib.sha256(body).hexdigest()[:32],
+        cache_control=(
+            IMMUTABLE_CACHE_CONTROL
+            if relative.startswith(HASHED_PREFIX)
+            else REVALIDATE_CACHE_CONTROL
+        ),
+        encoded=encoded,
+    )
+
+
+class SpaAssets:
+    """Every file of a frontend build, keyed by its path relative to the root."""
+
+    def __init__(self, assets: dict[str, StaticAsset]) -> None:
+        self._assets = assets
+
+    @classmethod
+    def load(cls, root: Path) -> "SpaAssets":
+        assets = {}
+        for path in sorted(root.rglob("*")):
+            if path.is_file():
+                relative = path.relative_to(root).as_posix()
+                assets[relative] = load_asset(path, relative)
+        return cls(assets)
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def get(self, path: str) -> StaticAsset | None:
+        """The file at `path`, or `index.html` for client-side routes.
+
+        Missing files under `assets/` are real 404s, not routes.
+        """
+        asset = self._assets.get(path)
+        if asset is None and not path.startswith(HASHED_PREFIX):
+            asset = self._assets.get("index.html")
+        return asset
+
+    def response(self, path: str, request: Request) -> Response:
+        asset = self.get(path.lstrip("/"))
+        if asset is None:
+            return Response(status_code=404)
+
+        accepted = accepted_encodings(request.headers.get("accept-encoding", ""))
+        coding = next(
+            (c for c in ("br", "gzip") if c in accepted and c in asset.encoded), None
+        )
+        headers = {
+            "Cache-Control": asset.cache_control,
+            "ETag": asset.etag(coding),
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match, asset.digest):
+            return Response(status_code=304, headers=headers)
+
+        if coding is None:
+            return Response(asset.body, media_type=asset.media_type, headers=headers)
+        headers["Content-Encoding"] = coding
+        return Response(
+            asset.encoded[coding], media_type=asset.media_type, headers=headers
+        )
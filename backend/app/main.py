@@ -3,23 +3,33 @@ import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
 
 from app.api.auth import router as auth_router
 from app.api.assignments import router as assignments_router
 from app.api.calendar import router as calendar_router
+from app.api.capacity import router as capacity_router
 from app.api.employees import router as employees_router
+from app.api.events import router as events_router
+from app.api.export import router as export_router
+from app.api.imports import router as imports_router
+from app.api.jobs import router as jobs_router
+from app.api.occupancy import router as occupancy_router
 from app.api.project_timeline import router as project_timeline_router
 from app.api.projects import router as projects_router
+from app.api.scenarios import router as scenarios_router
 from app.api.settings import router as settings_router
+from app.api.staffing import router as staffing_router
 from app.api.teams import router as teams_router
 from app.api.technologies import router as technologies_router
 from app.api.users import router as users_router
 from app.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.events import broker
+from app.core.spa import SpaAssets
 from app.database import engine
+from app.services.job_service import run_jobs
 from app.services.vacation_sync_service import periodic_vacation_sync
 
 logger = logging.getLogger(__name__)
@@ -27,19 +37,27 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Start background vacation sync
+    # Start the job worker and the periodic vacation sync, which queues jobs
     stop_event = asyncio.Event()
-    sync_task = asyncio.create_task(periodic_vacation_sync(stop_event))
+    tasks = [
+        asyncio.create_task(run_jobs(stop_event)),
+        asyncio.create_task(periodic_vacation_sync(stop_event)),
+    ]
+    # Share plan events with the other workers through Postgres
+    if engine.dialect.name == "postgresql":
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        tasks.append(asyncio.create_task(broker.listen(dsn, stop_event)))
 
     yield
 
     # Graceful shutdown
     stop_event.set()
-    sync_task.cancel()
-    try:
-        await sync_task
-    except asyncio.CancelledError:
-        pass
+    for task in tasks:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
     await engine.dispose()
 
 
@@ -53,6 +71,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Added last so it wraps CORS too: compresses every response the app sends.
+app.add_middleware(CompressionMiddleware, minimum_size=1000)
 
 app.include_router(auth_router)
 app.include_router(employees_router)
@@ -61,9 +81,17 @@ app.include_router(technologies_router)
 app.include_router(projects_router)
 app.include_router(assignments_router)
 app.include_router(calendar_router)
+app.include_router(capacity_router)
+app.include_router(occupancy_router)
+app.include_router(staffing_router)
+app.include_router(scenarios_router)
+app.include_router(export_router)
+app.include_router(imports_router)
+app.include_router(jobs_router)
 app.include_router(project_timeline_router)
 app.include_router(settings_router)
 app.include_router(users_router)
+app.include_router(events_router)
 
 
 @app.get("/api/health")
@@ -75,14 +103,10 @@ async def health_check():
 FRONTEND_DIST = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
 
 if FRONTEND_DIST.is_dir():
-    app.mount("/assets", StaticFiles(directory=FRONTEND_DIST / "assets"), name="static-assets")
+    spa_assets = SpaAssets.load(FRONTEND_DIST)
+    logger.info("Loaded %d frontend files into memory", len(spa_assets))
 
     @app.get("/{full_path:path}")
-    async def serve_spa(full_path: str):
-        file_path = (FRONTEND_DIST / full_path).resolve()
-        # Prevent path traversal outside FRONTEND_DIST
-        if not str(file_path).startswith(str(FRONTEND_DIST.resolve())):
-            return FileResponse(FRONTEND_DIST / "index.html")
-        if file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(FRONTEND_DIST / "index.html")
+    async def serve_spa(full_path: str, request: Request):
+        # Looked up in memory: paths outside the build simply are not there.
+        return spa_assets.response(full_path, request)
@@ -11,6 +11,7 @@ from app.models.project import Project
 from app.models.assignment import Assignment
 from app.models.vacation import Vacation
 from app.models.app_settings import AppSettings
+from app.models.job import Job, JobStatus
 
 __all__ = [
     "User",
@@ -24,4 +25,6 @@ __all__ = [
     "Assignment",
     "Vacation",
     "AppSettings",
+    "Job",
+    "JobStatus",
 ]
@@ -76,6 +76,11 @@ class Employee(Base):
     is_archived: Mapped[bool] = mapped_column(
         Boolean, default=False, server_default="false"
     )
+    # Code of the holiday calendar (app.utils.holiday_calendars) whose public
+    # holidays are not working days for this employee.
+    holiday_calendar: Mapped[str] = mapped_column(
+        String(8), nullable=False, default="PL", server_default="PL"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
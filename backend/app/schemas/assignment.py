@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Literal, Optional, Union
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class AssignmentCreate(BaseModel):
@@ -87,3 +87,107 @@ class AssignmentResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+# Bulk operations. One request may mix creates, updates, deletes and splits;
+# they are applied in order, so a later operation sees the effect of an earlier
+# one on the same assignment. `op` selects the operation.
+
+MAX_BULK_OPERATIONS = 1000
+
+
+class BulkCreateOperation(AssignmentCreate):
+    op: Literal["create"]
+
+
+class BulkUpdateOperation(AssignmentUpdate):
+    op: Literal["update"]
+    id: int
+
+
+class BulkDeleteOperation(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+class BulkSplitOperation(BaseModel):
+    op: Literal["split"]
+    id: int
+    split_date: date
+
+
+BulkOperation = Annotated[
+    Union[
+        BulkCreateOperation,
+        BulkUpdateOperation,
+        BulkDeleteOperation,
+        BulkSplitOperation,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class BulkAssignmentRequest(BaseModel):
+    operations: list[BulkOperation] = Field(
+        min_length=1, max_length=MAX_BULK_OPERATIONS
+    )
+
+
+class BulkOperationResult(BaseModel):
+    index: int
+    op: str
+    ok: bool
+    status_code: int
+    detail: Optional[str] = None
+    # Resulting assignments: one for create/update, two for split, none for
+    # delete or a failed operation.
+    assignments: list[AssignmentResponse] = []
+
+
+class BulkAssignmentResponse(BaseModel):
+    results: list[BulkOperationResult]
+
+
+MAX_SUGGESTION_PLACEHOLDERS = 200
+
+
+class PlaceholderFillTarget(BaseModel):
+    assignment_id: int
+    # Any one of these qualifies a candidate; empty means no requirement.
+    technology_ids: list[int] = []
+    # Preferred, not required: candidates from these teams rank higher.
+    team_ids: list[int] = []
+
+
+class PlaceholderSuggestionRequest(BaseModel):
+    placeholders: list[PlaceholderFillTarget] = Field(
+        min_length=1, max_length=MAX_SUGGESTION_PLACEHOLDERS
+    )
+    suggestions_per_placeholder: int = Field(3, ge=1, le=10)
+    include_tentative: bool = True
+
+
+class PlaceholderCandidate(BaseModel):
+    employee_id: int
+    name: str
+    team: Optional[str] = None
+    matched_technologies: int
+    in_team: bool
+    hours: float
+    covered_hours: float
+    coverage: float
+    short_days: int
+
+
+class PlaceholderSuggestions(BaseModel):
+    assignment_id: int
+    project_id: int
+    project_name: str
+    start_date: date
+    end_date: date
+    # Best first; the first one is the pick the rest of the batch assumed.
+    suggestions: list[PlaceholderCandidate]
+
+
+class PlaceholderSuggestionResponse(BaseModel):
+    results: list[PlaceholderSuggestions]
@@ -8,6 +8,7 @@ from pydantic import BaseModel, field_validator, model_validator
 
 from app.schemas.team import TeamResponse
 from app.schemas.technology import TechnologyResponse
+from app.utils.holiday_calendars import DEFAULT_CALENDAR, calendar_codes
 
 CapacityTypeLiteral = Literal["percentage", "monthly_hours"]
 
@@ -63,12 +64,20 @@ class CapacityResponse(CapacityBase):
     model_config = {"from_attributes": True}
 
 
+def _check_holiday_calendar(v: Optional[str]) -> Optional[str]:
+    codes = calendar_codes()
+    if v is not None and v not in codes:
+        raise ValueError(f"unknown holiday calendar, expected one of: {', '.join(codes)}")
+    return v
+
+
 class EmployeeCreate(BaseModel):
     first_name: str
     last_name: str
     team_id: Optional[int] = None
     technology_ids: list[int] = []
     email: Optional[str] = None
+    holiday_calendar: str = DEFAULT_CALENDAR
 
     @field_validator("first_name", "last_name")
     @classmethod
@@ -77,6 +86,11 @@ class EmployeeCreate(BaseModel):
             raise ValueError("must not be blank")
         return v.strip()
 
+    @field_validator("holiday_calendar")
+    @classmethod
+    def calendar_must_exist(cls, v: str) -> str:
+        return _check_holiday_calendar(v)
+
 
 class EmployeeUpdate(BaseModel):
     first_name: Optional[str] = None
@@ -84,6 +98,7 @@ class EmployeeUpdate(BaseModel):
     team_id: Optional[int] = None
     technology_ids: Optional[list[int]] = None
     email: Optional[str] = None
+    holiday_calendar: Optional[str] = None
 
     @field_validator("first_name", "last_name")
     @classmethod
@@ -92,6 +107,11 @@ class EmployeeUpdate(BaseModel):
             raise ValueError("must not be blank")
         return v.strip() if v is not None else v
 
+    @field_validator("holiday_calendar")
+    @classmethod
+    def calendar_must_exist(cls, v: Optional[str]) -> Optional[str]:
+        return _check_holiday_calendar(v)
+
 
 class EmployeeResponse(BaseModel):
     id: int
@@ -100,6 +120,7 @@ class EmployeeResponse(BaseModel):
     team: Optional[TeamResponse] = None
     technologies: list[TechnologyResponse] = []
     email: Optional[str] = None
+    holiday_calendar: str = DEFAULT_CALENDAR
     is_archived: bool
     created_at: datetime
     capacities: list[CapacityResponse] = []
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    # Line number in the uploaded file (the header is line 1).
+    row: int
+    column: Optional[str] = None
+    detail: str
+
+
+class ImportResponse(BaseModel):
+    dry_run: bool
+    # Data rows read from the file
+    rows: int
+    # Rows written; 0 for a dry run or a file with errors
+    created: int
+    error_count: int
+    # The first MAX_REPORTED_ERRORS errors, in file order
+    errors: list[ImportRowError]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class WindDownPreviewResponse(BaseModel):
+    """What archiving would do to the resource's assignments right now."""
+
+    kept: int
+    trimmed: int
+    deleted: int
+
+    model_config = {"from_attributes": True}
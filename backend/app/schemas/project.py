@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
 
@@ -41,3 +41,26 @@ class ProjectResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ProjectShiftRequest(BaseModel):
+    # Positive moves later, negative earlier. Bounded to about four years.
+    working_days: int = Field(ge=-1000, le=1000)
+
+
+class ProjectStretchRequest(BaseModel):
+    start_date: date
+    end_date: date
+
+    @model_validator(mode="after")
+    def validate_date_range(self) -> "ProjectStretchRequest":
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must be greater than or equal to start_date")
+        return self
+
+
+class ProjectRescheduleResponse(BaseModel):
+    updated_assignments: int
+    # New project window (earliest start, latest end); null without assignments.
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Annotated, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.assignment import (
+    BulkCreateOperation,
+    BulkDeleteOperation,
+    BulkUpdateOperation,
+)
+from app.schemas.employee import CapacityBase
+
+# Scenario edits. Assignment edits take the same fields as the bulk endpoint's
+# operations; the rest act on a whole project or employee. Like bulk
+# operations they are applied in order.
+
+MAX_SCENARIO_EDITS = 500
+
+
+class ScenarioShiftProject(BaseModel):
+    op: Literal["shift_project"]
+    project_id: int
+    working_days: int = Field(ge=-1000, le=1000)
+
+
+class ScenarioSetCapacity(CapacityBase):
+    op: Literal["set_capacity"]
+    employee_id: int
+
+
+class ScenarioLeave(BaseModel):
+    op: Literal["leave"]
+    employee_id: int
+    # Last day at work; assignments are wound down as archiving would.
+    last_day: date
+
+
+ScenarioEdit = Annotated[
+    Union[
+        BulkCreateOperation,
+        BulkUpdateOperation,
+        BulkDeleteOperation,
+        ScenarioShiftProject,
+        ScenarioSetCapacity,
+        ScenarioLeave,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class ScenarioCreate(BaseModel):
+    start_date: date
+    end_date: date
+    granularity: Literal["monthly", "weekly"] = "monthly"
+    edits: list[ScenarioEdit] = Field(default=[], max_length=MAX_SCENARIO_EDITS)
+
+    @model_validator(mode="after")
+    def validate_date_range(self) -> "ScenarioCreate":
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must be greater than or equal to start_date")
+        return self
+
+
+class ScenarioEditsRequest(BaseModel):
+    edits: list[ScenarioEdit] = Field(min_length=1, max_length=MAX_SCENARIO_EDITS)
+
+
+class PeriodOccupancy(BaseModel):
+    percentage: float
+    hours: float
+    available_hours: float
+    is_overbooked: bool
+
+
+class PeriodDiff(BaseModel):
+    baseline: PeriodOccupancy
+    scenario: PeriodOccupancy
+
+
+class EmployeeDiff(BaseModel):
+    id: int
+    name: str
+    team: Optional[str] = None
+    # Only the periods whose occupancy changed, keyed like the timeline.
+    periods: dict[str, PeriodDiff]
+
+
+class ScenarioResponse(BaseModel):
+    id: str
+    start_date: date
+    end_date: date
+    granularity: str
+    edit_count: int
+    # Employees whose occupancy this request had to recompute.
+    recomputed: int
+    overbooked_periods_baseline: int
+    overbooked_periods_scenario: int
+    employees: list[EmployeeDiff]
@@ -4,10 +4,13 @@ from datetime import date
 from decimal import Decimal
 
 from app.models.assignment import AllocationType
+from app.utils.holiday_calendars import DEFAULT_CALENDAR
+from app.utils.hour_units import UNITS_PER_HOUR, div_round, to_units
 from app.utils.working_days import get_working_days, get_working_days_in_month
 
 
 FULL_TIME_DAILY_HOURS = Decimal("8")
+FULL_TIME_DAILY_UNITS = to_units(FULL_TIME_DAILY_HOURS)
 
 
 def calculate_daily_hours(
@@ -18,6 +21,7 @@ def calculate_daily_hours(
     start_date: date | None = None,
     end_date: date | None = None,
     base_daily_hours: Decimal | float = FULL_TIME_DAILY_HOURS,
+    calendar: str = DEFAULT_CALENDAR,
 ) -> Decimal:
     """Calculate daily hours for an assignment in a given month.
 
@@ -27,7 +31,8 @@ def calculate_daily_hours(
 
     `base_daily_hours` is what 100% means for this assignment: a full-time day
     by default, or the employee's contracted daily hours when they work part
-    time. Hours-based allocations are absolute and ignore it.
+    time. Hours-based allocations are absolute and ignore it; they are spread
+    over the working days of the employee's holiday `calendar`.
     """
     value = Decimal(str(allocation_value))
     if (
@@ -42,13 +47,49 @@ def calculate_daily_hours(
     ):
         if not start_date or not end_date:
             raise ValueError("start_date and end_date are required for total_hours")
-        total_wd = get_working_days(start_date, end_date)
+        total_wd = get_working_days(start_date, end_date, calendar)
         return (value / Decimal(str(total_wd))) if total_wd > 0 else Decimal("0")
 
     # monthly_hours
-    wd = get_working_days_in_month(year, month)
+    wd = get_working_days_in_month(year, month, calendar)
     if wd == 0:
         return Decimal("0")
     return value / Decimal(str(wd))
 
 
+def calculate_daily_units(
+    allocation_type: str,
+    allocation_value: int,
+    year: int,
+    month: int,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    base_daily_units: int = FULL_TIME_DAILY_UNITS,
+    calendar: str = DEFAULT_CALENDAR,
+) -> int:
+    """`calculate_daily_hours` in fixed-point units (see app.utils.hour_units).
+
+    `allocation_value` and `base_daily_units` are already in units (a
+    percentage too: 50% is `to_units(50)`). The division is rounded half to
+    even once; this is what the occupancy engine runs on.
+    """
+    if (
+        allocation_type == AllocationType.percentage.value
+        or allocation_type == AllocationType.percentage
+    ):
+        return div_round(base_daily_units * allocation_value, 100 * UNITS_PER_HOUR)
+
+    if (
+        allocation_type == AllocationType.total_hours.value
+        or allocation_type == AllocationType.total_hours
+    ):
+        if not start_date or not end_date:
+            raise ValueError("start_date and end_date are required for total_hours")
+        total_wd = get_working_days(start_date, end_date, calendar)
+        return div_round(allocation_value, total_wd) if total_wd > 0 else 0
+
+    # monthly_hours
+    wd = get_working_days_in_month(year, month, calendar)
+    if wd == 0:
+        return 0
+    return div_round(allocation_value, wd)
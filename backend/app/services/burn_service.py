@@ -0,0 +1,156 @@
+"""Planned hours per project and month ("burn").
+
+A `total_hours` assignment spreads its budget evenly over its working days,
+a `monthly_hours` one gives each month its hours, and a percentage is a share
+of the assignee's own day; what any of them plans for a given month is the
+occupancy engine's booked hours. This report runs the engine for every
+assignment of the selected projects once, as a vector of planned hours per
+month (`assignment_period_units`), and adds the vectors up per project.
+
+The figures are the timeline's: a percentage assignment plans nothing on its
+assignee's vacation days, hours-based ones are spread over working days of
+the assignee's holiday calendar, and placeholders are planned against the
+full-time norm of the default calendar. Costs grow with the number of
+assignments and months, not days, so a portfolio of a few hundred projects
+is one request and a handful of queries.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment import Assignment
+from app.models.employee import Employee
+from app.services.occupancy_service import (
+    CalendarDays,
+    assignment_period_units,
+    load_occupancy_inputs,
+    period_day_bounds,
+    period_windows,
+)
+from app.utils.holiday_calendars import DEFAULT_CALENDAR
+
+
+@dataclass
+class AssignmentBurn:
+    """One assignment and its planned units per month of the report."""
+
+    assignment: Any
+    employee_name: str | None
+    units: list[int]
+
+
+@dataclass
+class BurnReport:
+    """Planned units per month for the assignments of a set of projects.
+
+    The range is whole months: `months` are their 'YYYY-MM' keys, and every
+    vector has one entry per month. Assignments are listed per project id,
+    in start date order; projects without any in the range are missing.
+    """
+
+    start_date: date
+    end_date: date
+    months: list[str]
+    assignments: dict[int, list[AssignmentBurn]]
+
+    def project_units(self, project_id: int) -> list[int]:
+        """Planned units per month for the whole project."""
+        totals = [0] * len(self.months)
+        for burn in self.assignments.get(project_id, []):
+            totals = [t + u for t, u in zip(totals, burn.units)]
+        return totals
+
+
+async def load_burn(
+    db: AsyncSession, project_ids: Select, start_date: date, end_date: date
+) -> BurnReport:
+    """Planned hours per month in the months touching [start, end].
+
+    `project_ids` is a select of `Project.id` used as a subquery. Only plain
+    rows are loaded; assignees' capacities, vacations and holiday calendars
+    come from `load_occupancy_inputs`.
+    """
+    periods = period_windows(start_date, end_date, "monthly")
+    start_date, end_date = periods[0][1], periods[-1][2]
+
+    overlapping = (
+        Assignment.project_id.in_(project_ids),
+        Assignment.start_date <= end_date,
+        Assignment.end_date >= start_date,
+    )
+    rows = (
+        await db.execute(
+            select(
+                Assignment.id,
+                Assignment.project_id,
+                Assignment.employee_id,
+                Assignment.start_date,
+                Assignment.end_date,
+                Assignment.allocation_type,
+                Assignment.allocation_value,
+                Assignment.is_tentative,
+            )
+            .where(*overlapping)
+            .order_by(Assignment.start_date, Assignment.id)
+        )
+    ).all()
+
+    employee_ids = select(Assignment.employee_id).where(
+        *overlapping, Assignment.employee_id.is_not(None)
+    )
+    names = {
+        row.id: f"{row.last_name} {row.first_name}"
+        for row in await db.execute(
+            select(Employee.id, Employee.first_name, Employee.last_name).where(
+                Employee.id.in_(employee_ids)
+            )
+        )
+    }
+    inputs = await load_occupancy_inputs(
+        db, employee_ids, start_date, end_date, include_assignments=False
+    )
+
+    by_employee: dict[int | None, list] = {}
+    for row in rows:
+        by_employee.setdefault(row.employee_id, []).append(row)
+
+    days_by_calendar = CalendarDays(start_date, end_date)
+    bounds: dict[str, list[int]] = {}
+    profiles: dict = {}
+    units: dict[int, list[int]] = {}
+    for employee_id, assignments in by_employee.items():
+        if employee_id is None:
+            calendar, capacities, vacations = DEFAULT_CALENDAR, None, []
+        else:
+            calendar = inputs.calendar(employee_id)
+            capacities = inputs.capacities.get(employee_id, [])
+            vacations = inputs.vacations.get(employee_id, [])
+        days = days_by_calendar[calendar]
+        if calendar not in bounds:
+            bounds[calendar] = period_day_bounds(days, periods)
+        vectors = assignment_period_units(
+            assignments, vacations, days, bounds[calendar], capacities, profiles, calendar
+        )
+        units.update((a.id, vector) for a, vector in zip(assignments, vectors))
+
+    by_project: dict[int, list[AssignmentBurn]] = {}
+    for row in rows:
+        by_project.setdefault(row.project_id, []).append(
+            AssignmentBurn(
+                assignment=row,
+                employee_name=names.get(row.employee_id),
+                units=units[row.id],
+            )
+        )
+
+    return BurnReport(
+        start_date=start_date,
+        end_date=end_date,
+        months=[key for key, _, _ in periods],
+        assignments=by_project,
+    )
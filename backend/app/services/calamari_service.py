@@ -29,12 +29,20 @@ class CalamariClient:
     Auth: HTTP Basic with API key as password (user left blank).
     """
 
-    def __init__(self, api_key: Optional[str] = None, subdomain: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        subdomain: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ):
         self.api_key = api_key
         self.subdomain = subdomain
+        self._base_url = base_url
 
     @property
     def base_url(self) -> str:
+        if self._base_url:
+            return self._base_url.rstrip("/")
         sub = self.subdomain or "app"
         return f"https://{sub}.calamari.io"
 
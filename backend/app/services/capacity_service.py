@@ -6,6 +6,7 @@ from typing import Sequence
 
 from app.models.employee import CapacityType, EmployeeCapacity, resolve_capacity_at
 from app.services.assignment_service import FULL_TIME_DAILY_HOURS, calculate_daily_hours
+from app.utils.holiday_calendars import DEFAULT_CALENDAR
 
 # The capacity every employee gets on migration and on creation: full time,
 # from always. Narrowing it is a deliberate act (it marks an employment start).
@@ -15,13 +16,16 @@ NO_CAPACITY = Decimal("0")
 
 
 def daily_capacity_hours(
-    capacities: Sequence[EmployeeCapacity], day: date
+    capacities: Sequence[EmployeeCapacity],
+    day: date,
+    calendar: str = DEFAULT_CALENDAR,
 ) -> Decimal:
     """Hours the employee is contracted for on a working day in `day`'s month.
 
     Zero when no capacity entry covers the day, which means the employee is not
     employed then. Monthly-hours contracts spread over that month's working
-    days, so the figure varies month to month; percentage contracts do not.
+    days (in the employee's holiday `calendar`), so the figure varies month to
+    month; percentage contracts do not.
     """
     capacity = resolve_capacity_at(capacities, day)
     if capacity is None:
@@ -31,11 +35,14 @@ def daily_capacity_hours(
         capacity.capacity_value,
         day.year,
         day.month,
+        calendar=calendar,
     )
 
 
 def assignment_base_daily_hours(
-    capacities: Sequence[EmployeeCapacity] | None, day: date
+    capacities: Sequence[EmployeeCapacity] | None,
+    day: date,
+    calendar: str = DEFAULT_CALENDAR,
 ) -> Decimal:
     """What 100% means for an assignment on `day`.
 
@@ -48,12 +55,15 @@ def assignment_base_daily_hours(
     """
     if capacities is None:
         return FULL_TIME_DAILY_HOURS
-    hours = daily_capacity_hours(capacities, day)
+    hours = daily_capacity_hours(capacities, day, calendar)
     return hours if hours > 0 else FULL_TIME_DAILY_HOURS
 
 
 def build_capacity_periods(
-    capacities: Sequence[EmployeeCapacity], start_date: date, end_date: date
+    capacities: Sequence[EmployeeCapacity],
+    start_date: date,
+    end_date: date,
+    calendar: str = DEFAULT_CALENDAR,
 ) -> list[dict]:
     """Flatten capacity into runs of constant daily hours across a date range.
 
@@ -68,7 +78,7 @@ def build_capacity_periods(
     periods: list[dict] = []
     day = start_date
     while day <= end_date:
-        hours = float(round(daily_capacity_hours(capacities, day), 2))
+        hours = float(round(daily_capacity_hours(capacities, day, calendar), 2))
         if not periods or periods[-1]["daily_hours"] != hours:
             periods.append({"from": day.isoformat(), "daily_hours": hours})
         day += timedelta(days=1)
@@ -0,0 +1,50 @@
+"""Which active employees a staffing, occupancy or export report covers.
+
+The overbooking scan, the availability heatmap, the staffing search and the
+spreadsheet exports all take the same team and technology filters, and the
+first three list employees the same way, so the queries live here rather
+than in any one API module.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.employee import Employee, Team, Technology
+from app.utils.query_params import parse_id_csv
+
+
+def active_employee_ids(team_ids: Optional[str], technology_ids: Optional[str]) -> Select:
+    """Select of active employee ids, narrowed by the team/technology filters.
+
+    Both filters are comma-separated ids; an employee needs any one of the
+    technologies.
+    """
+    emp_query = select(Employee.id).where(Employee.is_archived == False)
+    if team_ids:
+        ids = parse_id_csv(team_ids)
+        if ids:
+            emp_query = emp_query.where(Employee.team_id.in_(ids))
+    if technology_ids:
+        ids = parse_id_csv(technology_ids)
+        if ids:
+            emp_query = emp_query.where(
+                Employee.technologies.any(Technology.id.in_(ids))
+            )
+    return emp_query
+
+
+async def load_named_employees(db: AsyncSession, emp_query: Select) -> list:
+    """(id, first_name, last_name, team) rows of `emp_query`, by name."""
+    return (
+        await db.execute(
+            select(
+                Employee.id, Employee.first_name, Employee.last_name, Team.name.label("team")
+            )
+            .outerjoin(Team, Employee.team_id == Team.id)
+            .where(Employee.id.in_(emp_query))
+            .order_by(Employee.last_name, Employee.first_name)
+        )
+    ).all()
@@ -0,0 +1,225 @@
+"""Row sources for the spreadsheet exports.
+
+Both exports yield rows in batches, pulling from the database as they go,
+so a company-wide export over several years starts downloading at once and
+only one batch is ever in memory (see app.utils.spreadsheet for the
+encoding). Occupancy is computed by the same daily load engine as the
+timeline, a batch of employees at a time; assignments are read through a
+server-side cursor.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import AsyncIterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment import Assignment
+from app.models.employee import Employee, EmployeeCapacity, Team
+from app.models.project import Project
+from app.services.capacity_service import assignment_base_daily_hours
+from app.services.occupancy_service import (
+    CalendarDays,
+    Granularity,
+    assignment_daily_hours,
+    compute_daily_load,
+    load_occupancy_inputs,
+    occupancy_metrics,
+    period_windows,
+)
+from app.utils.holiday_calendars import DEFAULT_CALENDAR
+from app.utils.hour_units import round_units
+
+# Employees whose daily load is computed (and held) at once.
+OCCUPANCY_BATCH_EMPLOYEES = 100
+# Assignment rows fetched from the cursor at once.
+ASSIGNMENT_BATCH_ROWS = 1000
+
+OCCUPANCY_COLUMNS = [
+    "employee_id",
+    "employee",
+    "team",
+    "period",
+    "period_start",
+    "period_end",
+    "available_hours",
+    "booked_hours",
+    "tentative_hours",
+    "percentage",
+    "is_overbooked",
+]
+
+ASSIGNMENT_COLUMNS = [
+    "assignment_id",
+    "employee_id",
+    "employee",
+    "team",
+    "project_id",
+    "project",
+    "start_date",
+    "end_date",
+    "allocation_type",
+    "allocation_value",
+    "daily_hours",
+    "is_tentative",
+    "note",
+]
+
+
+async def occupancy_rows(
+    db: AsyncSession,
+    employee_ids: Select,
+    start_date: date,
+    end_date: date,
+    granularity: Granularity,
+) -> AsyncIterator[list[tuple]]:
+    """One row per employee and period, in timeline order, in batches.
+
+    Figures are the timeline's (`DailyLoad.summarize`) plus the tentative
+    share of the booked hours. `employee_ids` is a select of `Employee.id`.
+    """
+    periods = period_windows(start_date, end_date, granularity)
+    load_start, load_end = periods[0][1], periods[-1][2]
+    days = CalendarDays(load_start, load_end)
+    employees = (
+        await db.execute(
+            select(
+                Employee.id, Employee.first_name, Employee.last_name, Team.name.label("team")
+            )
+            .outerjoin(Team, Employee.team_id == Team.id)
+            .where(Employee.id.in_(employee_ids))
+            .order_by(Employee.last_name, Employee.first_name)
+        )
+    ).all()
+
+    profiles: dict = {}
+    for offset in range(0, len(employees), OCCUPANCY_BATCH_EMPLOYEES):
+        batch = employees[offset : offset + OCCUPANCY_BATCH_EMPLOYEES]
+        inputs = await load_occupancy_inputs(
+            db,
+            select(Employee.id).where(Employee.id.in_([e.id for e in batch])),
+            load_start,
+            load_end,
+        )
+        rows = []
+        for emp in batch:
+            calendar = inputs.calendar(emp.id)
+            load = compute_daily_load(
+                inputs.assignments.get(emp.id, []),
+                inputs.vacations.get(emp.id, []),
+                days[calendar],
+                inputs.capacities.get(emp.id, []),
+                profiles,
+                calendar,
+            )
+            name = f"{emp.last_name} {emp.first_name}"
+            for key, period_start, period_end in periods:
+                available, booked, tentative = load.unit_totals(period_start, period_end)
+                metrics = occupancy_metrics(available, booked)
+                rows.append(
+                    (
+                        emp.id,
+                        name,
+                        emp.team,
+                        key,
+                        period_start,
+                        period_end,
+                        metrics["available_hours"],
+                        metrics["hours"],
+                        round_units(tentative),
+                        metrics["percentage"],
+                        metrics["is_overbooked"],
+                    )
+                )
+        yield rows
+
+
+async def assignment_rows(
+    db: AsyncSession,
+    employee_ids: Select,
+    start_date: date,
+    end_date: date,
+    include_placeholders: bool = True,
+) -> AsyncIterator[list[tuple]]:
+    """Assignments overlapping [start, end], sorted by employee, in batches.
+
+    Covers the employees of `employee_ids` and, with `include_placeholders`,
+    placeholders after them. `daily_hours` is the timeline's: the hours per
+    working day in the first month of the assignment inside the range.
+    """
+    capacities: dict[int, list] = {}
+    for row in await db.execute(
+        select(
+            EmployeeCapacity.employee_id,
+            EmployeeCapacity.valid_from,
+            EmployeeCapacity.capacity_type,
+            EmployeeCapacity.capacity_value,
+        ).where(EmployeeCapacity.employee_id.in_(employee_ids))
+    ):
+        capacities.setdefault(row.employee_id, []).append(row)
+
+    in_scope = Assignment.employee_id.in_(employee_ids)
+    if include_placeholders:
+        in_scope = in_scope | Assignment.employee_id.is_(None)
+    query = (
+        select(
+            Assignment.id,
+            Assignment.employee_id,
+            Employee.first_name,
+            Employee.last_name,
+            Employee.holiday_calendar,
+            Team.name.label("team"),
+            Assignment.project_id,
+            Project.name.label("project"),
+            Assignment.start_date,
+            Assignment.end_date,
+            Assignment.allocation_type,
+            Assignment.allocation_value,
+            Assignment.is_tentative,
+            Assignment.note,
+        )
+        .join(Project, Assignment.project_id == Project.id)
+        .outerjoin(Employee, Assignment.employee_id == Employee.id)
+        .outerjoin(Team, Employee.team_id == Team.id)
+        .where(in_scope, Assignment.start_date <= end_date, Assignment.end_date >= start_date)
+        .order_by(
+            Assignment.employee_id.is_(None),
+            Employee.last_name,
+            Employee.first_name,
+            Assignment.employee_id,
+            Assignment.start_date,
+            Assignment.id,
+        )
+        .execution_options(yield_per=ASSIGNMENT_BATCH_ROWS)
+    )
+
+    result = await db.stream(query)
+    async for partition in result.partitions():
+        rows = []
+        for a in partition:
+            first_day = max(a.start_date, start_date)
+            calendar = a.holiday_calendar or DEFAULT_CALENDAR
+            base = assignment_base_daily_hours(
+                capacities.get(a.employee_id, []) if a.employee_id is not None else None,
+                first_day,
+                calendar,
+            )
+            rows.append(
+                (
+                    a.id,
+                    a.employee_id,
+                    f"{a.last_name} {a.first_name}" if a.employee_id is not None else None,
+                    a.team,
+                    a.project_id,
+                    a.project,
+                    a.start_date,
+                    a.end_date,
+                    a.allocation_type.value,
+                    float(a.allocation_value),
+                    float(round(assignment_daily_hours(a, first_day, base, calendar), 2)),
+                    a.is_tentative,
+                    a.note,
+                )
+            )
+        yield rows
@@ -0,0 +1,509 @@
+"""Bulk import of assignments and employees from CSV.
+
+Moving an existing plan out of spreadsheets used to mean one POST per row.
+Here a whole file is validated at once and written in a single transaction:
+
+- every row is checked with the rules of the single-item endpoint (the same
+  Pydantic schema, then existence, archive state, the working-day minimum,
+  name and email uniqueness);
+- everything the rows reference is looked up with a few set-based queries
+  (`IN` over all distinct ids or names), not one query per row;
+- valid files are written with multi-row INSERTs, a few thousand rows per
+  statement.
+
+A file with any invalid row is not written at all; every error is reported
+with its line number, so the file can be fixed and sent again.
+
+Files are the shape the assignment export produces: employees and projects
+may be given by id or by name ("Last First" for employees, as exported),
+and either a comma or a semicolon may separate the columns.
+"""
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Callable, Iterable, Sequence
+
+from pydantic import ValidationError
+from sqlalchemy import Select, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment import AllocationType, Assignment
+from app.models.employee import (
+    CapacityType,
+    Employee,
+    EmployeeCapacity,
+    Team,
+    Technology,
+    employee_technologies,
+)
+from app.models.project import Project
+from app.schemas.assignment import AssignmentCreate
+from app.schemas.employee import EmployeeCreate
+from app.services.capacity_service import BASELINE_VALID_FROM
+from app.utils.spreadsheet import csv_unescape
+from app.utils.working_days import get_working_days
+
+# Larger files should be split; a file is validated in memory as a whole.
+MAX_IMPORT_ROWS = 200_000
+# Rows per multi-row INSERT statement.
+INSERT_BATCH_ROWS = 5000
+# Values per IN (...) lookup, well below the drivers' bind parameter limits.
+LOOKUP_BATCH = 5000
+# Errors returned at most; the count of all of them is reported separately.
+MAX_REPORTED_ERRORS = 1000
+
+# Column limits of the tables, checked up front so that one overlong value
+# fails its row instead of the whole transaction.
+MAX_NAME_LENGTH = 255
+MAX_NOTE_LENGTH = 500
+MAX_ALLOCATION_VALUE = Decimal("99999.99")
+
+
+class ImportFileError(ValueError):
+    """The file as a whole cannot be read (encoding, header, size)."""
+
+
+@dataclass(frozen=True)
+class RowError:
+    """Why one row was rejected. `row` is the line number in the file."""
+
+    row: int
+    column: str | None
+    detail: str
+
+
+@dataclass
+class ImportResult:
+    """`created` is zero unless the file was valid and actually written."""
+
+    rows: int
+    created: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+
+def read_csv(
+    data: bytes, required: Sequence[Sequence[str]]
+) -> list[tuple[int, dict[str, str | None]]]:
+    """Parse a CSV upload into (line number, row) pairs.
+
+    Column names are matched case-insensitively; empty cells become None,
+    and the formula guard of our own exports is removed (`csv_unescape`).
+    Each entry of `required` lists alternative column names, one of which
+    must be present (e.g. `("project_id", "project")`).
+    """
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        raise ImportFileError("Plik musi być zapisany w UTF-8") from exc
+
+    first_line = text.split("\n", 1)[0]
+    delimiter = ";" if first_line.count(";") > first_line.count(",") else ","
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter)
+    header = next(reader, None)
+    if not header:
+        raise ImportFileError("Plik jest pusty")
+    columns = [name.strip().lower() for name in header]
+    missing = [names[0] for names in required if not any(n in columns for n in names)]
+    if missing:
+        raise ImportFileError(f"Brak kolumn: {', '.join(missing)}")
+
+    rows = []
+    for values in reader:
+        if not any(v.strip() for v in values):
+            continue
+        if len(rows) == MAX_IMPORT_ROWS:
+            raise ImportFileError(f"Plik może zawierać najwyżej {MAX_IMPORT_ROWS} wierszy")
+        rows.append(
+            (
+                reader.line_num,
+                {
+                    name: (csv_unescape(value.strip()) or None)
+                    for name, value in zip(columns, values)
+                },
+            )
+        )
+    return rows
+
+
+def _schema_errors(row: int, exc: ValidationError) -> list[RowError]:
+    return [
+        RowError(
+            row=row,
+            column=str(e["loc"][0]) if e["loc"] else None,
+            detail=e["msg"].removeprefix("Value error, "),
+        )
+        for e in exc.errors()
+    ]
+
+
+def _parse_id(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _decimal(value: str | None) -> str | None:
+    # Spreadsheets set to Polish write decimal commas.
+    return value.replace(",", ".") if value is not None else None
+
+
+def _batches(values: Iterable, size: int) -> Iterable[list]:
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+async def _lookup(
+    db: AsyncSession, values: Iterable, query_for: Callable[[list], Select]
+) -> list:
+    """Rows of `query_for(batch)` for every batch of the distinct `values`."""
+    rows = []
+    for batch in _batches(set(values), LOOKUP_BATCH):
+        rows.extend((await db.execute(query_for(batch))).all())
+    return rows
+
+
+def _full_name():
+    """An employee's name as the exports write it, lowercased."""
+    return func.lower(Employee.last_name + " " + Employee.first_name)
+
+
+async def _insert(db: AsyncSession, table, rows: list[dict]) -> None:
+    for batch in _batches(rows, INSERT_BATCH_ROWS):
+        await db.execute(insert(table), batch)
+
+
+@dataclass
+class AssignmentReferences:
+    """Employees and projects an assignment file refers to, by id and by
+    lowercased name, as rows with `id` and `is_archived`."""
+
+    employee_by_id: dict[int, object] = field(default_factory=dict)
+    employee_by_name: dict[str, object] = field(default_factory=dict)
+    project_by_id: dict[int, object] = field(default_factory=dict)
+    project_by_name: dict[str, object] = field(default_factory=dict)
+    # Working days per (start, end); imported plans repeat a few ranges a lot.
+    working_days: dict[tuple, int] = field(default_factory=dict)
+
+
+async def load_assignment_references(
+    db: AsyncSession, rows: list[tuple[int, dict]]
+) -> AssignmentReferences:
+    """Look up everything `rows` reference, a few queries for the whole file."""
+    employee_ids = {_parse_id(r.get("employee_id")) for _, r in rows} - {None}
+    employee_names = {
+        r["employee"].lower() for _, r in rows if r.get("employee") and not r.get("employee_id")
+    }
+    project_ids = {_parse_id(r.get("project_id")) for _, r in rows} - {None}
+    project_names = {
+        r["project"].lower() for _, r in rows if r.get("project") and not r.get("project_id")
+    }
+
+    refs = AssignmentReferences()
+    for row in await _lookup(
+        db,
+        employee_ids,
+        lambda ids: select(Employee.id, Employee.is_archived).where(Employee.id.in_(ids)),
+    ):
+        refs.employee_by_id[row.id] = row
+    for row in await _lookup(
+        db,
+        employee_names,
+        lambda names: select(
+            Employee.id, Employee.is_archived, _full_name().label("name")
+        ).where(_full_name().in_(names)),
+    ):
+        refs.employee_by_name[row.name] = row
+    for row in await _lookup(
+        db,
+        project_ids,
+        lambda ids: select(Project.id, Project.is_archived).where(Project.id.in_(ids)),
+    ):
+        refs.project_by_id[row.id] = row
+    for row in await _lookup(
+        db,
+        project_names,
+        lambda names: select(
+            Project.id, Project.is_archived, func.lower(Project.name).label("name")
+        ).where(func.lower(Project.name).in_(names)),
+    ):
+        refs.project_by_name[row.name] = row
+    return refs
+
+
+def check_assignment_row(
+    line: int, r: dict, refs: AssignmentReferences
+) -> dict | list[RowError]:
+    """The row's `assignments` table values, or why it cannot be imported.
+
+    Checks run in the order of `POST /api/assignments`, and like it this
+    reports the first failing rule (all schema errors at once, though).
+    """
+    bad_ids = [
+        c for c in ("employee_id", "project_id")
+        if r.get(c) is not None and _parse_id(r[c]) is None
+    ]
+    if bad_ids:
+        return [RowError(line, c, f"Invalid id value: {r[c]}") for c in bad_ids]
+    if r.get("employee_id") is not None:
+        employee_column = "employee_id"
+        employee = refs.employee_by_id.get(_parse_id(r["employee_id"]))
+    elif r.get("employee") is not None:
+        employee_column = "employee"
+        employee = refs.employee_by_name.get(r["employee"].lower())
+    else:
+        employee_column = None
+        employee = None
+    if r.get("project_id") is not None:
+        project_column = "project_id"
+        project = refs.project_by_id.get(_parse_id(r["project_id"]))
+    else:
+        project_column = "project"
+        project = refs.project_by_name.get((r.get("project") or "").lower())
+
+    # Existence is checked after the schema, as the endpoint does.
+    try:
+        body = AssignmentCreate(
+            employee_id=employee.id if employee else None,
+            project_id=project.id if project else 0,
+            start_date=r.get("start_date"),
+            end_date=r.get("end_date"),
+            allocation_type=r.get("allocation_type"),
+            allocation_value=_decimal(r.get("allocation_value")),
+            note=r.get("note"),
+            is_tentative=r.get("is_tentative") or False,
+        )
+    except ValidationError as exc:
+        return _schema_errors(line, exc)
+
+    span = (body.start_date, body.end_date)
+    if span not in refs.working_days:
+        refs.working_days[span] = get_working_days(*span)
+    error = None
+    if refs.working_days[span] < 1:
+        error = ("end_date", "Assignment must contain at least 1 working day")
+    elif employee_column and employee is None:
+        error = (employee_column, "Nie znaleziono pracownika")
+    elif employee is not None and employee.is_archived:
+        error = (employee_column, "Nie można przypisać zarchiwizowanego pracownika")
+    elif project is None:
+        error = (project_column, "Nie znaleziono projektu")
+    elif project.is_archived:
+        error = (project_column, "Nie można przypisać pracownika do zarchiwizowanego projektu")
+    elif body.allocation_value > MAX_ALLOCATION_VALUE:
+        error = ("allocation_value", f"allocation_value must be <= {MAX_ALLOCATION_VALUE}")
+    elif body.note and len(body.note) > MAX_NOTE_LENGTH:
+        error = ("note", f"note must be at most {MAX_NOTE_LENGTH} characters")
+    if error:
+        return [RowError(line, *error)]
+
+    return {
+        "employee_id": body.employee_id,
+        "project_id": body.project_id,
+        "start_date": body.start_date,
+        "end_date": body.end_date,
+        "allocation_type": AllocationType(body.allocation_type),
+        "allocation_value": body.allocation_value,
+        "note": body.note,
+        "is_tentative": body.is_tentative,
+    }
+
+
+async def import_assignments(
+    db: AsyncSession, data: bytes, dry_run: bool = False
+) -> ImportResult:
+    """Validate a CSV of assignments and, unless `dry_run`, insert them all.
+
+    Columns: `employee_id` or `employee` (empty for a placeholder),
+    `project_id` or `project`, `start_date`, `end_date`, `allocation_type`,
+    `allocation_value`, and optionally `is_tentative` and `note`. An id wins
+    over a name given in the same row. Does not commit.
+    """
+    rows = read_csv(
+        data,
+        [
+            ("project_id", "project"),
+            ("start_date",),
+            ("end_date",),
+            ("allocation_type",),
+            ("allocation_value",),
+        ],
+    )
+    refs = await load_assignment_references(db, rows)
+
+    result = ImportResult(rows=len(rows))
+    values: list[dict] = []
+    for line, r in rows:
+        checked = check_assignment_row(line, r, refs)
+        if isinstance(checked, list):
+            result.errors.extend(checked)
+        else:
+            values.append(checked)
+
+    if result.errors or dry_run:
+        return result
+    await _insert(db, Assignment.__table__, values)
+    result.created = len(values)
+    return result
+
+
+@dataclass
+class EmployeeReferences:
+    """Team and technology ids by lowercased name, and the names ("last
+    first", lowercased) and emails already taken. Accepted rows add theirs."""
+
+    teams: dict[str, int] = field(default_factory=dict)
+    technologies: dict[str, int] = field(default_factory=dict)
+    taken_names: set[str] = field(default_factory=set)
+    taken_emails: set[str] = field(default_factory=set)
+
+
+async def load_employee_references(
+    db: AsyncSession, rows: list[tuple[int, dict]]
+) -> EmployeeReferences:
+    """Teams, technologies and the names and emails of `rows` already in use."""
+    refs = EmployeeReferences()
+    for row in await db.execute(select(func.lower(Team.name).label("name"), Team.id)):
+        refs.teams[row.name] = row.id
+    for row in await db.execute(
+        select(func.lower(Technology.name).label("name"), Technology.id)
+    ):
+        refs.technologies[row.name] = row.id
+    full_names = {
+        f"{r['last_name']} {r['first_name']}".lower()
+        for _, r in rows
+        if r.get("first_name") and r.get("last_name")
+    }
+    for row in await _lookup(
+        db,
+        full_names,
+        lambda names: select(_full_name().label("name")).where(_full_name().in_(names)),
+    ):
+        refs.taken_names.add(row.name)
+    for row in await _lookup(
+        db,
+        {r["email"].lower() for _, r in rows if r.get("email")},
+        lambda emails: select(func.lower(Employee.email).label("email")).where(
+            func.lower(Employee.email).in_(emails)
+        ),
+    ):
+        refs.taken_emails.add(row.email)
+    return refs
+
+
+def _split_names(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [name.strip() for name in value.replace(";", ",").split(",") if name.strip()]
+
+
+def check_employee_row(
+    line: int, r: dict, refs: EmployeeReferences
+) -> tuple[dict, list[int]] | list[RowError]:
+    """The row's `employees` values and technology ids, or why it cannot be
+    imported. An accepted row's name and email count as taken afterwards."""
+    try:
+        body = EmployeeCreate(
+            first_name=r.get("first_name") or "",
+            last_name=r.get("last_name") or "",
+            email=r.get("email"),
+        )
+    except ValidationError as exc:
+        return _schema_errors(line, exc)
+
+    tech_names = _split_names(r.get("technologies"))
+    full_name = f"{body.last_name} {body.first_name}".lower()
+    unknown = [n for n in tech_names if n.lower() not in refs.technologies]
+    error = None
+    if max(len(body.first_name), len(body.last_name), len(body.email or "")) > MAX_NAME_LENGTH:
+        error = (None, f"Values must be at most {MAX_NAME_LENGTH} characters")
+    elif r.get("team") and r["team"].lower() not in refs.teams:
+        error = ("team", "Nie znaleziono zespołu")
+    elif unknown:
+        error = ("technologies", f"Nie znaleziono technologii: {', '.join(unknown)}")
+    elif full_name in refs.taken_names:
+        error = ("last_name", "Pracownik o tym imieniu i nazwisku już istnieje")
+    elif body.email and body.email.lower() in refs.taken_emails:
+        error = ("email", "Pracownik z tym adresem email już istnieje")
+    if error:
+        return [RowError(line, *error)]
+
+    refs.taken_names.add(full_name)
+    if body.email:
+        refs.taken_emails.add(body.email.lower())
+    values = {
+        "first_name": body.first_name,
+        "last_name": body.last_name,
+        "email": body.email,
+        "team_id": refs.teams[r["team"].lower()] if r.get("team") else None,
+    }
+    return values, list(dict.fromkeys(refs.technologies[n.lower()] for n in tech_names))
+
+
+async def import_employees(
+    db: AsyncSession, data: bytes, dry_run: bool = False
+) -> ImportResult:
+    """Validate a CSV of employees and, unless `dry_run`, insert them all.
+
+    Columns: `first_name`, `last_name`, and optionally `email`, `team` (a
+    team name) and `technologies` (technology names separated by commas or
+    semicolons). Like a created employee, each starts full time from always.
+    Names and emails must be unique among existing employees (archived
+    included) and within the file. Does not commit.
+    """
+    rows = read_csv(data, [("first_name",), ("last_name",)])
+    refs = await load_employee_references(db, rows)
+
+    result = ImportResult(rows=len(rows))
+    employees: list[dict] = []
+    employee_techs: list[list[int]] = []
+    for line, r in rows:
+        checked = check_employee_row(line, r, refs)
+        if isinstance(checked, list):
+            result.errors.extend(checked)
+        else:
+            employees.append(checked[0])
+            employee_techs.append(checked[1])
+
+    if result.errors or dry_run:
+        return result
+
+    # One multi-row INSERT per batch, returning the new ids in row order so
+    # technologies and capacities can reference them.
+    ids: list[int] = []
+    for batch in _batches(employees, INSERT_BATCH_ROWS):
+        inserted = await db.execute(
+            insert(Employee.__table__).returning(
+                Employee.__table__.c.id, sort_by_parameter_order=True
+            ),
+            batch,
+        )
+        ids.extend(inserted.scalars())
+    await _insert(
+        db,
+        EmployeeCapacity.__table__,
+        [
+            {
+                "employee_id": employee_id,
+                "valid_from": BASELINE_VALID_FROM,
+                "capacity_type": CapacityType.percentage,
+                "capacity_value": Decimal("100"),
+            }
+            for employee_id in ids
+        ],
+    )
+    await _insert(
+        db,
+        employee_technologies,
+        [
+            {"employee_id": employee_id, "technology_id": tech_id}
+            for employee_id, tech_ids in zip(ids, employee_techs)
+            for tech_id in tech_ids
+        ],
+    )
+    result.created = len(ids)
+    return result
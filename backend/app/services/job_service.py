@@ -0,0 +1,211 @@
+"""Durable background jobs, kept in the `jobs` table.
+
+Work that should not hold up a request (a Calamari sync can take minutes) is
+enqueued as a `Job` of some `kind` and answered with its id; a worker task in
+every server process picks jobs up. Workers claim a job with
+SELECT ... FOR UPDATE SKIP LOCKED, so several processes share the queue
+without running a job twice, and queued work survives restarts.
+
+A claimed job is leased to its worker for LEASE_SECONDS, and the lease is
+renewed while the job runs. A worker that dies leaves the lease to expire,
+after which another worker takes the job over as its next attempt. A failed
+attempt is retried with exponential backoff until `max_attempts` is reached.
+
+Handlers are registered per kind with `register_job_handler`. A handler is
+called with a fresh session and the job's payload, and returns a
+JSON-serializable result (or None).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session_factory
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[AsyncSession, dict[str, Any]], Awaitable[Any]]
+
+DEFAULT_MAX_ATTEMPTS = 3
+LEASE_SECONDS = 600
+RETRY_DELAY_SECONDS = 30
+POLL_SECONDS = 5
+MAX_ERROR_LENGTH = 2000
+
+_handlers: dict[str, JobHandler] = {}
+# Set on enqueue, so this process's worker does not wait for the next poll.
+_wakeup = asyncio.Event()
+
+
+def register_job_handler(kind: str, handler: JobHandler) -> None:
+    """Run jobs of `kind` with `handler`, replacing any previous one."""
+    _handlers[kind] = handler
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Wait before the next attempt, after `attempts` failed ones."""
+    return timedelta(seconds=RETRY_DELAY_SECONDS * 2 ** (attempts - 1))
+
+
+async def enqueue(
+    db: AsyncSession,
+    kind: str,
+    payload: dict[str, Any] | None = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    coalesce: bool = False,
+) -> Job:
+    """Add a job of `kind` and commit.
+
+    With `coalesce`, a job of the same kind and payload that is still waiting
+    to start is returned instead of adding another. A job that is already
+    running does not count: it may have read the data before the change that
+    called for the new one.
+    """
+    if kind not in _handlers:
+        raise ValueError(f"No handler for job kind: {kind}")
+    payload = payload or {}
+    if coalesce:
+        result = await db.execute(
+            select(Job)
+            .where(Job.kind == kind, Job.status == JobStatus.queued)
+            .order_by(Job.id)
+        )
+        waiting = next((j for j in result.scalars() if j.payload == payload), None)
+        if waiting is not None:
+            return waiting
+
+    job = Job(
+        kind=kind,
+        payload=payload,
+        status=JobStatus.queued,
+        attempts=0,
+        max_attempts=max_attempts,
+        run_at=_now(),
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    _wakeup.set()
+    return job
+
+
+async def claim_job(db: AsyncSession) -> Job | None:
+    """Lease the next due job to this worker, or return None.
+
+    Due are queued jobs whose `run_at` has passed and running jobs whose lease
+    has expired. Jobs of kinds this process has no handler for are left to
+    processes that do.
+    """
+    while True:
+        now = _now()
+        result = await db.execute(
+            select(Job)
+            .where(
+                Job.kind.in_(list(_handlers)),
+                or_(
+                    and_(Job.status == JobStatus.queued, Job.run_at <= now),
+                    and_(Job.status == JobStatus.running, Job.locked_until < now),
+                ),
+            )
+            .order_by(Job.run_at, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            return None
+
+        if job.status == JobStatus.running and job.attempts >= job.max_attempts:
+            # Its worker died during the last attempt.
+            job.status = JobStatus.failed
+            job.error = "Worker stopped before finishing the job"
+            job.locked_until = None
+            job.finished_at = now
+            await db.commit()
+            continue
+
+        job.status = JobStatus.running
+        job.attempts += 1
+        job.locked_until = now + timedelta(seconds=LEASE_SECONDS)
+        job.started_at = now
+        await db.commit()
+        return job
+
+
+async def _renew_lease(job_id: int) -> None:
+    while True:
+        await asyncio.sleep(LEASE_SECONDS / 3)
+        async with async_session_factory() as db:
+            await db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == JobStatus.running)
+                .values(locked_until=_now() + timedelta(seconds=LEASE_SECONDS))
+            )
+            await db.commit()
+
+
+async def run_job(job: Job) -> None:
+    """Run a claimed job's handler and record the outcome."""
+    lease = asyncio.create_task(_renew_lease(job.id))
+    try:
+        async with async_session_factory() as db:
+            result = await _handlers[job.kind](db, job.payload)
+    except Exception as exc:
+        logger.exception("Job %d (%s) failed, attempt %d", job.id, job.kind, job.attempts)
+        error = f"{type(exc).__name__}: {exc}"[:MAX_ERROR_LENGTH]
+        if job.attempts < job.max_attempts:
+            values = {
+                "status": JobStatus.queued,
+                "run_at": _now() + retry_delay(job.attempts),
+                "error": error,
+            }
+        else:
+            values = {"status": JobStatus.failed, "error": error, "finished_at": _now()}
+    else:
+        values = {"status": JobStatus.succeeded, "result": result, "finished_at": _now()}
+    finally:
+        lease.cancel()
+
+    async with async_session_factory() as db:
+        await db.execute(
+            update(Job).where(Job.id == job.id).values(locked_until=None, **values)
+        )
+        await db.commit()
+
+
+async def run_jobs(stop_event: asyncio.Event) -> None:
+    """Background task: run due jobs one at a time until stopped."""
+    logger.info("Starting job worker (%s)", ", ".join(sorted(_handlers)))
+
+    while not stop_event.is_set():
+        # Cleared before looking, so that a job enqueued meanwhile is not missed
+        _wakeup.clear()
+        job = None
+        try:
+            async with async_session_factory() as db:
+                job = await claim_job(db)
+            if job is not None:
+                await run_job(job)
+        except Exception:
+            logger.exception("Error in job worker")
+        if job is not None:
+            continue
+
+        # Wait for the next poll, or for a job enqueued by this process
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+    logger.info("Job worker stopped")
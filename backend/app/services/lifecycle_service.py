@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from datetime import date
 from enum import Enum
 
-from sqlalchemy import ColumnElement, delete, func, select
+from sqlalchemy import ColumnElement, and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.assignment import Assignment
@@ -58,35 +58,77 @@ def classify_for_wind_down(
     return WindDownAction.TRIM
 
 
+def wind_down_filters(today: date) -> dict[WindDownAction, ColumnElement[bool]]:
+    """SQL conditions equivalent to `classify_for_wind_down`, one per action.
+
+    Evaluated in the same order as the Python rules, so the three are disjoint
+    and cover every row even for malformed ranges (start after end).
+    """
+    start, end = Assignment.start_date, Assignment.end_date
+    keep = or_(end < today, and_(end == today, start <= today))
+    return {
+        WindDownAction.KEEP: keep,
+        WindDownAction.DELETE: and_(end >= today, start > today),
+        WindDownAction.TRIM: and_(start <= today, end > today),
+    }
+
+
+async def preview_wind_down(
+    db: AsyncSession,
+    condition: ColumnElement[bool],
+    today: date | None = None,
+) -> WindDownResult:
+    """Count what archiving would do to assignments matching `condition`.
+
+    One aggregate query; nothing is changed.
+    """
+    filters = wind_down_filters(today or date.today())
+    result = await db.execute(
+        select(
+            func.count().filter(filters[WindDownAction.KEEP]),
+            func.count().filter(filters[WindDownAction.TRIM]),
+            func.count().filter(filters[WindDownAction.DELETE]),
+        )
+        .select_from(Assignment)
+        .where(condition)
+    )
+    kept, trimmed, deleted = result.one()
+    return WindDownResult(kept=kept, trimmed=trimmed, deleted=deleted)
+
+
 async def wind_down_assignments(
     db: AsyncSession,
     condition: ColumnElement[bool],
     today: date | None = None,
+    dry_run: bool = False,
 ) -> WindDownResult:
     """Apply the archive wind-down to every assignment matching `condition`.
 
-    See `classify_for_wind_down` for the rules. Does not commit — the caller
-    owns the transaction.
+    See `classify_for_wind_down` for the rules. Runs as one DELETE for future
+    assignments and one UPDATE for ongoing ones, so archiving a resource with
+    thousands of assignments costs the same few statements (and holds its
+    locks as briefly) as one with a handful. With `dry_run`, only counts what
+    would happen (see `preview_wind_down`).
+
+    Does not commit — the caller owns the transaction.
     """
     today = today or date.today()
+    if dry_run:
+        return await preview_wind_down(db, condition, today)
 
-    result = await db.execute(select(Assignment).where(condition))
-    kept = trimmed = deleted = 0
-
-    for assignment in result.scalars().all():
-        action = classify_for_wind_down(
-            assignment.start_date, assignment.end_date, today
-        )
-        if action is WindDownAction.DELETE:
-            await db.delete(assignment)
-            deleted += 1
-        elif action is WindDownAction.TRIM:
-            assignment.end_date = today
-            trimmed += 1
-        else:
-            kept += 1
-
-    return WindDownResult(kept=kept, trimmed=trimmed, deleted=deleted)
+    filters = wind_down_filters(today)
+    kept = await count_assignments(db, and_(condition, filters[WindDownAction.KEEP]))
+    deleted = await db.execute(
+        delete(Assignment).where(condition, filters[WindDownAction.DELETE])
+    )
+    trimmed = await db.execute(
+        update(Assignment)
+        .where(condition, filters[WindDownAction.TRIM])
+        .values(end_date=today)
+    )
+    return WindDownResult(
+        kept=kept, trimmed=trimmed.rowcount or 0, deleted=deleted.rowcount or 0
+    )
 
 
 async def count_assignments(db: AsyncSession, condition: ColumnElement[bool]) -> int:
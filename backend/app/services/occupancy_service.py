@@ -0,0 +1,1076 @@
+"""Daily load engine behind every occupancy figure.
+
+Occupancy used to be computed period by period, re-deriving capacity and
+daily hours for every assignment on every day of every period. The rules
+(see `_compute_occupancy_for_period` in app.api.calendar) only change at
+month boundaries, capacity changes and assignment edges, so here they are
+evaluated once per employee over the whole requested range:
+
+- `compute_daily_load` produces per-working-day available, booked and
+  tentative hours for one employee;
+- `DailyLoad.summarize` / `DailyLoad.totals` aggregate any window of it,
+  and `DailyLoad.summarize_periods` many windows at once;
+- `load_stretches` gives the same load as constant runs of days, which
+  `overbooked_intervals`, `free_capacity` and `availability_runs` build
+  on; with `period_totals` they answer company-wide questions without
+  going day by day, from the plain rows `load_occupancy_inputs` returns;
+- `assignment_period_units` splits the booked hours by assignment, which
+  is what the project burn reports add up.
+
+Working days depend on the employee's holiday calendar: callers build one
+`days` list per calendar (see `CalendarDays`) and pass the matching
+`calendar` along, which is also what hours-based allocations are spread
+over.
+
+Hours are fixed-point integers inside the engine (see app.utils.hour_units
+for the rounding policy): allocation and capacity values are converted once
+per call, daily figures are rounded once where they are divided out, and
+everything after that is exact integer sums. Per-day lists and stretches are
+in those units; totals handed to callers are Decimal hours again, and the
+timeline's metrics go from units straight to floats.
+
+The per-employee timeline, the team rollup and anything else that reports
+occupancy share this engine, so they cannot drift apart.
+"""
+from __future__ import annotations
+
+import calendar as cal_mod
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterator, Literal, NamedTuple, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment import AllocationType, Assignment
+from app.models.employee import Employee, EmployeeCapacity
+from app.models.vacation import Vacation
+from app.services.assignment_service import (
+    FULL_TIME_DAILY_UNITS,
+    calculate_daily_hours,
+    calculate_daily_units,
+)
+from app.utils.holiday_calendars import DEFAULT_CALENDAR, holidays_in_year
+from app.utils.hour_units import percentage, round_units, to_hours, to_units
+
+ZERO = Decimal("0")
+HUNDRED = Decimal("100")
+
+Granularity = Literal["monthly", "weekly", "daily"]
+GRANULARITIES: tuple[Granularity, ...] = ("monthly", "weekly", "daily")
+
+
+def week_key(week_start: date) -> str:
+    """Generate week key matching frontend format: 'w-YYYY-WW'."""
+    _, iso_week, _ = week_start.isocalendar()
+    return f"w-{week_start.year}-{iso_week}"
+
+
+def weeks_in_range(start_date: date, end_date: date) -> list[tuple[date, date]]:
+    """Return (week_start, week_end) pairs for all ISO weeks touching the range.
+
+    The first window is aligned to the Monday of start_date's week so that
+    windows are always true ISO weeks (Monday–Sunday), matching the frontend's
+    Monday-based week grid regardless of which weekday start_date falls on.
+    """
+    weeks = []
+    current = start_date - timedelta(days=start_date.weekday())
+    while current <= end_date:
+        week_end = current + timedelta(days=6)
+        weeks.append((current, week_end))
+        current = week_end + timedelta(days=1)
+    return weeks
+
+
+def months_in_range(start_date: date, end_date: date) -> list[tuple[date, date]]:
+    """Return (first_day, last_day) pairs for all calendar months touching the range."""
+    months = []
+    current = date(start_date.year, start_date.month, 1)
+    while current <= end_date:
+        last = date(
+            current.year,
+            current.month,
+            cal_mod.monthrange(current.year, current.month)[1],
+        )
+        months.append((current, last))
+        current = last + timedelta(days=1)
+    return months
+
+
+def period_windows(
+    start_date: date, end_date: date, granularity: Granularity
+) -> list[tuple[str, date, date]]:
+    """Reporting periods touching the range as (key, first_day, last_day).
+
+    Keys match the timeline's occupancy keys: 'YYYY-MM', 'w-YYYY-WW' or, for
+    single days, 'YYYY-MM-DD'. Keys of different granularities never collide.
+    """
+    if granularity == "daily":
+        return [
+            (d.isoformat(), d, d)
+            for d in (
+                start_date + timedelta(days=i)
+                for i in range((end_date - start_date).days + 1)
+            )
+        ]
+    if granularity == "weekly":
+        return [(week_key(s), s, e) for s, e in weeks_in_range(start_date, end_date)]
+    return [
+        (f"{s.year}-{s.month:02d}", s, e) for s, e in months_in_range(start_date, end_date)
+    ]
+
+
+def working_days_between(
+    start_date: date, end_date: date, holiday_dates: set[date]
+) -> list[date]:
+    """Mon–Fri days in [start, end] that are not in `holiday_dates`."""
+    days = []
+    d = start_date
+    one_day = timedelta(days=1)
+    while d <= end_date:
+        if d.weekday() < 5 and d not in holiday_dates:
+            days.append(d)
+        d += one_day
+    return days
+
+
+def contracted_hours(
+    capacities: Sequence, days: Sequence[date], calendar: str = DEFAULT_CALENDAR
+) -> list[Decimal]:
+    """`daily_capacity_hours` for each day, walking the capacity entries once.
+
+    Equivalent to resolving the entry in force day by day (the latest
+    `valid_from` on or before the day, zero before the first one), but each
+    entry's hours are computed once per month instead of once per day.
+    """
+    return _walk_capacities(
+        capacities,
+        days,
+        ZERO,
+        lambda capacity, year, month: calculate_daily_hours(
+            capacity.capacity_type.value,
+            capacity.capacity_value,
+            year,
+            month,
+            calendar=calendar,
+        ),
+    )
+
+
+def contracted_units(
+    capacities: Sequence, days: Sequence[date], calendar: str = DEFAULT_CALENDAR
+) -> list[int]:
+    """`contracted_hours` in fixed-point units, as the engine uses them."""
+    return _walk_capacities(
+        capacities,
+        days,
+        0,
+        lambda capacity, year, month: calculate_daily_units(
+            capacity.capacity_type.value,
+            to_units(capacity.capacity_value),
+            year,
+            month,
+            calendar=calendar,
+        ),
+    )
+
+
+def _walk_capacities(capacities: Sequence, days: Sequence[date], none, daily) -> list:
+    ordered = sorted(capacities, key=lambda c: c.valid_from)
+    result = []
+    idx = -1
+    cache: dict[tuple[int, int, int], object] = {}
+    for d in days:
+        while idx + 1 < len(ordered) and ordered[idx + 1].valid_from <= d:
+            idx += 1
+        if idx < 0:
+            result.append(none)
+            continue
+        key = (idx, d.year, d.month)
+        hours = cache.get(key)
+        if hours is None:
+            hours = cache[key] = daily(ordered[idx], d.year, d.month)
+        result.append(hours)
+    return result
+
+
+@dataclass
+class DailyLoad:
+    """One employee's hours on each working day of a range, in units.
+
+    `available` is contracted hours, zero on vacation. `committed` holds each
+    day's committed hours and `tentative` the part of them from tentative
+    assignments. Percentage allocations book nothing on vacation days;
+    hours-based ones book their full daily share regardless (vacation reduces
+    the denominator, not the commitment).
+
+    The lists are fixed-point units (see app.utils.hour_units), so sums over
+    any window are exact whatever order they are added in.
+    """
+
+    days: list[date]
+    available: list[int]
+    committed: list[int]
+    tentative: list[int]
+
+    def booked(self, i: int) -> int:
+        """Committed hours on day `i`, in units."""
+        return self.committed[i]
+
+    def span(self, start_date: date, end_date: date) -> tuple[int, int]:
+        """Index slice [lo, hi) of the working days inside [start, end]."""
+        return bisect_left(self.days, start_date), bisect_right(self.days, end_date)
+
+    def unit_totals(self, start_date: date, end_date: date) -> tuple[int, int, int]:
+        """(available, booked, tentative) units summed over [start, end]."""
+        lo, hi = self.span(start_date, end_date)
+        return (
+            sum(self.available[lo:hi]),
+            sum(self.committed[lo:hi]),
+            sum(self.tentative[lo:hi]),
+        )
+
+    def totals(self, start_date: date, end_date: date) -> tuple[Decimal, Decimal, Decimal]:
+        """(available, booked, tentative) hours summed over [start, end]."""
+        available, booked, tentative = self.unit_totals(start_date, end_date)
+        return to_hours(available), to_hours(booked), to_hours(tentative)
+
+    def summarize(self, start_date: date, end_date: date) -> dict:
+        """Occupancy metrics for [start, end], in the timeline's format.
+
+        Zero availability with hours booked (work planned before someone
+        joins) is reported as overbooked rather than as 0%, since the ratio
+        is undefined.
+        """
+        available, booked, _ = self.unit_totals(start_date, end_date)
+        return occupancy_metrics(available, booked)
+
+    def summarize_periods(
+        self, periods: Sequence[tuple[str, date, date]]
+    ) -> dict[str, dict]:
+        """`summarize` for each (key, first_day, last_day) period, by key.
+
+        Running totals are built in one pass over the days, after which each
+        period is a difference of two of them. Any number of periods, of any
+        mix of granularities, costs that one pass plus a lookup per period.
+        """
+        available = [0, *accumulate(self.available)]
+        committed = [0, *accumulate(self.committed)]
+        result = {}
+        for key, start_date, end_date in periods:
+            lo, hi = self.span(start_date, end_date)
+            result[key] = occupancy_metrics(
+                available[hi] - available[lo], committed[hi] - committed[lo]
+            )
+        return result
+
+
+def occupancy_metrics(available: int, booked: int) -> dict:
+    """The timeline's occupancy dict for summed available/booked units."""
+    if available == 0:
+        pct = 0.0
+        overbooked = booked > 0
+    else:
+        pct = percentage(booked, available)
+        overbooked = pct > 100
+    return {
+        "percentage": pct,
+        "hours": round_units(booked),
+        "available_hours": round_units(available),
+        "is_overbooked": overbooked,
+    }
+
+
+def is_overbooked(available: int, booked: int) -> bool:
+    """The `is_overbooked` test of `occupancy_metrics`, without the dict.
+
+    Only the ratio matters, so any two figures in the same unit will do.
+    """
+    if not available:
+        return booked > 0
+    return percentage(booked, available) > 100
+
+
+@dataclass(frozen=True)
+class CapacityProfile:
+    """Capacity-derived figures for each of a fixed list of working days.
+
+    `contracted` is the contracted hours, `base` what 100% means for a
+    percentage assignment, and `segment` an id that changes whenever the
+    month, the contracted hours or the base do, so both an assignment's daily
+    hours and the contracted hours are constant within a segment;
+    `segment_starts` is the day index each segment starts at. Hours are in
+    units. Shared between employees with the same capacity history; treat the
+    lists as read-only.
+    """
+
+    contracted: list[int]
+    base: list[int]
+    segment: list[int]
+    segment_starts: list[int]
+
+
+def capacity_profile(
+    capacities: Sequence | None, days: list[date], calendar: str = DEFAULT_CALENDAR
+) -> CapacityProfile:
+    """Build the profile for one capacity history (None: placeholders)."""
+    n = len(days)
+    if capacities is None:
+        contracted = [FULL_TIME_DAILY_UNITS] * n
+        base = contracted
+    else:
+        contracted = contracted_units(capacities, days, calendar)
+        # The person's own day, or the full-time norm outside any contract
+        # (see assignment_base_daily_hours).
+        base = [h if h > 0 else FULL_TIME_DAILY_UNITS for h in contracted]
+
+    segment = [0] * n
+    segment_starts = [0] if n else []
+    seg = 0
+    for i in range(1, n):
+        if (
+            days[i].month != days[i - 1].month
+            or base[i] != base[i - 1]
+            or contracted[i] != contracted[i - 1]
+        ):
+            seg += 1
+            segment_starts.append(i)
+        segment[i] = seg
+    return CapacityProfile(
+        contracted=contracted,
+        base=base,
+        segment=segment,
+        segment_starts=segment_starts,
+    )
+
+
+def _capacity_signature(capacities: Sequence | None) -> tuple | None:
+    if capacities is None:
+        return None
+    return tuple(
+        (c.valid_from, c.capacity_type, c.capacity_value)
+        for c in sorted(capacities, key=lambda c: c.valid_from)
+    )
+
+
+def get_capacity_profile(
+    capacities: Sequence | None,
+    days: list[date],
+    profiles: dict | None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> CapacityProfile:
+    """`capacity_profile`, reused from `profiles` when the history was seen."""
+    if profiles is None:
+        return capacity_profile(capacities, days, calendar)
+    signature = (calendar, _capacity_signature(capacities))
+    profile = profiles.get(signature)
+    if profile is None:
+        profile = profiles[signature] = capacity_profile(capacities, days, calendar)
+    return profile
+
+
+@lru_cache(maxsize=4096)
+def _rate_daily_hours(
+    allocation_type: str,
+    allocation_value: Decimal,
+    year: int,
+    month: int,
+    base: Decimal,
+    calendar: str,
+) -> Decimal:
+    # Percentage and monthly_hours depend on nothing assignment-specific, so
+    # the many assignments sharing a value and month share one computation.
+    return calculate_daily_hours(
+        allocation_type,
+        allocation_value,
+        year,
+        month,
+        base_daily_hours=base,
+        calendar=calendar,
+    )
+
+
+def assignment_daily_hours(
+    a, day: date, base: Decimal, calendar: str = DEFAULT_CALENDAR
+) -> Decimal:
+    """`calculate_daily_hours` for assignment `a` on `day`, 100% being `base`."""
+    if a.allocation_type == AllocationType.total_hours:
+        return calculate_daily_hours(
+            AllocationType.total_hours.value,
+            a.allocation_value,
+            day.year,
+            day.month,
+            start_date=a.start_date,
+            end_date=a.end_date,
+            calendar=calendar,
+        )
+    return _rate_daily_hours(
+        a.allocation_type.value, a.allocation_value, day.year, day.month, base, calendar
+    )
+
+
+@lru_cache(maxsize=4096)
+def _rate_daily_units(
+    allocation_type: str,
+    allocation_value: int,
+    year: int,
+    month: int,
+    base: int,
+    calendar: str,
+) -> int:
+    return calculate_daily_units(
+        allocation_type,
+        allocation_value,
+        year,
+        month,
+        base_daily_units=base,
+        calendar=calendar,
+    )
+
+
+def assignment_daily_units(
+    a,
+    day: date,
+    base: int,
+    calendar: str = DEFAULT_CALENDAR,
+    value: int | None = None,
+) -> int:
+    """`assignment_daily_hours` in units, 100% being `base` units.
+
+    `value` is `a.allocation_value` in units; callers evaluating the same
+    assignment repeatedly convert it once and pass it in.
+    """
+    if value is None:
+        value = to_units(a.allocation_value)
+    if a.allocation_type == AllocationType.total_hours:
+        return calculate_daily_units(
+            AllocationType.total_hours.value,
+            value,
+            day.year,
+            day.month,
+            start_date=a.start_date,
+            end_date=a.end_date,
+            calendar=calendar,
+        )
+    return _rate_daily_units(
+        a.allocation_type.value, value, day.year, day.month, base, calendar
+    )
+
+
+def compute_daily_load(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> DailyLoad:
+    """Evaluate the occupancy rules for one employee on each of `days`.
+
+    `days` must be sorted working days of the employee's `calendar` (see
+    `CalendarDays`). Without capacities (placeholders) every day is a
+    full-time day.
+
+    Daily hours for an assignment depend only on the month and on what 100%
+    means that day, so they are recomputed only when either changes. Pass the
+    same `profiles` dict to every call over the same range to build each
+    distinct capacity history's profile only once per calendar — most
+    employees share the full-time one.
+    """
+    profile = get_capacity_profile(capacities, days, profiles, calendar)
+    n = len(days)
+    base, segment = profile.base, profile.segment
+
+    on_vacation = [False] * n
+    for v in vacations:
+        lo = bisect_left(days, v.start_date)
+        hi = bisect_right(days, v.end_date)
+        for i in range(lo, hi):
+            on_vacation[i] = True
+
+    if vacations:
+        available = [
+            0 if on_vacation[i] else hours for i, hours in enumerate(profile.contracted)
+        ]
+    else:
+        available = profile.contracted
+    committed = [0] * n
+    tentative = [0] * n
+
+    for a in assignments:
+        lo = bisect_left(days, a.start_date)
+        hi = bisect_right(days, a.end_date)
+        if lo >= hi:
+            continue
+        is_percentage = a.allocation_type == AllocationType.percentage
+        # A total_hours budget is spread evenly, so its daily share never changes.
+        is_even = a.allocation_type == AllocationType.total_hours
+        is_tentative = getattr(a, "is_tentative", False)
+        value = to_units(a.allocation_value)
+        last_segment = -1
+        daily = 0
+        for i in range(lo, hi):
+            if is_percentage and on_vacation[i]:
+                continue
+            if segment[i] != last_segment and not (is_even and last_segment >= 0):
+                last_segment = segment[i]
+                daily = assignment_daily_units(a, days[i], base[i], calendar, value)
+            committed[i] += daily
+            if is_tentative:
+                tentative[i] += daily
+
+    return DailyLoad(
+        days=days, available=available, committed=committed, tentative=tentative
+    )
+
+
+def period_totals(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    period_bounds: Sequence[int],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> list[tuple[Decimal, Decimal, Decimal]]:
+    """`period_units`, in hours."""
+    return [
+        (to_hours(available), to_hours(booked), to_hours(tentative))
+        for available, booked, tentative in period_units(
+            assignments, vacations, days, period_bounds, capacities, profiles, calendar
+        )
+    ]
+
+
+def period_units(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    period_bounds: Sequence[int],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> list[tuple[int, int, int]]:
+    """(available, booked, tentative) units per period, without per-day work.
+
+    The same rules as `compute_daily_load`, aggregated directly: within a
+    capacity segment both the contracted hours and every assignment's daily
+    hours are constant, so each (segment, period) cell contributes
+    `hours * days` instead of being summed day by day. Cost grows with the
+    number of assignments and segments, not with the length of the range,
+    which is what makes group rollups over thousands of employees cheap.
+
+    `period_bounds` are the indices into `days` where each period starts,
+    followed by `len(days)` (see `period_day_bounds`). Totals equal summing a
+    `DailyLoad` over the same periods exactly.
+    """
+    profile = get_capacity_profile(capacities, days, profiles, calendar)
+    n_periods = len(period_bounds) - 1
+    available = [0] * n_periods
+    booked = [0] * n_periods
+    tentative = [0] * n_periods
+    if not days:
+        return list(zip(available, booked, tentative))
+
+    cells = _PeriodCells(profile, days, vacations, period_bounds)
+    for c, (lo, hi) in enumerate(zip(cells.starts, cells.ends)):
+        hours = profile.contracted[lo]
+        if hours:
+            available[cells.period[c]] += hours * cells.working(lo, hi)
+
+    for a in assignments:
+        is_tentative = getattr(a, "is_tentative", False)
+        for p, hours in cells.booked(a, calendar):
+            booked[p] += hours
+            if is_tentative:
+                tentative[p] += hours
+
+    return list(zip(available, booked, tentative))
+
+
+def assignment_period_units(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    period_bounds: Sequence[int],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> list[list[int]]:
+    """Booked units per period for each of `assignments`, in order.
+
+    The per-assignment breakdown of `period_units`' booked column, with the
+    same arguments and the same rules: the vectors of one employee's
+    assignments add up to its booked units exactly.
+    """
+    n_periods = len(period_bounds) - 1
+    if not days:
+        return [[0] * n_periods for _ in assignments]
+    cells = _PeriodCells(
+        get_capacity_profile(capacities, days, profiles, calendar),
+        days,
+        vacations,
+        period_bounds,
+    )
+    vectors = []
+    for a in assignments:
+        vector = [0] * n_periods
+        for p, hours in cells.booked(a, calendar):
+            vector[p] += hours
+        vectors.append(vector)
+    return vectors
+
+
+class _PeriodCells:
+    """`days` cut into cells: maximal runs within one segment and one period."""
+
+    def __init__(
+        self,
+        profile: CapacityProfile,
+        days: list[date],
+        vacations: Sequence,
+        period_bounds: Sequence[int],
+    ) -> None:
+        n = len(days)
+        self.profile = profile
+        self.days = days
+
+        # Vacation days as a prefix count, so any cell's non-vacation days are O(1).
+        self._vacation_prefix: list[int] | None = None
+        if vacations:
+            on_vacation = [0] * n
+            for v in vacations:
+                for i in range(
+                    bisect_left(days, v.start_date), bisect_right(days, v.end_date)
+                ):
+                    on_vacation[i] = 1
+            self._vacation_prefix = [0, *accumulate(on_vacation)]
+
+        self.starts = sorted(set(profile.segment_starts) | set(period_bounds[:-1]))
+        self.period = []
+        p = 0
+        for start in self.starts:
+            while period_bounds[p + 1] <= start:
+                p += 1
+            self.period.append(p)
+        self.ends = self.starts[1:] + [n]
+
+    def working(self, lo: int, hi: int) -> int:
+        """Days in [lo, hi) not on vacation."""
+        if self._vacation_prefix is None:
+            return hi - lo
+        return hi - lo - (self._vacation_prefix[hi] - self._vacation_prefix[lo])
+
+    def booked(self, a, calendar: str) -> Iterator[tuple[int, int]]:
+        """(period, units) that assignment `a` books, cell by cell."""
+        days = self.days
+        a_lo = bisect_left(days, a.start_date)
+        a_hi = bisect_right(days, a.end_date)
+        if a_lo >= a_hi:
+            return
+        # Only percentage assignments pause on vacation days.
+        vacation_prefix = (
+            self._vacation_prefix
+            if a.allocation_type == AllocationType.percentage
+            else None
+        )
+        # A total_hours budget is spread evenly, so its daily share never changes.
+        is_even = a.allocation_type == AllocationType.total_hours
+        value = to_units(a.allocation_value)
+        segment, base, period = self.profile.segment, self.profile.base, self.period
+        starts, ends = self.starts, self.ends
+        daily = 0
+        last_segment = -1
+        for c in range(bisect_right(starts, a_lo) - 1, len(starts)):
+            lo = max(starts[c], a_lo)
+            if lo >= a_hi:
+                break
+            hi = min(ends[c], a_hi)
+            count = hi - lo
+            if vacation_prefix is not None:
+                count -= vacation_prefix[hi] - vacation_prefix[lo]
+                if not count:
+                    continue
+            if segment[lo] != last_segment and not (is_even and last_segment >= 0):
+                last_segment = segment[lo]
+                daily = assignment_daily_units(a, days[lo], base[lo], calendar, value)
+            yield period[c], daily * count
+
+
+def period_day_bounds(
+    days: list[date], periods: Sequence[tuple[str, date, date]]
+) -> list[int]:
+    """Start index in `days` of each period, plus len(days).
+
+    `days` must span exactly the contiguous `periods` (first period start to
+    last period end), as built by `working_days_between`.
+    """
+    return [bisect_left(days, start) for _, start, _ in periods] + [len(days)]
+
+
+@dataclass(frozen=True)
+class OverbookedInterval:
+    """A maximal run of working days on which an employee is over capacity.
+
+    Days are indices into the `days` list the sweep ran over (`end` is
+    exclusive); weekends and holidays inside a run do not break it.
+    `excess_hours` is booked minus available summed over the run; the peak is
+    the day with the highest load relative to availability, where a day with
+    nothing available ranks above any finite ratio.
+    """
+
+    start: int
+    end: int
+    excess_hours: Decimal
+    peak_booked_hours: Decimal
+    peak_available_hours: Decimal
+
+
+def _load_rank(available: int, booked: int) -> tuple[bool, Fraction]:
+    return (not available, Fraction(booked, available or 1))
+
+
+class LoadStretch(NamedTuple):
+    """Days [start, end) over which daily available and booked units are constant."""
+
+    start: int
+    end: int
+    available: int
+    booked: int
+
+
+def load_stretches(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> Iterator[LoadStretch]:
+    """One employee's daily load as constant stretches, by sweeping change points.
+
+    Booked and available hours only change where an assignment or vacation
+    starts or ends, or where a capacity segment starts (see
+    `CapacityProfile`). Those points are sorted once and swept with the set
+    of active assignments, so each stretch is evaluated once however many
+    days it covers. The rules are `compute_daily_load`'s; the stretches
+    cover `days` without gaps, in order, with hours in units.
+    """
+    profile = get_capacity_profile(capacities, days, profiles, calendar)
+    n = len(days)
+    if not n:
+        return
+
+    starting: dict[int, list] = {}
+    ending: dict[int, list] = {}
+    vacation_delta: dict[int, int] = {}
+    points = set(profile.segment_starts)
+    for a in assignments:
+        lo = bisect_left(days, a.start_date)
+        hi = bisect_right(days, a.end_date)
+        if lo < hi:
+            starting.setdefault(lo, []).append(a)
+            ending.setdefault(hi, []).append(a)
+            points.update((lo, hi))
+    for v in vacations:
+        lo = bisect_left(days, v.start_date)
+        hi = bisect_right(days, v.end_date)
+        if lo < hi:
+            vacation_delta[lo] = vacation_delta.get(lo, 0) + 1
+            vacation_delta[hi] = vacation_delta.get(hi, 0) - 1
+            points.update((lo, hi))
+    points.discard(n)
+    ordered = sorted(points)
+    ordered.append(n)
+
+    active: dict[int, object] = {}
+    values: dict[int, int] = {}
+    daily_by_segment: dict[int, tuple[int, int]] = {}
+    vacation_depth = 0
+    for k in range(len(ordered) - 1):
+        lo, hi = ordered[k], ordered[k + 1]
+        for a in ending.get(lo, ()):
+            del active[id(a)]
+        for a in starting.get(lo, ()):
+            active[id(a)] = a
+            values[id(a)] = to_units(a.allocation_value)
+        vacation_depth += vacation_delta.get(lo, 0)
+        on_vacation = vacation_depth > 0
+
+        seg = profile.segment[lo]
+        booked = 0
+        for key, a in active.items():
+            if on_vacation and a.allocation_type == AllocationType.percentage:
+                continue
+            # Constant within a segment; a total_hours share never changes.
+            cached = daily_by_segment.get(key)
+            if cached is None or (cached[0] != seg and cached[0] >= 0):
+                daily = assignment_daily_units(
+                    a, days[lo], profile.base[lo], calendar, values[key]
+                )
+                even = a.allocation_type == AllocationType.total_hours
+                daily_by_segment[key] = (-1 if even else seg, daily)
+            else:
+                daily = cached[1]
+            booked += daily
+        available = 0 if on_vacation else profile.contracted[lo]
+        yield LoadStretch(lo, hi, available, booked)
+
+
+def overbooked_intervals(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> list[OverbookedInterval]:
+    """Over-capacity runs for one employee, from `load_stretches`.
+
+    A day is over capacity by `is_overbooked`, like the timeline flag.
+    """
+    intervals: list[OverbookedInterval] = []
+    run: list | None = None  # [start, end, excess, peak_booked, peak_available]
+
+    def close(run: list) -> None:
+        start, end, excess, peak_booked, peak_available = run
+        intervals.append(
+            OverbookedInterval(
+                start,
+                end,
+                to_hours(excess),
+                to_hours(peak_booked),
+                to_hours(peak_available),
+            )
+        )
+
+    for lo, hi, available, booked in load_stretches(
+        assignments, vacations, days, capacities, profiles, calendar
+    ):
+        if not is_overbooked(available, booked):
+            if run is not None:
+                close(run)
+                run = None
+            continue
+        excess = (booked - available) * (hi - lo)
+        if run is None:
+            run = [lo, hi, excess, booked, available]
+        else:
+            run[1] = hi
+            run[2] += excess
+            if _load_rank(available, booked) > _load_rank(run[4], run[3]):
+                run[3], run[4] = booked, available
+    if run is not None:
+        close(run)
+    return intervals
+
+
+@dataclass(frozen=True)
+class FreeCapacity:
+    """Unbooked hours of one employee over a range of working days.
+
+    `free_hours` sums each day's available minus booked hours, floored at
+    zero, so overbooking on one day does not eat into free time on another.
+    `fit_days` counts days with at least the requested hours free.
+    """
+
+    available_hours: Decimal
+    booked_hours: Decimal
+    free_hours: Decimal
+    fit_days: int
+
+
+def free_capacity(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    hours_per_day: Decimal | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> FreeCapacity:
+    """Free hours over `days`, from `load_stretches`.
+
+    Without `hours_per_day`, `fit_days` counts days with any free time.
+    """
+    needed = None if hours_per_day is None else to_units(hours_per_day)
+    available_total = booked_total = free_total = 0
+    fit_days = 0
+    for lo, hi, available, booked in load_stretches(
+        assignments, vacations, days, capacities, profiles, calendar
+    ):
+        count = hi - lo
+        available_total += available * count
+        booked_total += booked * count
+        free = available - booked
+        if free > 0:
+            free_total += free * count
+            if needed is None or free >= needed:
+                fit_days += count
+    return FreeCapacity(
+        available_hours=to_hours(available_total),
+        booked_hours=to_hours(booked_total),
+        free_hours=to_hours(free_total),
+        fit_days=fit_days,
+    )
+
+
+def availability_runs(
+    assignments: Sequence,
+    vacations: Sequence,
+    days: list[date],
+    capacities: Sequence | None = None,
+    profiles: dict | None = None,
+    calendar: str = DEFAULT_CALENDAR,
+) -> list[list]:
+    """Free and booked hours on each of `days`, run-length encoded.
+
+    Runs are `[day_count, free_hours, booked_hours]` covering `days` in order.
+    Free hours are floored at zero as in `free_capacity`. Hours are rounded to
+    two decimals, and neighbouring runs that round alike are merged. The runs
+    come from `load_stretches`, so a year costs about as much as a month.
+    """
+    runs: list[list] = []
+    for lo, hi, available, booked in load_stretches(
+        assignments, vacations, days, capacities, profiles, calendar
+    ):
+        free = round_units(max(available - booked, 0), 2)
+        booked_hours = round_units(booked, 2)
+        if runs and runs[-1][1] == free and runs[-1][2] == booked_hours:
+            runs[-1][0] += hi - lo
+        else:
+            runs.append([hi - lo, free, booked_hours])
+    return runs
+
+
+@dataclass
+class OccupancyInputs:
+    """Everything the occupancy rules read, per employee id, as plain rows.
+
+    Missing keys mean "none"; note that an employee without capacity entries
+    must be passed `[]`, not None (which means a full-time placeholder).
+    `calendars` only lists employees off the default holiday calendar.
+    """
+
+    capacities: dict[int, list]
+    assignments: dict[int, list]
+    vacations: dict[int, list]
+    calendars: dict[int, str] = field(default_factory=dict)
+
+    def calendar(self, employee_id: int) -> str:
+        """Holiday calendar of `employee_id`."""
+        return self.calendars.get(employee_id, DEFAULT_CALENDAR)
+
+
+async def load_occupancy_inputs(
+    db: AsyncSession,
+    employee_ids: Select,
+    start_date: date,
+    end_date: date,
+    include_tentative: bool = True,
+    include_assignments: bool = True,
+) -> OccupancyInputs:
+    """Load capacities, assignments and vacations overlapping [start, end].
+
+    `employee_ids` is a select of `Employee.id` used as a subquery. Only the
+    columns the rules need are loaded — no ORM objects — which is what keeps
+    company-wide reports fast. Assignments come in start date order; callers
+    that load their own pass `include_assignments=False`.
+    """
+    capacities: dict[int, list] = {}
+    for row in await db.execute(
+        select(
+            EmployeeCapacity.employee_id,
+            EmployeeCapacity.valid_from,
+            EmployeeCapacity.capacity_type,
+            EmployeeCapacity.capacity_value,
+        ).where(EmployeeCapacity.employee_id.in_(employee_ids))
+    ):
+        capacities.setdefault(row.employee_id, []).append(row)
+
+    assignment_query = (
+        select(
+            Assignment.employee_id,
+            Assignment.start_date,
+            Assignment.end_date,
+            Assignment.allocation_type,
+            Assignment.allocation_value,
+            Assignment.is_tentative,
+        )
+        .where(
+            Assignment.employee_id.in_(employee_ids),
+            Assignment.start_date <= end_date,
+            Assignment.end_date >= start_date,
+        )
+        .order_by(Assignment.start_date)
+    )
+    if not include_tentative:
+        assignment_query = assignment_query.where(Assignment.is_tentative == False)
+    assignments: dict[int, list] = {}
+    if include_assignments:
+        for row in await db.execute(assignment_query):
+            assignments.setdefault(row.employee_id, []).append(row)
+
+    vacations: dict[int, list] = {}
+    for row in await db.execute(
+        select(Vacation.employee_id, Vacation.start_date, Vacation.end_date).where(
+            Vacation.employee_id.in_(employee_ids),
+            Vacation.start_date <= end_date,
+            Vacation.end_date >= start_date,
+        )
+    ):
+        vacations.setdefault(row.employee_id, []).append(row)
+
+    calendars: dict[int, str] = dict(
+        (
+            await db.execute(
+                select(Employee.id, Employee.holiday_calendar).where(
+                    Employee.id.in_(employee_ids),
+                    Employee.holiday_calendar != DEFAULT_CALENDAR,
+                )
+            )
+        ).all()
+    )
+
+    return OccupancyInputs(
+        capacities=capacities,
+        assignments=assignments,
+        vacations=vacations,
+        calendars=calendars,
+    )
+
+
+def holidays_between(
+    start_date: date, end_date: date, calendar: str = DEFAULT_CALENDAR
+) -> set[date]:
+    """Holiday dates of `calendar` in every year touching [start, end]."""
+    holiday_dates: set[date] = set()
+    for year in range(start_date.year, end_date.year + 1):
+        holiday_dates.update(holidays_in_year(year, calendar))
+    return holiday_dates
+
+
+class CalendarDays(dict):
+    """Working days in [start, end] per holiday calendar, built on first use.
+
+    Most reports only ever see the default calendar; employees on another
+    one get their own `days` list, and their day indices refer to it.
+    """
+
+    def __init__(self, start_date: date, end_date: date):
+        super().__init__()
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def __missing__(self, calendar: str) -> list[date]:
+        days = self[calendar] = working_days_between(
+            self.start_date,
+            self.end_date,
+            holidays_between(self.start_date, self.end_date, calendar),
+        )
+        return days
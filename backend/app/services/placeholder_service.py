@@ -0,0 +1,273 @@
+"""Auto-fill suggestions for placeholder assignments.
+
+A placeholder is planned work without an employee. For a batch of them this
+proposes who could take each one, ranking candidates by technology match,
+then team, then how much of the placeholder's hours fit into their free time.
+
+Matching is greedy over the batch, most demanding placeholder first: each
+takes its best candidate, whose free time is then reduced by that work, so
+two placeholders are not both pinned on the same free week. Free time and the
+placeholder's hours come from the occupancy engine, so a suggestion's figures
+are what the timeline shows once the assignment is made.
+
+Checking how well a placeholder fits a candidate costs a pass over its days.
+Candidates are therefore visited in order of an O(1) upper bound on that fit,
+and the search stops once no remaining candidate can enter the shortlist.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from itertools import accumulate
+from typing import Callable, Sequence
+
+from app.models.assignment import AllocationType
+from app.services.assignment_service import FULL_TIME_DAILY_UNITS
+from app.services.occupancy_service import (
+    ZERO,
+    assignment_daily_units,
+    get_capacity_profile,
+    load_stretches,
+)
+from app.utils.holiday_calendars import DEFAULT_CALENDAR, is_working_day
+from app.utils.hour_units import UNITS_PER_HOUR, div_round, to_hours, to_units
+
+ONE = Decimal("1")
+
+
+@dataclass
+class CandidateLoad:
+    """One employee's free hours on each working day, as work gets booked.
+
+    `base_prefix` sums what 100% means on days off vacation, which bounds a
+    percentage placeholder's hours without visiting its days; it is built on
+    first use, as batches without percentage placeholders never need it.
+
+    Placeholders are matched over one shared list of working days, the
+    default calendar's. For an employee on another calendar, a holiday of
+    theirs on that list is treated like vacation: no free time, and no
+    percentage hours booked.
+
+    Hours are the occupancy engine's fixed-point units.
+    """
+
+    base: list[int]
+    on_vacation: list[bool]
+    free: list[int]
+    free_prefix: list[int]
+    _base_prefix: list[int] | None = None
+
+    @classmethod
+    def build(
+        cls,
+        assignments: Sequence,
+        vacations: Sequence,
+        days: list[date],
+        capacities: Sequence,
+        profiles: dict | None = None,
+        calendar: str = DEFAULT_CALENDAR,
+    ) -> CandidateLoad:
+        n = len(days)
+        base = get_capacity_profile(capacities, days, profiles, calendar).base
+        free = [0] * n
+        on_vacation = [False] * n
+        for lo, hi, available, booked in load_stretches(
+            assignments, vacations, days, capacities, profiles, calendar
+        ):
+            if available > booked:
+                free[lo:hi] = [available - booked] * (hi - lo)
+        for v in vacations:
+            lo, hi = _span(days, v.start_date, v.end_date)
+            on_vacation[lo:hi] = [True] * (hi - lo)
+        if calendar != DEFAULT_CALENDAR:
+            for i, d in enumerate(days):
+                if not is_working_day(d, calendar):
+                    free[i] = 0
+                    on_vacation[i] = True
+        return cls(
+            base=base,
+            on_vacation=on_vacation,
+            free=free,
+            free_prefix=[0, *accumulate(free)],
+        )
+
+    @property
+    def base_prefix(self) -> list[int]:
+        if self._base_prefix is None:
+            self._base_prefix = [
+                0,
+                *accumulate(
+                    0 if away else b for b, away in zip(self.base, self.on_vacation)
+                ),
+            ]
+        return self._base_prefix
+
+    def free_between(self, lo: int, hi: int) -> int:
+        return self.free_prefix[hi] - self.free_prefix[lo]
+
+    def book(self, lo: int, demand: Sequence[int]) -> None:
+        """Take `demand` (units per day from day `lo`) out of the free time."""
+        for i, hours in enumerate(demand, start=lo):
+            self.free[i] = max(self.free[i] - hours, 0)
+        self.free_prefix[lo:] = accumulate(self.free[lo:], initial=self.free_prefix[lo])
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """What ranking needs to know about an employee besides their load."""
+
+    employee_id: int
+    team_id: int | None
+    technology_ids: frozenset[int]
+
+
+@dataclass(frozen=True)
+class FillRequirements:
+    """Wanted technologies (any of them qualifies) and preferred teams."""
+
+    technology_ids: frozenset[int] = frozenset()
+    team_ids: frozenset[int] = frozenset()
+
+
+@dataclass(frozen=True)
+class FillOption:
+    """One candidate for one placeholder.
+
+    `hours` is what the placeholder would book for this employee over its
+    days (a percentage scales with their contract and pauses on vacation);
+    `covered_hours` how much of it fits into their free time, and
+    `short_days` on how many days it does not fully fit.
+    """
+
+    employee_id: int
+    matched_technologies: int
+    in_team: bool
+    hours: Decimal
+    covered_hours: Decimal
+    short_days: int
+
+    @property
+    def coverage(self) -> Decimal:
+        return self.covered_hours / self.hours if self.hours else ZERO
+
+
+def _span(days: list[date], start_date: date, end_date: date) -> tuple[int, int]:
+    return bisect_left(days, start_date), bisect_right(days, end_date)
+
+
+def _demand(placeholder, days: list[date], lo: int, hi: int, load: CandidateLoad | None):
+    """The placeholder's units per day on days [lo, hi) for this employee.
+
+    Hours-based allocations do not depend on the employee; pass None for them.
+    """
+    value = to_units(placeholder.allocation_value)
+    if load is None:
+        return [
+            assignment_daily_units(placeholder, days[i], 0, value=value)
+            for i in range(lo, hi)
+        ]
+    return [
+        0 if load.on_vacation[i]
+        else assignment_daily_units(placeholder, days[i], load.base[i], value=value)
+        for i in range(lo, hi)
+    ]
+
+
+def suggest_fills(
+    placeholders: Sequence,
+    requirements: dict[int, FillRequirements],
+    candidates: Sequence[Candidate],
+    load_for: Callable[[int], CandidateLoad],
+    days: list[date],
+    per_placeholder: int = 3,
+) -> dict[int, list[FillOption]]:
+    """Up to `per_placeholder` options per placeholder id, best first.
+
+    The first option of each placeholder is its greedy pick and is booked
+    before the next placeholder is matched. `load_for(employee_id)` is called
+    at most once per candidate; `days` must cover every placeholder. A
+    candidate none of whose working days overlap the placeholder's (or who is
+    fully booked over them) is not an option.
+    """
+    loads: dict[int, CandidateLoad] = {}
+
+    def load(employee_id: int) -> CandidateLoad:
+        if employee_id not in loads:
+            loads[employee_id] = load_for(employee_id)
+        return loads[employee_id]
+
+    def full_time_hours(p) -> int:
+        lo, hi = _span(days, p.start_date, p.end_date)
+        value = to_units(p.allocation_value)
+        return sum(
+            assignment_daily_units(p, days[i], FULL_TIME_DAILY_UNITS, value=value)
+            for i in range(lo, hi)
+        )
+
+    # Biggest first: they are the hardest to place once others took the slack.
+    ordered = sorted(placeholders, key=lambda p: (-full_time_hours(p), p.id))
+    results: dict[int, list[FillOption]] = {}
+    for p in ordered:
+        wanted = requirements.get(p.id, FillRequirements())
+        lo, hi = _span(days, p.start_date, p.end_date)
+        is_percentage = p.allocation_type == AllocationType.percentage
+        shared_demand = None if is_percentage else _demand(p, days, lo, hi, None)
+        shared_total = None if is_percentage else sum(shared_demand)
+        value = to_units(p.allocation_value)
+
+        ranked = []
+        for c in candidates:
+            matched = len(wanted.technology_ids & c.technology_ids)
+            if wanted.technology_ids and not matched:
+                continue
+            candidate_load = load(c.employee_id)
+            free = candidate_load.free_between(lo, hi)
+            if is_percentage:
+                base = candidate_load.base_prefix[hi] - candidate_load.base_prefix[lo]
+                total = div_round(value * base, 100 * UNITS_PER_HOUR)
+            else:
+                total = shared_total
+            if not free or not total:
+                continue
+            in_team = c.team_id in wanted.team_ids
+            ranked.append(((matched, in_team, min(ONE, Decimal(free) / total), free), c))
+        ranked.sort(key=lambda r: r[0], reverse=True)
+
+        shortlist: list[tuple[tuple, FillOption, list[int]]] = []
+        for bound, c in ranked:
+            if len(shortlist) == per_placeholder and bound <= shortlist[-1][0]:
+                break
+            candidate_load = loads[c.employee_id]
+            demand = (
+                _demand(p, days, lo, hi, candidate_load) if is_percentage else shared_demand
+            )
+            covered = 0
+            short_days = 0
+            for need, free in zip(demand, candidate_load.free[lo:hi]):
+                if need > free:
+                    covered += free
+                    short_days += 1
+                else:
+                    covered += need
+            if not covered:
+                continue
+            option = FillOption(
+                employee_id=c.employee_id,
+                matched_technologies=bound[0],
+                in_team=bound[1],
+                hours=to_hours(sum(demand)),
+                covered_hours=to_hours(covered),
+                short_days=short_days,
+            )
+            rank = (bound[0], bound[1], option.coverage, bound[3])
+            shortlist.append((rank, option, demand))
+            shortlist.sort(key=lambda s: s[0], reverse=True)
+            del shortlist[per_placeholder:]
+
+        results[p.id] = [option for _, option, _ in shortlist]
+        if shortlist:
+            _, pick, demand = shortlist[0]
+            loads[pick.employee_id].book(lo, demand)
+    return results
@@ -0,0 +1,118 @@
+"""Project-wide rescheduling: shift every assignment, or stretch the window.
+
+Both operations are pure date -> date mappings on the working-day calendar,
+so they are computed over the project's *distinct* start and end dates (at
+most one per calendar day, however many assignments there are) and applied
+as a single UPDATE with a CASE per column. No assignment rows are loaded.
+
+Allocation values are left alone. A `total_hours` budget therefore stays the
+same total, spread over however many working days the assignment now has;
+`percentage` and `monthly_hours` are rates and keep their intensity.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment import Assignment
+from app.utils.working_days import add_working_days, get_working_days_list
+
+
+@dataclass(frozen=True)
+class ProjectDates:
+    """Distinct assignment start and end dates of one project."""
+
+    starts: set[date]
+    ends: set[date]
+
+    @property
+    def window(self) -> tuple[date, date]:
+        return min(self.starts), max(self.ends)
+
+
+def shift_date_map(dates: set[date], working_days: int) -> dict[date, date]:
+    """Map each date to the date `working_days` working days later (or earlier).
+
+    Start and end move by the same count, so an assignment whose ends fall on
+    working days keeps exactly its number of working days.
+    """
+    return {d: add_working_days(d, working_days) for d in dates}
+
+
+def stretch_date_maps(
+    dates: ProjectDates, new_start: date, new_end: date
+) -> tuple[dict[date, date], dict[date, date]]:
+    """Rescale the project window onto [new_start, new_end], in working days.
+
+    Each working day of the old window is treated as a unit interval and the
+    old window is scaled linearly onto the new one: start dates map to the
+    first new working day of their interval, end dates to the last. Doubling
+    the window therefore turns a one-day assignment into a two-day one, and
+    the outermost start/end land exactly on the new first/last working day.
+    A non-working start counts from the next working day, a non-working end
+    from the previous one.
+
+    Returns (start_map, end_map). Raises ValueError if either window has no
+    working days.
+    """
+    old_days = get_working_days_list(*dates.window)
+    new_days = get_working_days_list(new_start, new_end)
+    if not old_days or not new_days:
+        raise ValueError("window has no working days")
+    n_old, n_new = len(old_days), len(new_days)
+
+    start_map = {}
+    for d in dates.starts:
+        i = min(bisect_left(old_days, d), n_old - 1)
+        start_map[d] = new_days[i * n_new // n_old]
+
+    end_map = {}
+    for d in dates.ends:
+        j = max(bisect_right(old_days, d) - 1, 0)
+        # ceil((j + 1) * n_new / n_old) - 1
+        end_map[d] = new_days[-(-(j + 1) * n_new // n_old) - 1]
+    return start_map, end_map
+
+
+async def load_project_dates(db: AsyncSession, project_id: int) -> ProjectDates | None:
+    """Distinct start/end dates of a project's assignments; None when it has none."""
+    result = await db.execute(
+        select(Assignment.start_date, Assignment.end_date)
+        .where(Assignment.project_id == project_id)
+        .distinct()
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    return ProjectDates(
+        starts={r.start_date for r in rows}, ends={r.end_date for r in rows}
+    )
+
+
+async def apply_date_maps(
+    db: AsyncSession,
+    project_id: int,
+    start_map: dict[date, date],
+    end_map: dict[date, date],
+) -> int:
+    """Rewrite the project's assignment dates in one UPDATE; returns the row count.
+
+    Dates missing from the maps (an assignment added since they were built)
+    are left as they are. Does not commit — the caller owns the transaction.
+    """
+    result = await db.execute(
+        update(Assignment)
+        .where(Assignment.project_id == project_id)
+        .values(
+            start_date=case(
+                start_map, value=Assignment.start_date, else_=Assignment.start_date
+            ),
+            end_date=case(end_map, value=Assignment.end_date, else_=Assignment.end_date),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
@@ -0,0 +1,527 @@
+"""What-if scenarios: hypothetical edits evaluated in memory.
+
+A scenario loads everything occupancy depends on for a date range once —
+active employees' capacities, vacations and assignments — and applies edits
+to that copy only; nothing is ever written. Its result is the occupancy of
+every employee an edit touched, next to their baseline (the plan as loaded).
+
+Evaluation is incremental. An employee's baseline is computed the first time
+an edit touches them, and their scenario occupancy is recomputed only when an
+edit since the last evaluation touched them, so adding one edit to a long
+scenario costs one or two employees' worth of work, not the whole company.
+
+Scenarios live in this process (see `ScenarioStore`), like the login rate
+limiter: with several workers a scenario is only visible to the worker that
+created it.
+"""
+from __future__ import annotations
+
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+from decimal import Decimal
+from threading import Lock
+from typing import Callable
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment import AllocationType, Assignment
+from app.models.employee import CapacityType, Employee, EmployeeCapacity, Team
+from app.models.project import Project
+from app.models.vacation import Vacation
+from app.services.lifecycle_service import WindDownAction, classify_for_wind_down
+from app.services.occupancy_service import (
+    CalendarDays,
+    Granularity,
+    compute_daily_load,
+    period_windows,
+)
+from app.services.reschedule_service import shift_date_map
+from app.utils.holiday_calendars import DEFAULT_CALENDAR
+from app.utils.working_days import get_working_days
+
+# Assignments are loaded this far beyond the range, so that moving work into
+# it (a project slipping, an assignment extended) is seen.
+LOAD_MARGIN_DAYS = 366
+# Scenarios are dropped after this long without use, oldest first beyond the cap.
+SCENARIO_TTL_SECONDS = 2 * 60 * 60
+MAX_SCENARIOS = 20
+
+
+class ScenarioEditError(Exception):
+    """An edit that the real endpoint would reject, with its status code."""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        # Position of the failing edit in its request, set by Scenario.apply.
+        self.index: int | None = None
+
+
+@dataclass(slots=True)
+class ScenarioAssignment:
+    id: int
+    employee_id: int | None
+    project_id: int
+    start_date: date
+    end_date: date
+    allocation_type: AllocationType
+    allocation_value: Decimal
+    is_tentative: bool
+    # Load order, so assignments starting the same day keep the timeline's order.
+    seq: int
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioCapacity:
+    valid_from: date
+    capacity_type: CapacityType
+    capacity_value: Decimal
+
+
+@dataclass
+class Scenario:
+    id: str
+    owner_id: int
+    start_date: date
+    end_date: date
+    granularity: Granularity
+    employees: dict[int, tuple[str, str | None]]  # active: id -> (name, team)
+    archived_employees: set[int]
+    projects: dict[int, bool]  # id -> is_archived
+    capacities: dict[int, list[ScenarioCapacity]]
+    vacations: dict[int, list]
+    assignments: dict[int, ScenarioAssignment]
+    # Employees off the default holiday calendar: id -> calendar code
+    calendars: dict[int, str] = field(default_factory=dict)
+    edit_count: int = 0
+    baseline: dict[int, dict[str, dict]] = field(default_factory=dict)
+    results: dict[int, dict[str, dict]] = field(default_factory=dict)
+    dirty: set[int] = field(default_factory=set)
+    last_used: float = field(default_factory=time.monotonic)
+    periods: list[tuple[str, date, date]] = field(init=False)
+    days: CalendarDays = field(init=False)
+    profiles: dict = field(init=False, default_factory=dict)
+    _by_employee: dict[int | None, dict[int, ScenarioAssignment]] = field(default_factory=dict)
+    _next_id: int = -1
+    _next_seq: int = 0
+
+    def __post_init__(self) -> None:
+        self.periods = period_windows(self.start_date, self.end_date, self.granularity)
+        load_start, load_end = self.periods[0][1], self.periods[-1][2]
+        self.days = CalendarDays(load_start, load_end)
+        for a in self.assignments.values():
+            self._by_employee.setdefault(a.employee_id, {})[a.id] = a
+        self._next_seq = len(self.assignments)
+
+    # --- occupancy ---
+
+    def _occupancy(self, employee_id: int) -> dict[str, dict]:
+        # Same assignments as the timeline: those overlapping the range.
+        assignments = sorted(
+            (
+                a
+                for a in self._by_employee.get(employee_id, {}).values()
+                if a.start_date <= self.end_date and a.end_date >= self.start_date
+            ),
+            key=lambda a: (a.start_date, a.seq),
+        )
+        calendar = self.calendars.get(employee_id, DEFAULT_CALENDAR)
+        load = compute_daily_load(
+            assignments,
+            self.vacations.get(employee_id, []),
+            self.days[calendar],
+            self.capacities.get(employee_id, []),
+            self.profiles,
+            calendar,
+        )
+        return {key: load.summarize(s, e) for key, s, e in self.periods}
+
+    def _touch(self, *employee_ids: int | None) -> None:
+        """Record the baseline of employees about to change, and mark them dirty."""
+        for employee_id in employee_ids:
+            if employee_id is None:
+                continue
+            if employee_id not in self.baseline:
+                self.baseline[employee_id] = self.results[employee_id] = (
+                    self._occupancy(employee_id)
+                )
+            self.dirty.add(employee_id)
+
+    def evaluate(self) -> int:
+        """Recompute dirty employees; returns how many there were."""
+        recomputed = len(self.dirty)
+        for employee_id in self.dirty:
+            self.results[employee_id] = self._occupancy(employee_id)
+        self.dirty.clear()
+        return recomputed
+
+    # --- edits ---
+
+    def apply(self, edits: list) -> None:
+        """Apply edits in order, all or nothing.
+
+        Raises ScenarioEditError (with `index` set) on the first invalid
+        edit, after undoing the ones before it.
+        """
+        undo: list[Callable[[], None]] = []
+        for index, edit in enumerate(edits):
+            try:
+                undo.extend(getattr(self, f"_apply_{edit.op}")(edit))
+            except ScenarioEditError as exc:
+                for step in reversed(undo):
+                    step()
+                exc.index = index
+                raise
+        self.edit_count += len(edits)
+
+    def _check_employee(self, employee_id: int | None) -> None:
+        if employee_id is None or employee_id in self.employees:
+            return
+        if employee_id in self.archived_employees:
+            raise ScenarioEditError(409, "Nie można przypisać zarchiwizowanego pracownika")
+        raise ScenarioEditError(404, "Nie znaleziono pracownika")
+
+    def _check_project(self, project_id: int) -> None:
+        if project_id not in self.projects:
+            raise ScenarioEditError(404, "Nie znaleziono projektu")
+        if self.projects[project_id]:
+            raise ScenarioEditError(
+                409, "Nie można przypisać pracownika do zarchiwizowanego projektu"
+            )
+
+    def _check_dates(self, start_date: date, end_date: date) -> None:
+        if start_date > end_date:
+            raise ScenarioEditError(400, "start_date must be <= end_date")
+        if get_working_days(start_date, end_date) < 1:
+            raise ScenarioEditError(400, "Assignment must contain at least 1 working day")
+
+    def _get_assignment(self, assignment_id: int) -> ScenarioAssignment:
+        assignment = self.assignments.get(assignment_id)
+        if assignment is None:
+            raise ScenarioEditError(404, "Nie znaleziono assignmentu")
+        return assignment
+
+    def _put(self, assignment: ScenarioAssignment) -> Callable[[], None]:
+        """Insert or replace an assignment; returns its undo step."""
+        previous = self.assignments.get(assignment.id)
+        self._remove(assignment.id)
+        self.assignments[assignment.id] = assignment
+        self._by_employee.setdefault(assignment.employee_id, {})[assignment.id] = assignment
+        if previous is None:
+            return lambda: self._remove(assignment.id)
+        return lambda: self._put(previous)
+
+    def _remove(self, assignment_id: int) -> None:
+        assignment = self.assignments.pop(assignment_id, None)
+        if assignment is not None:
+            del self._by_employee[assignment.employee_id][assignment_id]
+
+    def _apply_create(self, edit) -> list[Callable[[], None]]:
+        self._check_employee(edit.employee_id)
+        self._check_project(edit.project_id)
+        self._check_dates(edit.start_date, edit.end_date)
+        assignment = ScenarioAssignment(
+            id=self._next_id,
+            employee_id=edit.employee_id,
+            project_id=edit.project_id,
+            start_date=edit.start_date,
+            end_date=edit.end_date,
+            allocation_type=AllocationType(edit.allocation_type),
+            allocation_value=edit.allocation_value,
+            is_tentative=edit.is_tentative,
+            seq=self._next_seq,
+        )
+        self._next_id -= 1
+        self._next_seq += 1
+        self._touch(assignment.employee_id)
+        return [self._put(assignment)]
+
+    def _apply_update(self, edit) -> list[Callable[[], None]]:
+        current = self._get_assignment(edit.id)
+        fields = edit.model_fields_set
+        changes: dict = {}
+        if "employee_id" in fields:
+            self._check_employee(edit.employee_id)
+            changes["employee_id"] = edit.employee_id
+        if edit.project_id is not None:
+            self._check_project(edit.project_id)
+            changes["project_id"] = edit.project_id
+        for name in ("start_date", "end_date", "allocation_value", "is_tentative"):
+            if getattr(edit, name) is not None:
+                changes[name] = getattr(edit, name)
+        if edit.allocation_type is not None:
+            changes["allocation_type"] = AllocationType(edit.allocation_type)
+        updated = replace(current, **changes)
+        self._check_dates(updated.start_date, updated.end_date)
+        self._touch(current.employee_id, updated.employee_id)
+        return [self._put(updated)]
+
+    def _apply_delete(self, edit) -> list[Callable[[], None]]:
+        current = self._get_assignment(edit.id)
+        self._touch(current.employee_id)
+        self._remove(current.id)
+        return [lambda: self._put(current)]
+
+    def _apply_shift_project(self, edit) -> list[Callable[[], None]]:
+        if edit.project_id not in self.projects:
+            raise ScenarioEditError(404, "Nie znaleziono projektu")
+        if self.projects[edit.project_id]:
+            raise ScenarioEditError(409, "Nie można przeplanować zarchiwizowanego projektu")
+        affected = [a for a in self.assignments.values() if a.project_id == edit.project_id]
+        dates = {a.start_date for a in affected} | {a.end_date for a in affected}
+        date_map = shift_date_map(dates, edit.working_days)
+        self._touch(*{a.employee_id for a in affected})
+        return [
+            self._put(
+                replace(a, start_date=date_map[a.start_date], end_date=date_map[a.end_date])
+            )
+            for a in affected
+        ]
+
+    def _apply_set_capacity(self, edit) -> list[Callable[[], None]]:
+        self._check_employee(edit.employee_id)
+        self._touch(edit.employee_id)
+        return [
+            self._set_capacities(
+                edit.employee_id,
+                [
+                    c
+                    for c in self.capacities.get(edit.employee_id, [])
+                    if c.valid_from != edit.valid_from
+                ]
+                + [
+                    ScenarioCapacity(
+                        valid_from=edit.valid_from,
+                        capacity_type=CapacityType(edit.capacity_type),
+                        capacity_value=Decimal(str(edit.capacity_value)),
+                    )
+                ],
+            )
+        ]
+
+    def _apply_leave(self, edit) -> list[Callable[[], None]]:
+        """Zero capacity after `last_day`, assignments wound down as on archive."""
+        self._check_employee(edit.employee_id)
+        self._touch(edit.employee_id)
+        leaving = edit.last_day + timedelta(days=1)
+        # Worth nothing: counts like a day outside any contract. Only here,
+        # since the real data expresses that by having no entry.
+        kept = [
+            c for c in self.capacities.get(edit.employee_id, []) if c.valid_from < leaving
+        ]
+        undo = [
+            self._set_capacities(
+                edit.employee_id,
+                kept + [ScenarioCapacity(leaving, CapacityType.percentage, Decimal(0))],
+            )
+        ]
+        for a in list(self._by_employee.get(edit.employee_id, {}).values()):
+            action = classify_for_wind_down(a.start_date, a.end_date, edit.last_day)
+            if action == WindDownAction.DELETE:
+                self._remove(a.id)
+                undo.append(lambda a=a: self._put(a))
+            elif action == WindDownAction.TRIM:
+                undo.append(self._put(replace(a, end_date=edit.last_day)))
+        return undo
+
+    def _set_capacities(
+        self, employee_id: int, capacities: list[ScenarioCapacity]
+    ) -> Callable[[], None]:
+        previous = self.capacities.get(employee_id, [])
+        self.capacities[employee_id] = sorted(capacities, key=lambda c: c.valid_from)
+
+        def undo() -> None:
+            self.capacities[employee_id] = previous
+
+        return undo
+
+    # --- result ---
+
+    def diff(self) -> dict:
+        """Changed periods of every touched employee, plus overbooking counts."""
+        employees = []
+        overbooked_before = overbooked_after = 0
+        for employee_id in sorted(
+            self.baseline, key=lambda e: self.employees[e][0].lower()
+        ):
+            before, after = self.baseline[employee_id], self.results[employee_id]
+            overbooked_before += sum(p["is_overbooked"] for p in before.values())
+            overbooked_after += sum(p["is_overbooked"] for p in after.values())
+            periods = {
+                key: {"baseline": before[key], "scenario": after[key]}
+                for key in before
+                if before[key] != after[key]
+            }
+            if periods:
+                name, team = self.employees[employee_id]
+                employees.append(
+                    {"id": employee_id, "name": name, "team": team, "periods": periods}
+                )
+        return {
+            "overbooked_periods_baseline": overbooked_before,
+            "overbooked_periods_scenario": overbooked_after,
+            "employees": employees,
+        }
+
+
+async def load_scenario(
+    db: AsyncSession,
+    owner_id: int,
+    start_date: date,
+    end_date: date,
+    granularity: Granularity,
+) -> Scenario:
+    """Load the plan for [start, end] into a new, unedited scenario.
+
+    A few column-only queries; active employees and their work only, plus
+    placeholders, which edits may assign.
+    """
+    active = select(Employee.id).where(Employee.is_archived == False)
+    employees = {
+        row.id: (f"{row.last_name} {row.first_name}", row.team)
+        for row in await db.execute(
+            select(
+                Employee.id, Employee.first_name, Employee.last_name, Team.name.label("team")
+            )
+            .outerjoin(Team, Employee.team_id == Team.id)
+            .where(Employee.is_archived == False)
+        )
+    }
+    archived_employees = set(
+        (await db.execute(select(Employee.id).where(Employee.is_archived == True))).scalars()
+    )
+    calendars = dict(
+        (
+            await db.execute(
+                select(Employee.id, Employee.holiday_calendar).where(
+                    Employee.is_archived == False,
+                    Employee.holiday_calendar != DEFAULT_CALENDAR,
+                )
+            )
+        ).all()
+    )
+    projects = {
+        row.id: row.is_archived
+        for row in await db.execute(select(Project.id, Project.is_archived))
+    }
+
+    capacities: dict[int, list[ScenarioCapacity]] = {}
+    for row in await db.execute(
+        select(
+            EmployeeCapacity.employee_id,
+            EmployeeCapacity.valid_from,
+            EmployeeCapacity.capacity_type,
+            EmployeeCapacity.capacity_value,
+        )
+        .where(EmployeeCapacity.employee_id.in_(active))
+        .order_by(EmployeeCapacity.valid_from)
+    ):
+        capacities.setdefault(row.employee_id, []).append(
+            ScenarioCapacity(row.valid_from, row.capacity_type, row.capacity_value)
+        )
+
+    margin = timedelta(days=LOAD_MARGIN_DAYS)
+    assignments: dict[int, ScenarioAssignment] = {}
+    for seq, row in enumerate(
+        await db.execute(
+            select(
+                Assignment.id,
+                Assignment.employee_id,
+                Assignment.project_id,
+                Assignment.start_date,
+                Assignment.end_date,
+                Assignment.allocation_type,
+                Assignment.allocation_value,
+                Assignment.is_tentative,
+            )
+            .where(
+                or_(Assignment.employee_id.in_(active), Assignment.employee_id.is_(None)),
+                Assignment.start_date <= end_date + margin,
+                Assignment.end_date >= start_date - margin,
+            )
+            .order_by(Assignment.start_date, Assignment.id)
+        )
+    ):
+        assignments[row.id] = ScenarioAssignment(*row, seq=seq)
+
+    vacations: dict[int, list] = {}
+    for row in await db.execute(
+        select(Vacation.employee_id, Vacation.start_date, Vacation.end_date).where(
+            Vacation.employee_id.in_(active),
+            Vacation.start_date <= end_date + margin,
+            Vacation.end_date >= start_date - margin,
+        )
+    ):
+        vacations.setdefault(row.employee_id, []).append(row)
+
+    return Scenario(
+        id=secrets.token_urlsafe(12),
+        owner_id=owner_id,
+        start_date=start_date,
+        end_date=end_date,
+        granularity=granularity,
+        employees=employees,
+        archived_employees=archived_employees,
+        projects=projects,
+        capacities=capacities,
+        vacations=vacations,
+        assignments=assignments,
+        calendars=calendars,
+    )
+
+
+class ScenarioStore:
+    """Scenarios of this process, each visible to its owner only.
+
+    Bounded: idle scenarios expire, and beyond the cap the least recently
+    used one is dropped.
+    """
+
+    def __init__(
+        self, max_scenarios: int = MAX_SCENARIOS, ttl_seconds: float = SCENARIO_TTL_SECONDS
+    ) -> None:
+        self._scenarios: OrderedDict[str, Scenario] = OrderedDict()
+        self._max = max_scenarios
+        self._ttl = ttl_seconds
+        self._lock = Lock()
+
+    def _expire(self, now: float) -> None:
+        while self._scenarios:
+            oldest = next(iter(self._scenarios.values()))
+            if now - oldest.last_used < self._ttl:
+                break
+            self._scenarios.popitem(last=False)
+
+    def add(self, scenario: Scenario) -> None:
+        with self._lock:
+            self._expire(time.monotonic())
+            self._scenarios[scenario.id] = scenario
+            while len(self._scenarios) > self._max:
+                self._scenarios.popitem(last=False)
+
+    def get(self, scenario_id: str, owner_id: int) -> Scenario | None:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            scenario = self._scenarios.get(scenario_id)
+            if scenario is None or scenario.owner_id != owner_id:
+                return None
+            scenario.last_used = now
+            self._scenarios.move_to_end(scenario_id)
+            return scenario
+
+    def remove(self, scenario_id: str, owner_id: int) -> bool:
+        with self._lock:
+            scenario = self._scenarios.get(scenario_id)
+            if scenario is None or scenario.owner_id != owner_id:
+                return False
+            del self._scenarios[scenario_id]
+            return True
+
+
+scenario_store = ScenarioStore()
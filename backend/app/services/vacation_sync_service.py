@@ -8,15 +8,20 @@ from datetime import date, datetime, timezone
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings as app_config
+from app.core.events import VACATIONS_SYNCED, PlanEvent, broker
 from app.database import async_session_factory
 from app.models.app_settings import AppSettings
 from app.models.employee import Employee
+from app.models.job import Job
 from app.models.vacation import Vacation
 from app.services.calamari_service import CalamariClient
+from app.services.job_service import enqueue, register_job_handler
 
 logger = logging.getLogger(__name__)
 
 SYNC_INTERVAL_SECONDS = 3600  # 1 hour
+VACATION_SYNC_JOB = "vacation_sync"
 
 
 async def get_last_sync_timestamp(db: AsyncSession) -> str | None:
@@ -81,7 +86,9 @@ async def sync_vacations(db: AsyncSession, start_date: date, end_date: date) ->
         logger.debug("No employees with email, skipping Calamari sync")
         return 0
 
-    client = CalamariClient(api_key=api_key, subdomain=subdomain)
+    client = CalamariClient(
+        api_key=api_key, subdomain=subdomain, base_url=app_config.CALAMARI_BASE_URL
+    )
     leaves = await client.get_approved_leaves(start_date, end_date, employee_emails)
     if not leaves:
         return 0
@@ -97,12 +104,18 @@ async def sync_vacations(db: AsyncSession, start_date: date, end_date: date) ->
 
     now = datetime.now(timezone.utc)
     count = 0
+    # Employees whose vacations changed, for the plan change event
+    changed: set[int | None] = set()
 
     for leave in leaves:
         employee_id = email_to_id.get(leave.employee_email.lower())
         vacation = existing_map.get(leave.calamari_id)
 
         if vacation:
+            if (vacation.employee_id, vacation.start_date, vacation.end_date) != (
+                employee_id, leave.start_date, leave.end_date
+            ):
+                changed.update((vacation.employee_id, employee_id))
             vacation.employee_id = employee_id
             vacation.employee_email = leave.employee_email
             vacation.start_date = leave.start_date
@@ -119,23 +132,45 @@ async def sync_vacations(db: AsyncSession, start_date: date, end_date: date) ->
                 calamari_id=leave.calamari_id,
                 synced_at=now,
             ))
+            changed.add(employee_id)
         count += 1
 
     # Remove vacations that are no longer in Calamari for this date range
     fetched_ids = {leave.calamari_id for leave in leaves}
     stale_ids = set(existing_map.keys()) - fetched_ids
     if stale_ids:
+        changed.update(existing_map[i].employee_id for i in stale_ids)
         await db.execute(
             delete(Vacation).where(Vacation.calamari_id.in_(stale_ids))
         )
 
     await db.commit()
     logger.info("Synced %d vacations from Calamari", count)
+    changed.discard(None)
+    if changed:
+        await broker.publish(
+            PlanEvent(VACATIONS_SYNCED, employee_ids=tuple(sorted(changed)))
+        )
     return count
 
 
+async def run_vacation_sync_job(db: AsyncSession, payload: dict) -> dict:
+    """Job handler: sync the payload's ISO date range, or the default one."""
+    start, end = get_default_sync_range()
+    if "start_date" in payload:
+        start = date.fromisoformat(payload["start_date"])
+    if "end_date" in payload:
+        end = date.fromisoformat(payload["end_date"])
+    return {"synced": await sync_vacations(db, start, end)}
+
+
+async def enqueue_vacation_sync(db: AsyncSession) -> Job:
+    """Queue a sync of the default range, unless one is already waiting."""
+    return await enqueue(db, VACATION_SYNC_JOB, coalesce=True)
+
+
 async def periodic_vacation_sync(stop_event: asyncio.Event) -> None:
-    """Background task: sync vacations every SYNC_INTERVAL_SECONDS."""
+    """Background task: queue a vacation sync every SYNC_INTERVAL_SECONDS."""
     logger.info("Starting periodic vacation sync (every %ds)", SYNC_INTERVAL_SECONDS)
 
     while not stop_event.is_set():
@@ -143,8 +178,7 @@ async def periodic_vacation_sync(stop_event: asyncio.Event) -> None:
             async with async_session_factory() as db:
                 api_key, _ = await get_calamari_config(db)
                 if api_key:
-                    start, end = get_default_sync_range()
-                    await sync_vacations(db, start, end)
+                    await enqueue_vacation_sync(db)
                 else:
                     logger.debug("Calamari not configured, skipping periodic sync")
         except Exception:
@@ -157,3 +191,6 @@ async def periodic_vacation_sync(stop_event: asyncio.Event) -> None:
             pass
 
     logger.info("Periodic vacation sync stopped")
+
+
+register_job_handler(VACATION_SYNC_JOB, run_vacation_sync_job)
@@ -0,0 +1,184 @@
+"""Public holiday calendars and the per-year tables built from them.
+
+Working days are counted for every occupancy figure of every employee, so
+holidays are not recomputed per call: the first lookup of a (calendar, year)
+builds a `HolidayYear` — the holiday set, their names and a running count of
+working days — and every later request shares it. Counting the working days
+of any range is then a subtraction per year it touches.
+
+Each country is a `HolidayProvider` registered under its code. Employees
+name theirs in `Employee.holiday_calendar`; Poland is the default.
+"""
+from __future__ import annotations
+
+from calendar import isleap
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Protocol
+
+from app.utils.polish_holidays import PolishHolidays
+
+DEFAULT_CALENDAR = PolishHolidays.code
+
+
+class HolidayProvider(Protocol):
+    """Source of one calendar's public holidays."""
+
+    code: str
+    name: str
+
+    def holidays(self, year: int) -> Mapping[date, str]:
+        """Every public holiday of `year`, with its local name."""
+        ...
+
+
+@dataclass(frozen=True)
+class HolidayYear:
+    """One calendar's holidays in one year, as read-only lookup tables.
+
+    `working_before[i]` is the number of working days (Mon–Fri, not a
+    holiday) among the first `i` days of the year, so the year's entry has
+    one more item than the year has days. Bit `i` of `working_bits` is set
+    when day `i` of the year is a working day.
+    """
+
+    dates: frozenset[date]
+    names: Mapping[date, str]
+    ordered: tuple[date, ...]
+    first_ordinal: int
+    working_before: tuple[int, ...]
+    working_bits: int
+
+
+_providers: dict[str, HolidayProvider] = {}
+
+
+def register_calendar(provider: HolidayProvider) -> None:
+    """Make `provider` available under its code, replacing any previous one."""
+    _providers[provider.code] = provider
+    _holiday_year.cache_clear()
+
+
+def calendar_codes() -> list[str]:
+    """Codes of all registered calendars."""
+    return sorted(_providers)
+
+
+def get_provider(code: str) -> HolidayProvider:
+    provider = _providers.get(code)
+    if provider is None:
+        raise ValueError(f"Unknown holiday calendar: {code}")
+    return provider
+
+
+@lru_cache(maxsize=None)
+def _holiday_year(calendar: str, year: int) -> HolidayYear:
+    names = {
+        d: name
+        for d, name in get_provider(calendar).holidays(year).items()
+        if d.year == year
+    }
+    first = date(year, 1, 1)
+    n_days = 366 if isleap(year) else 365
+    working_before = [0] * (n_days + 1)
+    count = 0
+    bits = 0
+    weekday = first.weekday()
+    for i in range(n_days):
+        if (weekday + i) % 7 < 5 and first + timedelta(days=i) not in names:
+            count += 1
+            bits |= 1 << i
+        working_before[i + 1] = count
+    return HolidayYear(
+        dates=frozenset(names),
+        names=MappingProxyType(names),
+        ordered=tuple(sorted(names)),
+        first_ordinal=first.toordinal(),
+        working_before=tuple(working_before),
+        working_bits=bits,
+    )
+
+
+def holiday_year(year: int, calendar: str = DEFAULT_CALENDAR) -> HolidayYear:
+    """The shared tables for `calendar` in `year`, built on first use."""
+    return _holiday_year(calendar, year)
+
+
+def holidays_in_year(year: int, calendar: str = DEFAULT_CALENDAR) -> frozenset[date]:
+    return _holiday_year(calendar, year).dates
+
+
+def holiday_name(d: date, calendar: str = DEFAULT_CALENDAR) -> str:
+    """Local name of the holiday on `d`, or empty string if `d` is not one."""
+    return _holiday_year(calendar, d.year).names.get(d, "")
+
+
+def named_holidays(
+    start_date: date, end_date: date, calendar: str = DEFAULT_CALENDAR
+) -> list[tuple[date, str]]:
+    """(date, name) of each holiday in [start, end], in date order."""
+    result = []
+    for year in range(start_date.year, end_date.year + 1):
+        table = _holiday_year(calendar, year)
+        result.extend(
+            (d, table.names[d]) for d in table.ordered if start_date <= d <= end_date
+        )
+    return result
+
+
+def is_working_day(d: date, calendar: str = DEFAULT_CALENDAR) -> bool:
+    return d.weekday() < 5 and d not in _holiday_year(calendar, d.year).dates
+
+
+def count_working_days(
+    start_date: date, end_date: date, calendar: str = DEFAULT_CALENDAR
+) -> int:
+    """Working days in [start, end], from the running counts of each year."""
+    if end_date < start_date:
+        return 0
+    total = 0
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+    for year in range(start_date.year, end_date.year + 1):
+        table = _holiday_year(calendar, year)
+        counts = table.working_before
+        lo = start_ordinal - table.first_ordinal if year == start_date.year else 0
+        hi = (
+            end_ordinal - table.first_ordinal + 1
+            if year == end_date.year
+            else len(counts) - 1
+        )
+        total += counts[hi] - counts[lo]
+    return total
+
+
+def working_day_bitmap(
+    start_date: date, end_date: date, calendar: str = DEFAULT_CALENDAR
+) -> bytes:
+    """Working days of [start, end] as a bitset, one bit per day.
+
+    Bit `i % 8` of byte `i // 8` (least significant first) is set when
+    `start + i days` is a working day. Cut from each year's precomputed bits.
+    """
+    if end_date < start_date:
+        return b""
+    bits = 0
+    length = 0
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+    for year in range(start_date.year, end_date.year + 1):
+        table = _holiday_year(calendar, year)
+        lo = start_ordinal - table.first_ordinal if year == start_date.year else 0
+        hi = (
+            end_ordinal - table.first_ordinal + 1
+            if year == end_date.year
+            else len(table.working_before) - 1
+        )
+        bits |= ((table.working_bits >> lo) & ((1 << (hi - lo)) - 1)) << length
+        length += hi - lo
+    return bits.to_bytes((length + 7) // 8, "little")
+
+
+register_calendar(PolishHolidays())
@@ -0,0 +1,72 @@
+"""Fixed-point hours for the scheduling core.
+
+The occupancy engine adds up a figure per working day, per assignment, per
+employee. As Decimals every one of those operations allocates a new object
+and re-normalizes; as Python ints they are plain integer arithmetic. The
+engine therefore works in integer units of 1e-9 h (`UNITS_PER_HOUR`); hours
+only come back as Decimals at the engine's public edges, or as floats when
+a figure is serialized.
+
+Rounding policy:
+
+- values enter through `to_units`, rounded half to even to the nearest
+  unit, which is exact for the `Numeric(7, 2)` allocation and capacity
+  columns;
+- a figure obtained by division (hours spread over working days, a share of
+  a day) is rounded half to even once, where it is computed, by `div_round`;
+- sums and products of units are exact, so totals do not depend on the
+  order they are added in;
+- reported figures are rounded half to even from exact unit totals
+  (`round_units`, `percentage`), as `round()` does on Decimals.
+
+The unit is that fine so that the per-day rounding never shows: 170 h a
+month spread over 22 working days is off by under 1e-8 h for the whole
+month, where centi-hours would report 170.1 h.
+"""
+from __future__ import annotations
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+UNITS_PER_HOUR = 1_000_000_000
+
+_UNITS = Decimal(UNITS_PER_HOUR)
+
+
+def to_units(hours: Decimal | float | int) -> int:
+    """`hours` (or a percentage value) in units, rounded half to even."""
+    if isinstance(hours, int):
+        return hours * UNITS_PER_HOUR
+    if not isinstance(hours, Decimal):
+        hours = Decimal(str(hours))
+    return int((hours * _UNITS).to_integral_value(ROUND_HALF_EVEN))
+
+
+def to_hours(units: int) -> Decimal:
+    """`units` as an exact Decimal number of hours."""
+    return Decimal(units) / _UNITS
+
+
+def div_round(numerator: int, denominator: int) -> int:
+    """`numerator / denominator` rounded half to even; `denominator` != 0."""
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def round_units(units: int, ndigits: int = 1) -> float:
+    """`float(round(hours, ndigits))` for `units`, without a Decimal."""
+    scale = 10**ndigits
+    return div_round(units * scale, UNITS_PER_HOUR) / scale
+
+
+def percentage(part: int, whole: int, ndigits: int = 1) -> float:
+    """`part / whole * 100` rounded to `ndigits`; `whole` != 0.
+
+    Exact for any two figures in the same unit, hours or units alike.
+    """
+    scale = 10**ndigits
+    return div_round(part * 100 * scale, whole) / scale
@@ -18,57 +18,42 @@ def _easter_date(year: int) -> date:
     return date(year, month, day + 1)
 
 
-def get_polish_holidays(year: int) -> list[date]:
-    """Return all Polish public holidays for a given year."""
-    easter = _easter_date(year)
-
-    holidays = [
-        # Fixed holidays
-        date(year, 1, 1),    # Nowy Rok
-        date(year, 1, 6),    # Trzech Króli
-        date(year, 5, 1),    # Święto Pracy
-        date(year, 5, 3),    # Konstytucja 3 Maja
-        date(year, 8, 15),   # Wniebowzięcie NMP
-        date(year, 11, 1),   # Wszystkich Świętych
-        date(year, 11, 11),  # Święto Niepodległości
-        date(year, 12, 25),  # Boże Narodzenie (1. dzień)
-        date(year, 12, 26),  # Boże Narodzenie (2. dzień)
-        # Movable holidays (Easter-dependent)
-        easter,                        # Wielkanoc
-        easter + timedelta(days=1),    # Poniedziałek Wielkanocny
-        easter + timedelta(days=49),   # Zielone Świątki
-        easter + timedelta(days=60),   # Boże Ciało
-    ]
+class PolishHolidays:
+    """Polish public holidays, the default holiday calendar."""
+
+    code = "PL"
+    name = "Polska"
+
+    def holidays(self, year: int) -> dict[date, str]:
+        easter = _easter_date(year)
+        return {
+            # Fixed holidays
+            date(year, 1, 1): "Nowy Rok",
+            date(year, 1, 6): "Trzech Króli",
+            date(year, 5, 1): "Święto Pracy",
+            date(year, 5, 3): "Konstytucja 3 Maja",
+            date(year, 8, 15): "Wniebowzięcie NMP",
+            date(year, 11, 1): "Wszystkich Świętych",
+            date(year, 11, 11): "Święto Niepodległości",
+            date(year, 12, 25): "Boże Narodzenie",
+            date(year, 12, 26): "Boże Narodzenie (2. dzień)",
+            # Movable holidays (Easter-dependent)
+            easter: "Wielkanoc",
+            easter + timedelta(days=1): "Poniedziałek Wielkanocny",
+            easter + timedelta(days=49): "Zielone Świątki",
+            easter + timedelta(days=60): "Boże Ciało",
+        }
 
-    return sorted(holidays)
 
+def get_polish_holidays(year: int) -> list[date]:
+    """Return all Polish public holidays for a given year."""
+    from app.utils.holiday_calendars import holiday_year
 
-HOLIDAY_NAMES: dict[tuple[int, int], str] = {
-    (1, 1): "Nowy Rok",
-    (1, 6): "Trzech Króli",
-    (5, 1): "Święto Pracy",
-    (5, 3): "Konstytucja 3 Maja",
-    (8, 15): "Wniebowzięcie NMP",
-    (11, 1): "Wszystkich Świętych",
-    (11, 11): "Święto Niepodległości",
-    (12, 25): "Boże Narodzenie",
-    (12, 26): "Boże Narodzenie (2. dzień)",
-}
+    return list(holiday_year(year, PolishHolidays.code).ordered)
 
 
 def get_holiday_name(d: date) -> str:
-    """Return the Polish name of a holiday, or empty string if not a named fixed holiday."""
-    name = HOLIDAY_NAMES.get((d.month, d.day))
-    if name:
-        return name
-    # Check movable holidays
-    easter = _easter_date(d.year)
-    if d == easter:
-        return "Wielkanoc"
-    if d == easter + timedelta(days=1):
-        return "Poniedziałek Wielkanocny"
-    if d == easter + timedelta(days=49):
-        return "Zielone Świątki"
-    if d == easter + timedelta(days=60):
-        return "Boże Ciało"
-    return ""
+    """Return the Polish name of a holiday, or empty string if `d` is not one."""
+    from app.utils.holiday_calendars import holiday_name
+
+    return holiday_name(d, PolishHolidays.code)
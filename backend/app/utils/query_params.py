@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from fastapi import HTTPException
 
 
@@ -15,3 +17,22 @@ def parse_id_csv(raw: str) -> list[int]:
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid id value: {part}")
     return ids
+
+
+def parse_choice_csv(raw: str, choices: Sequence[str]) -> list[str]:
+    """Parse a comma-separated list of `choices`, in order and without repeats.
+
+    Raises 400 on a value outside `choices` or when none is given.
+    """
+    values: list[str] = []
+    for part in raw.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if part not in choices:
+            raise HTTPException(status_code=400, detail=f"Invalid value: {part}")
+        if part not in values:
+            values.append(part)
+    if not values:
+        raise HTTPException(status_code=400, detail="Expected one of: " + ", ".join(choices))
+    return values
@@ -0,0 +1,224 @@
+"""Incremental CSV and XLSX encoders for streamed exports.
+
+Both turn rows into bytes as they arrive, so an export can be sent while it
+is still being computed and never has to be held in memory whole. Cells may
+be str, int, float, Decimal, bool, date or None (an empty cell).
+
+XLSX is written with the standard library alone: a workbook is a zip of a few
+fixed XML parts plus the sheet, and `zipfile` can write to a stream it cannot
+seek, so the sheet is compressed and handed out chunk by chunk.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import re
+import zipfile
+from datetime import date
+from decimal import Decimal
+from typing import AsyncIterator, Iterable, Sequence
+from xml.sax.saxutils import escape
+
+# Rows are collected into chunks of about this many bytes before being sent.
+CHUNK_SIZE = 64 * 1024
+
+# Excel's day zero; dates are stored as days since then.
+EXCEL_EPOCH = date(1899, 12, 30)
+
+# A text cell starting with one of these is run as a formula when a CSV is
+# opened in a spreadsheet; such cells are written with a leading apostrophe.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+# Style 0 is the default, style 1 a date (built-in number format 14).
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+    '<borders count="1"><border/></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    "</cellXfs>"
+    "</styleSheet>"
+)
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+# Control characters XML 1.0 cannot represent, even escaped.
+_XML_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _workbook(sheet_name: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{escape(sheet_name[:31], {chr(34): "&quot;"})}" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    )
+
+
+def _xlsx_cell(value) -> str:
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, Decimal)):
+        return f"<c><v>{value}</v></c>"
+    if isinstance(value, date):
+        return f'<c s="1"><v>{(value - EXCEL_EPOCH).days}</v></c>'
+    text = escape(_XML_ILLEGAL.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def xlsx_row(values: Sequence) -> str:
+    """One `<row>` of the sheet; cell positions follow from their order."""
+    return "<row>" + "".join(_xlsx_cell(v) for v in values) + "</row>"
+
+
+class _Drain(io.RawIOBase):
+    """Write-only, unseekable sink whose bytes are taken out as they come."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        return len(data)
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class XlsxWriter:
+    """A one-sheet workbook written row by row.
+
+    `start`, `write_rows` and `close` each return the bytes of the file
+    produced so far that have not been returned yet (possibly none, while
+    the compressor is still filling its window).
+    """
+
+    def __init__(self, sheet_name: str) -> None:
+        self._sink = _Drain()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=zipfile.ZIP_DEFLATED)
+        self._sheet_name = sheet_name
+        self._sheet = None
+
+    def start(self, header: Sequence[str]) -> bytes:
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _workbook(self._sheet_name))
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+        # The sheet's size is unknown up front; zip64 lifts the 4 GB limit.
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write((_SHEET_START + xlsx_row(header)).encode())
+        return self._sink.take()
+
+    def write_rows(self, rows: Iterable[Sequence]) -> bytes:
+        self._sheet.write("".join(xlsx_row(r) for r in rows).encode())
+        return self._sink.take()
+
+    def close(self) -> bytes:
+        self._sheet.write(_SHEET_END.encode())
+        self._sheet.close()
+        self._zip.close()
+        return self._sink.take()
+
+
+def _csv_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_unescape(value: str) -> str:
+    """A text cell as written by `csv_lines`, without its formula guard."""
+    if value.startswith("'") and value[1:].startswith(FORMULA_PREFIXES):
+        return value[1:]
+    return value
+
+
+def csv_lines(rows: Iterable[Sequence]) -> str:
+    """`rows` as CSV text, dates in ISO format and booleans as true/false.
+
+    Text that a spreadsheet would run as a formula (see `FORMULA_PREFIXES`)
+    is prefixed with an apostrophe; `csv_unescape` undoes it.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+    writer.writerows([_csv_value(v) for v in row] for row in rows)
+    return buffer.getvalue()
+
+
+async def stream_csv(
+    header: Sequence[str], batches: AsyncIterator[list[Sequence]]
+) -> AsyncIterator[bytes]:
+    """CSV bytes for `header` and then every row of `batches`.
+
+    Starts with a UTF-8 byte order mark, without which Excel misreads
+    non-ASCII names.
+    """
+    yield ("\ufeff" + csv_lines([header])).encode()
+    pending: list[str] = []
+    size = 0
+    async for rows in batches:
+        text = csv_lines(rows)
+        pending.append(text)
+        size += len(text)
+        if size >= CHUNK_SIZE:
+            yield "".join(pending).encode()
+            pending, size = [], 0
+    if pending:
+        yield "".join(pending).encode()
+
+
+async def stream_xlsx(
+    sheet_name: str, header: Sequence[str], batches: AsyncIterator[list[Sequence]]
+) -> AsyncIterator[bytes]:
+    """XLSX bytes for a one-sheet workbook of `header` and every row of `batches`."""
+    writer = XlsxWriter(sheet_name)
+    yield writer.start(header)
+    async for rows in batches:
+        data = writer.write_rows(rows)
+        if data:
+            yield data
+    yield writer.close()
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import calendar
+import calendar as cal_mod
 from datetime import date, timedelta
 
-from app.utils.polish_holidays import get_polish_holidays
+from app.utils.holiday_calendars import (
+    DEFAULT_CALENDAR,
+    count_working_days,
+    holidays_in_year,
+)
 
 
-def get_working_days_list(start_date: date, end_date: date) -> list[date]:
-    """Return list of working days (Mon-Fri, excluding Polish holidays) in range [start, end]."""
+def get_working_days_list(
+    start_date: date, end_date: date, calendar: str = DEFAULT_CALENDAR
+) -> list[date]:
+    """Return list of working days (Mon-Fri, excluding holidays) in range [start, end]."""
     holidays = set()
     for year in range(start_date.year, end_date.year + 1):
-        holidays.update(get_polish_holidays(year))
+        holidays.update(holidays_in_year(year, calendar))
 
     result = []
     current = start_date
@@ -21,13 +27,41 @@ def get_working_days_list(start_date: date, end_date: date) -> list[date]:
     return result
 
 
-def get_working_days(start_date: date, end_date: date) -> int:
-    """Count working days (Mon-Fri, excluding Polish holidays) in range [start, end]."""
-    return len(get_working_days_list(start_date, end_date))
+def get_working_days(
+    start_date: date, end_date: date, calendar: str = DEFAULT_CALENDAR
+) -> int:
+    """Count working days (Mon-Fri, excluding holidays) in range [start, end].
 
+    Read from the calendar's precomputed running counts rather than counted
+    day by day: daily-hours calculations call this for every hours-based
+    assignment, so it sits on the occupancy hot path.
+    """
+    return count_working_days(start_date, end_date, calendar)
 
-def get_working_days_in_month(year: int, month: int) -> int:
+
+def get_working_days_in_month(
+    year: int, month: int, calendar: str = DEFAULT_CALENDAR
+) -> int:
     """Count working days in a given month."""
     first_day = date(year, month, 1)
-    last_day = date(year, month, calendar.monthrange(year, month)[1])
-    return get_working_days(first_day, last_day)
+    last_day = date(year, month, cal_mod.monthrange(year, month)[1])
+    return count_working_days(first_day, last_day, calendar)
+
+
+def add_working_days(
+    start_date: date, days: int, calendar: str = DEFAULT_CALENDAR
+) -> date:
+    """Return the date `days` working days after `start_date` (before, if negative).
+
+    Counting starts from the day after (before) `start_date`, so a non-working
+    start lands on the first working day in that direction. `days=0` returns
+    `start_date` unchanged.
+    """
+    step = timedelta(days=1 if days >= 0 else -1)
+    remaining = abs(days)
+    current = start_date
+    while remaining:
+        current += step
+        if current.weekday() < 5 and current not in holidays_in_year(current.year, calendar):
+            remaining -= 1
+    return current
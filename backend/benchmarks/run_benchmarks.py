@@ -0,0 +1,449 @@
+"""Benchmarks for the scheduling math hot paths.
+
+Times the pure helpers (working days, daily hours, capacity periods, period
+occupancy) on an in-memory synthetic dataset, and the full `get_timeline`
+handler against an in-memory SQLite database holding the same data, at several
+scales. The timeline's response body is also timed through serialization
+(stdlib encoder vs orjson) and compression, and its size on the wire raw,
+gzipped and brotli-compressed is recorded, next to the columnar format's. Results are written as JSON so runs can be compared between commits:
+
+    python benchmarks/run_benchmarks.py --scales small,medium --output new.json
+    python benchmarks/run_benchmarks.py --output new.json --compare old.json
+
+Timings are per call: each case is repeated until it has run for at least
+--min-time seconds, and min / median / mean are reported. Compare runs made on
+the same machine only.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import calendar
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool  # noqa: E402
+import brotli  # noqa: E402
+import orjson  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.api.calendar import _compute_occupancy_for_period, get_timeline  # noqa: E402
+from app.api.occupancy import get_availability_heatmap  # noqa: E402
+from app.api.projects import get_projects_burn  # noqa: E402
+from app.core.responses import FastJSONResponse  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models.assignment import AllocationType  # noqa: E402
+from app.models.employee import CapacityType  # noqa: E402
+from app.services.assignment_service import calculate_daily_hours  # noqa: E402
+from app.services.capacity_service import build_capacity_periods  # noqa: E402
+from app.utils.polish_holidays import get_polish_holidays  # noqa: E402
+from app.utils.working_days import get_working_days  # noqa: E402
+from scripts.seed_synthetic_data import (  # noqa: E402
+    SyntheticDataset,
+    generate_dataset,
+    insert_dataset,
+)
+
+# (employees, projects, assignments) per scale.
+SCALES: dict[str, tuple[int, int, int]] = {
+    "small": (50, 10, 500),
+    "medium": (500, 50, 5_000),
+    "large": (2_000, 200, 40_000),
+}
+
+# Fixed window so results do not drift with the calendar.
+DATA_START = date(2026, 1, 1)
+DATA_MONTHS = 24
+RANGE_START = date(2026, 1, 1)
+RANGE_END = date(2026, 6, 30)
+# get_timeline is called directly, so FastAPI does not fill in its defaults.
+NO_OCCUPANCY_FILTER = {
+    "min_occupancy": None,
+    "max_occupancy": None,
+    "overbooked_only": False,
+    "occupancy_from": None,
+    "occupancy_to": None,
+    "sort": "name",
+}
+
+
+@dataclass
+class Fixture:
+    """One scale's dataset, as plain objects and (lazily) as a database."""
+
+    scale: str
+    dataset: SyntheticDataset
+    employees: list[SimpleNamespace] = field(default_factory=list)
+    holidays: set[date] = field(default_factory=set)
+    _session_factory: async_sessionmaker[AsyncSession] | None = None
+
+    @classmethod
+    def build(cls, scale: str) -> "Fixture":
+        employees, projects, assignments = SCALES[scale]
+        ds = generate_dataset(
+            employees=employees,
+            projects=projects,
+            assignments=assignments,
+            start_date=DATA_START,
+            months=DATA_MONTHS,
+        )
+        fixture = cls(scale=scale, dataset=ds)
+
+        by_id: dict[int, SimpleNamespace] = {}
+        for row in ds.employees:
+            emp = SimpleNamespace(
+                id=row["id"], capacities=[], assignments=[], vacations=[]
+            )
+            by_id[emp.id] = emp
+            fixture.employees.append(emp)
+        for row in ds.capacities:
+            by_id[row["employee_id"]].capacities.append(
+                SimpleNamespace(
+                    valid_from=row["valid_from"],
+                    capacity_type=CapacityType(row["capacity_type"]),
+                    capacity_value=row["capacity_value"],
+                )
+            )
+        for row in ds.assignments:
+            if row["employee_id"] is not None:
+                by_id[row["employee_id"]].assignments.append(
+                    SimpleNamespace(
+                        start_date=row["start_date"],
+                        end_date=row["end_date"],
+                        allocation_type=AllocationType(row["allocation_type"]),
+                        allocation_value=row["allocation_value"],
+                        is_tentative=row["is_tentative"],
+                    )
+                )
+        for row in ds.vacations:
+            by_id[row["employee_id"]].vacations.append(
+                SimpleNamespace(start_date=row["start_date"], end_date=row["end_date"])
+            )
+        for year in range(RANGE_START.year, RANGE_END.year + 1):
+            fixture.holidays.update(get_polish_holidays(year))
+        return fixture
+
+    async def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            engine = create_async_engine(
+                "sqlite+aiosqlite://", poolclass=StaticPool
+            )
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            factory = async_sessionmaker(engine, expire_on_commit=False)
+            async with factory() as db:
+                await insert_dataset(db, self.dataset)
+                await db.commit()
+            self._session_factory = factory
+        return self._session_factory
+
+
+def measure(fn: Callable[[], object], min_time: float) -> dict:
+    """Time `fn` per call, batching fast calls so timer overhead stays small."""
+    fn()  # warm-up, also primes any lazy caches the way a live worker would
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= 0.01 or number >= 1_000_000:
+            break
+        number *= 10
+
+    samples = [elapsed / number]
+    total = elapsed
+    while total < min_time and len(samples) < 1_000:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        samples.append(elapsed / number)
+        total += elapsed
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "rounds": len(samples),
+        "calls_per_round": number,
+    }
+
+
+def timeline_payload(
+    fixture: Fixture, loop: asyncio.AbstractEventLoop, format: str = "rows"
+) -> dict:
+    """The weekly timeline's response content, as plain JSON data."""
+
+    async def call() -> bytes:
+        factory = await fixture.session_factory()
+        async with factory() as db:
+            response = await get_timeline(
+                start_date=RANGE_START,
+                end_date=RANGE_END,
+                team_ids=None,
+                technology_ids=None,
+                search=None,
+                granularity="weekly",
+                format=format,
+                **NO_OCCUPANCY_FILTER,
+                db=db,
+                _user=None,
+            )
+        return response.body
+
+    return orjson.loads(loop.run_until_complete(call()))
+
+
+def gzip_body(body: bytes) -> bytes:
+    # Same settings as CompressionMiddleware.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+def brotli_body(body: bytes) -> bytes:
+    return brotli.compress(body, quality=4)
+
+
+def wire_sizes(payload: dict, columnar: dict) -> dict[str, int]:
+    """Bytes of the timeline body before and after, uncompressed and compressed."""
+    before = JSONResponse(jsonable_encoder(payload)).body
+    after = FastJSONResponse(payload).body
+    columns = FastJSONResponse(columnar).body
+    return {
+        "stdlib_raw": len(before),
+        "orjson_raw": len(after),
+        "orjson_gzip": len(gzip_body(after)),
+        "orjson_br": len(brotli_body(after)),
+        "columnar_raw": len(columns),
+        "columnar_gzip": len(gzip_body(columns)),
+    }
+
+
+def _busiest(fixture: Fixture) -> SimpleNamespace:
+    return max(fixture.employees, key=lambda e: (len(e.capacities), len(e.assignments)))
+
+
+def cases(fixture: Fixture, loop: asyncio.AbstractEventLoop) -> dict[str, Callable]:
+    """Benchmark cases for one scale, keyed by name."""
+    emp = _busiest(fixture)
+    march = (date(2026, 3, 1), date(2026, 3, 31))
+
+    months = [
+        (date(2026, m, 1), date(2026, m, calendar.monthrange(2026, m)[1]))
+        for m in range(1, 7)
+    ]
+
+    def occupancy_all_employees_monthly() -> None:
+        for e in fixture.employees:
+            for start, end in months:
+                _compute_occupancy_for_period(
+                    e.assignments, e.vacations, start, end, fixture.holidays, e.capacities
+                )
+
+    def timeline(
+        granularity: str, format: str = "rows", **filters
+    ) -> Callable[[], None]:
+        def run() -> None:
+            async def call() -> None:
+                factory = await fixture.session_factory()
+                async with factory() as db:
+                    await get_timeline(
+                        start_date=RANGE_START,
+                        end_date=RANGE_END,
+                        team_ids=None,
+                        technology_ids=None,
+                        search=None,
+                        granularity=granularity,
+                        format=format,
+                        **{**NO_OCCUPANCY_FILTER, **filters},
+                        db=db,
+                        _user=None,
+                    )
+
+            loop.run_until_complete(call())
+
+        return run
+
+    def heatmap_year() -> None:
+        async def call() -> None:
+            factory = await fixture.session_factory()
+            async with factory() as db:
+                await get_availability_heatmap(
+                    start_date=date(2026, 1, 1),
+                    end_date=date(2026, 12, 31),
+                    team_ids=None,
+                    technology_ids=None,
+                    include_tentative=True,
+                    db=db,
+                    _user=None,
+                )
+
+        loop.run_until_complete(call())
+
+    def burn_year(include_assignments: bool) -> Callable[[], None]:
+        def run() -> None:
+            async def call() -> None:
+                factory = await fixture.session_factory()
+                async with factory() as db:
+                    await get_projects_burn(
+                        start_date=date(2026, 1, 1),
+                        end_date=date(2026, 12, 31),
+                        project_status="active",
+                        include_assignments=include_assignments,
+                        db=db,
+                        _user=None,
+                    )
+
+            loop.run_until_complete(call())
+
+        return run
+
+    payload = timeline_payload(fixture, loop)
+    body = FastJSONResponse(payload).body
+
+    result: dict[str, Callable] = {
+        "get_working_days[month]": lambda: get_working_days(*march),
+        "get_working_days[year]": lambda: get_working_days(
+            date(2026, 1, 1), date(2026, 12, 31)
+        ),
+        "calculate_daily_hours[percentage]": lambda: calculate_daily_hours(
+            "percentage", 50, 2026, 3
+        ),
+        "calculate_daily_hours[monthly_hours]": lambda: calculate_daily_hours(
+            "monthly_hours", 120, 2026, 3
+        ),
+        "calculate_daily_hours[total_hours]": lambda: calculate_daily_hours(
+            "total_hours", 480, 2026, 3,
+            start_date=date(2026, 1, 1), end_date=date(2026, 3, 31),
+        ),
+        "build_capacity_periods[year]": lambda: build_capacity_periods(
+            emp.capacities, date(2026, 1, 1), date(2026, 12, 31)
+        ),
+        "compute_occupancy_for_period[busiest_employee_month]": (
+            lambda: _compute_occupancy_for_period(
+                emp.assignments, emp.vacations, *march, fixture.holidays, emp.capacities
+            )
+        ),
+        "compute_occupancy_for_period[all_employees_6_months]": (
+            occupancy_all_employees_monthly
+        ),
+        "get_timeline[monthly_6_months]": timeline("monthly"),
+        "get_timeline[weekly_6_months]": timeline("weekly"),
+        "get_timeline[weekly_6_months_columnar]": timeline("weekly", "columnar"),
+        # Both views in one request, from the same daily load.
+        "get_timeline[monthly_weekly_6_months]": timeline("monthly,weekly"),
+        # "Who is free next month": filtered before serialization.
+        "get_timeline[monthly_6_months_free_next_month]": timeline(
+            "monthly",
+            occupancy_from=date(2026, 7, 1),
+            occupancy_to=date(2026, 7, 31),
+            max_occupancy=50,
+            sort="occupancy_asc",
+        ),
+        "get_availability_heatmap[year]": heatmap_year,
+        "get_projects_burn[year]": burn_year(True),
+        "get_projects_burn[year_projects_only]": burn_year(False),
+        # What the timeline body cost before (jsonable_encoder + json) and now.
+        "timeline_json[stdlib]": lambda: JSONResponse(jsonable_encoder(payload)).body,
+        "timeline_json[orjson]": lambda: FastJSONResponse(payload).body,
+        "timeline_body[gzip]": lambda: gzip_body(body),
+        "timeline_body[br]": lambda: brotli_body(body),
+    }
+    return result
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline_path: str) -> None:
+    """Print the median ratio of each case against a previous run."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    old = {(r["scale"], r["name"]): r["stats"]["median"] for r in baseline["results"]}
+    print(f"\nvs {baseline_path} ({baseline['meta'].get('revision')}):")
+    for r in current["results"]:
+        before = old.get((r["scale"], r["name"]))
+        if before:
+            ratio = r["stats"]["median"] / before
+            print(f"  {r['scale']:<7} {r['name']:<55} {ratio:6.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales", default="small,medium", help=f"comma-separated: {', '.join(SCALES)}"
+    )
+    parser.add_argument("--filter", default="", help="only run cases containing this")
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args()
+
+    report: dict = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": [],
+        "sizes": {},
+    }
+
+    loop = asyncio.new_event_loop()
+    try:
+        for scale in [s.strip() for s in args.scales.split(",") if s.strip()]:
+            fixture = Fixture.build(scale)
+            sizes = wire_sizes(
+                timeline_payload(fixture, loop),
+                timeline_payload(fixture, loop, "columnar"),
+            )
+            report["sizes"][scale] = sizes
+            print(f"{scale:<7} timeline body bytes: " + ", ".join(
+                f"{k}={v:,}" for k, v in sizes.items()
+            ))
+            for name, fn in cases(fixture, loop).items():
+                if args.filter not in name:
+                    continue
+                stats = measure(fn, args.min_time)
+                report["results"].append({"scale": scale, "name": name, "stats": stats})
+                print(f"{scale:<7} {name:<55} {stats['median'] * 1e3:10.3f} ms")
+    finally:
+        loop.close()
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Local stand-in for the Calamari leave API, for offline load tests.
+
+Implements the one endpoint `CalamariClient` calls and answers with a
+deterministic set of approved leaves per employee, so vacation sync does real
+work without network access:
+
+    FAKE_CALAMARI_LATENCY_MS=50 uvicorn loadtest.fake_calamari:app --port 8099
+
+Point the backend at it with CALAMARI_BASE_URL=http://localhost:8099.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from datetime import date, timedelta
+
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+# Simulated upstream latency per request, so sync timings are realistic.
+LATENCY_SECONDS = float(os.environ.get("FAKE_CALAMARI_LATENCY_MS", "20")) / 1000
+LEAVE_TYPES = ["Urlop wypoczynkowy", "Zwolnienie chorobowe", "Inne"]
+
+app = FastAPI(title="Fake Calamari")
+
+
+class FindRequest(BaseModel):
+    start: date = Field(alias="from")
+    end: date = Field(alias="to")
+    employee: str
+
+
+def _leaves_for(email: str, start: date, end: date) -> list[dict]:
+    """Zero to three leaves for `email` inside [start, end], stable per email."""
+    digest = hashlib.sha256(email.lower().encode()).digest()
+    span = max((end - start).days, 1)
+    leaves = []
+    for i in range(digest[0] % 4):
+        leave_start = start + timedelta(days=digest[1 + i] * span // 256)
+        leave_end = min(leave_start + timedelta(days=digest[5 + i] % 10), end)
+        leaves.append(
+            {
+                "id": f"fake-{digest.hex()[:12]}-{i}",
+                "status": "APPROVED",
+                "from": leave_start.isoformat(),
+                "to": leave_end.isoformat(),
+                "absenceTypeName": LEAVE_TYPES[digest[9 + i] % len(LEAVE_TYPES)],
+            }
+        )
+    return leaves
+
+
+@app.post("/api/leave/request/v1/find")
+async def find_leaves(body: FindRequest) -> list[dict]:
+    if LATENCY_SECONDS:
+        await asyncio.sleep(LATENCY_SECONDS)
+    return _leaves_for(body.employee, body.start, body.end)
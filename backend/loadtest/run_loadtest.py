@@ -0,0 +1,353 @@
+"""End-to-end HTTP load test against a running backend.
+
+Runs each scenario for a fixed duration with a fixed number of concurrent
+virtual users (closed loop: every user sends its next request as soon as the
+previous one returns) and reports throughput and p50/p95/p99 latency:
+
+    python loadtest/run_loadtest.py --base-url http://localhost:8001 \\
+        --concurrency 20 --duration 30 --output report.json
+
+`loadtest/run_local.sh` sets up everything offline (Postgres in Docker,
+synthetic data, a fake Calamari and the API) and then calls this script.
+Scenarios that mutate data restore what they changed, outside the timing.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+
+TIMELINE_MONTHS = 6
+# How often a background job is polled for its outcome.
+JOB_POLL_SECONDS = 0.1
+
+
+@dataclass
+class ScenarioStats:
+    """Latencies and outcomes for one scenario run."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_counts: dict[int, int] = field(default_factory=dict)
+
+    def record(self, status_code: int, elapsed: float) -> None:
+        self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+        if status_code >= 400:
+            self.errors += 1
+        else:
+            self.latencies.append(elapsed)
+
+    def summary(self, wall_time: float) -> dict:
+        requests = sum(self.status_counts.values())
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "throughput_rps": round(requests / wall_time, 2) if wall_time else 0.0,
+            "latency_ms": latency_percentiles(self.latencies),
+            "status_counts": {str(k): v for k, v in sorted(self.status_counts.items())},
+        }
+
+
+def latency_percentiles(latencies: list[float]) -> dict:
+    """p50/p95/p99/max in milliseconds; empty when nothing succeeded."""
+    if not latencies:
+        return {}
+    ms = sorted(x * 1000 for x in latencies)
+    if len(ms) == 1:
+        p = [ms[0]] * 99
+    else:
+        p = statistics.quantiles(ms, n=100, method="inclusive")
+    return {
+        "p50": round(p[49], 2),
+        "p95": round(p[94], 2),
+        "p99": round(p[98], 2),
+        "max": round(ms[-1], 2),
+        "mean": round(statistics.fmean(ms), 2),
+    }
+
+
+class Context:
+    """Shared state for scenarios: authenticated client and sample ids."""
+
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace):
+        self.client = client
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.range_start = date.fromisoformat(args.start_date)
+        self.range_end = self.range_start + timedelta(days=TIMELINE_MONTHS * 31 - 1)
+        # Assignments the mutating scenarios may touch. Each is checked out by
+        # one virtual user at a time, so restoring it afterwards is safe.
+        self.assignments: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def setup(self) -> None:
+        response = await self.client.post(
+            "/api/auth/login",
+            json={"email": self.args.email, "password": self.args.password},
+        )
+        response.raise_for_status()
+        token = response.json()["access_token"]
+        self.client.headers["Authorization"] = f"Bearer {token}"
+
+        response = await self.client.get(
+            "/api/assignments",
+            params={
+                "date_from": self.range_start.isoformat(),
+                "date_to": self.range_end.isoformat(),
+            },
+        )
+        response.raise_for_status()
+        # Splittable ones only: both halves need a working day.
+        candidates = [
+            a
+            for a in response.json()
+            if (date.fromisoformat(a["end_date"]) - date.fromisoformat(a["start_date"])).days >= 7
+        ]
+        self.rng.shuffle(candidates)
+        for a in candidates:
+            self.assignments.put_nowait(a)
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[dict]:
+        assignment = await self.assignments.get()
+        try:
+            yield assignment
+        finally:
+            self.assignments.put_nowait(assignment)
+
+    def timeline_params(self, granularity: str) -> dict:
+        return {
+            "start_date": self.range_start.isoformat(),
+            "end_date": self.range_end.isoformat(),
+            "granularity": granularity,
+        }
+
+
+async def timed(
+    stats: ScenarioStats, request: Awaitable[httpx.Response]
+) -> httpx.Response:
+    started = time.perf_counter()
+    response = await request
+    stats.record(response.status_code, time.perf_counter() - started)
+    return response
+
+
+async def scenario_login(ctx: Context, stats: ScenarioStats) -> None:
+    # Needs LOGIN_RATE_LIMIT_ATTEMPTS raised on the server, or most requests
+    # are answered 429 after the first ten in a minute.
+    await timed(
+        stats,
+        ctx.client.post(
+            "/api/auth/login",
+            json={"email": ctx.args.email, "password": ctx.args.password},
+        ),
+    )
+
+
+async def scenario_timeline_monthly(ctx: Context, stats: ScenarioStats) -> None:
+    await timed(
+        stats,
+        ctx.client.get("/api/assignments/timeline", params=ctx.timeline_params("monthly")),
+    )
+
+
+async def scenario_timeline_weekly(ctx: Context, stats: ScenarioStats) -> None:
+    await timed(
+        stats,
+        ctx.client.get("/api/assignments/timeline", params=ctx.timeline_params("weekly")),
+    )
+
+
+async def scenario_project_timeline(ctx: Context, stats: ScenarioStats) -> None:
+    await timed(
+        stats,
+        ctx.client.get(
+            "/api/projects/timeline",
+            params={
+                "start_date": ctx.range_start.isoformat(),
+                "end_date": ctx.range_end.isoformat(),
+            },
+        ),
+    )
+
+
+async def scenario_drag_assignment(ctx: Context, stats: ScenarioStats) -> None:
+    """Move an assignment by a week, as a drag on the timeline does, then back."""
+    async with ctx.checkout() as original:
+        start = date.fromisoformat(original["start_date"])
+        end = date.fromisoformat(original["end_date"])
+        shift = timedelta(days=7)
+        await timed(
+            stats,
+            ctx.client.patch(
+                f"/api/assignments/{original['id']}",
+                json={
+                    "start_date": (start + shift).isoformat(),
+                    "end_date": (end + shift).isoformat(),
+                },
+            ),
+        )
+        await ctx.client.patch(
+            f"/api/assignments/{original['id']}",
+            json={"start_date": start.isoformat(), "end_date": end.isoformat()},
+        )
+
+
+async def scenario_split_assignment(ctx: Context, stats: ScenarioStats) -> None:
+    """Split an assignment in the middle, then merge it back untimed."""
+    async with ctx.checkout() as original:
+        start = date.fromisoformat(original["start_date"])
+        end = date.fromisoformat(original["end_date"])
+        split_date = start + (end - start) / 2
+        response = await timed(
+            stats,
+            ctx.client.post(
+                f"/api/assignments/{original['id']}/split",
+                params={"split_date": split_date.isoformat()},
+            ),
+        )
+        if response.status_code == 200:
+            _, second = response.json()
+            await ctx.client.delete(f"/api/assignments/{second['id']}")
+            await ctx.client.patch(
+                f"/api/assignments/{original['id']}", json={"end_date": end.isoformat()}
+            )
+
+
+async def scenario_vacation_sync(ctx: Context, stats: ScenarioStats) -> None:
+    """Queue a vacation sync and wait for its job, as the admin button does.
+
+    The endpoint only enqueues the job (202), so the time recorded is from
+    the request until polling `GET /api/jobs/{id}` sees the job finish. A
+    failed job counts as an error (500).
+    """
+    started = time.perf_counter()
+    response = await ctx.client.post("/api/calendar/vacations/sync")
+    if response.status_code != 202:
+        stats.record(response.status_code, time.perf_counter() - started)
+        return
+    job_id = response.json()["id"]
+    while True:
+        response = await ctx.client.get(f"/api/jobs/{job_id}")
+        if response.status_code != 200:
+            stats.record(response.status_code, time.perf_counter() - started)
+            return
+        job_status = response.json()["status"]
+        if job_status in ("succeeded", "failed"):
+            stats.record(
+                200 if job_status == "succeeded" else 500,
+                time.perf_counter() - started,
+            )
+            return
+        if time.perf_counter() - started > ctx.args.timeout:
+            stats.record(599, time.perf_counter() - started)
+            return
+        await asyncio.sleep(JOB_POLL_SECONDS)
+
+
+SCENARIOS: dict[str, Callable[[Context, ScenarioStats], Awaitable[None]]] = {
+    "login": scenario_login,
+    "timeline_monthly": scenario_timeline_monthly,
+    "timeline_weekly": scenario_timeline_weekly,
+    "project_timeline": scenario_project_timeline,
+    "drag_assignment": scenario_drag_assignment,
+    "split_assignment": scenario_split_assignment,
+    "vacation_sync": scenario_vacation_sync,
+}
+
+
+async def run_scenario(
+    ctx: Context, name: str, concurrency: int, duration: float
+) -> dict:
+    scenario = SCENARIOS[name]
+    stats = ScenarioStats()
+    deadline = time.perf_counter() + duration
+
+    async def user() -> None:
+        while time.perf_counter() < deadline:
+            try:
+                await scenario(ctx, stats)
+            except httpx.HTTPError:
+                stats.record(599, 0.0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return stats.summary(time.perf_counter() - started)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits
+    ) as client:
+        ctx = Context(client, args)
+        await ctx.setup()
+        report: dict = {
+            "meta": {
+                "base_url": args.base_url,
+                "concurrency": args.concurrency,
+                "duration_s": args.duration,
+                "python": platform.python_version(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+            "scenarios": {},
+        }
+        for name in names:
+            if name in ("drag_assignment", "split_assignment") and ctx.assignments.empty():
+                print(f"{name:<18} skipped: no assignments in range")
+                continue
+            # Vacation sync holds the Calamari round-trips for every employee;
+            # one at a time is what the admin button does.
+            concurrency = 1 if name == "vacation_sync" else args.concurrency
+            result = await run_scenario(ctx, name, concurrency, args.duration)
+            report["scenarios"][name] = result
+            lat = result["latency_ms"]
+            print(
+                f"{name:<18} {result['requests']:>7} req  {result['errors']:>5} err  "
+                f"{result['throughput_rps']:>8.1f} rps  "
+                f"p50 {lat.get('p50', 0):>8.1f}  p95 {lat.get('p95', 0):>8.1f}  "
+                f"p99 {lat.get('p99', 0):>8.1f} ms"
+            )
+        return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--email", default="admin@workforce.local")
+    parser.add_argument("--password", default="Admin123!")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per scenario")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument(
+        "--start-date",
+        default=date(date.today().year, 1, 1).isoformat(),
+        help="first day of the timeline window the scenarios open",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="loadtest_report.json")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
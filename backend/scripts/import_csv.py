@@ -0,0 +1,64 @@
+"""Import assignments or employees from a CSV file.
+
+    python scripts/import_csv.py assignments plan.csv
+    python scripts/import_csv.py employees people.csv --dry-run
+
+Runs the same validation and loading as the /api/import endpoints: the file
+is written in one transaction, or not at all if any row is invalid.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.import_service import (  # noqa: E402
+    ImportFileError,
+    import_assignments,
+    import_employees,
+)
+
+IMPORTERS = {"assignments": import_assignments, "employees": import_employees}
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=sorted(IMPORTERS))
+    parser.add_argument("path")
+    parser.add_argument("--dry-run", action="store_true", help="validate only")
+    args = parser.parse_args()
+
+    from app.database import async_session_factory
+
+    with open(args.path, "rb") as f:
+        data = f.read()
+
+    started = time.perf_counter()
+    async with async_session_factory() as db:
+        try:
+            result = await IMPORTERS[args.kind](db, data, dry_run=args.dry_run)
+        except ImportFileError as exc:
+            print(f"{args.path}: {exc}", file=sys.stderr)
+            return 1
+        if result.errors:
+            for e in result.errors:
+                column = f" [{e.column}]" if e.column else ""
+                print(f"{args.path}:{e.row}{column}: {e.detail}", file=sys.stderr)
+            print(f"{len(result.errors)} errors in {result.rows} rows, nothing imported")
+            return 1
+        await db.commit()
+
+    elapsed = time.perf_counter() - started
+    if args.dry_run:
+        print(f"{result.rows} rows valid ({elapsed:.1f}s), nothing written")
+    else:
+        print(f"Imported {result.created} {args.kind} in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -13,24 +13,25 @@ from app.database import async_session_factory
 from app.models.employee import Employee, Team
 from app.models.project import Project
 from app.models.assignment import Assignment, AllocationType
+from app.services.capacity_service import baseline_capacity
 
 
 EMPLOYEES = [
-    ("Jan", "Kowalski", Team.Frontend),
-    ("Anna", "Nowak", Team.Frontend),
-    ("Piotr", "Wiśniewski", Team.Backend),
-    ("Maria", "Wójcik", Team.Backend),
-    ("Tomasz", "Kamiński", Team.Backend),
-    ("Katarzyna", "Lewandowska", Team.QA),
-    ("Michał", "Zieliński", Team.QA),
-    ("Agnieszka", "Szymańska", Team.PM),
-    ("Robert", "Woźniak", Team.PM),
-    ("Ewa", "Dąbrowska", Team.UX_UI_Designer),
-    ("Paweł", "Kozłowski", Team.Mobile),
-    ("Joanna", "Jankowska", Team.Mobile),
-    ("Krzysztof", "Mazur", Team.DevOps),
-    ("Magdalena", "Krawczyk", Team.Frontend),
-    ("Łukasz", "Piotrowski", Team.Backend),
+    ("Jan", "Kowalski", "Frontend"),
+    ("Anna", "Nowak", "Frontend"),
+    ("Piotr", "Wiśniewski", "Backend"),
+    ("Maria", "Wójcik", "Backend"),
+    ("Tomasz", "Kamiński", "Backend"),
+    ("Katarzyna", "Lewandowska", "QA"),
+    ("Michał", "Zieliński", "QA"),
+    ("Agnieszka", "Szymańska", "PM"),
+    ("Robert", "Woźniak", "PM"),
+    ("Ewa", "Dąbrowska", "UX/UI"),
+    ("Paweł", "Kozłowski", "Mobile"),
+    ("Joanna", "Jankowska", "Mobile"),
+    ("Krzysztof", "Mazur", "DevOps"),
+    ("Magdalena", "Krawczyk", "Frontend"),
+    ("Łukasz", "Piotrowski", "Backend"),
 ]
 
 PROJECTS = [
@@ -50,10 +51,24 @@ async def main():
             print("Data already exists. Delete existing data first or use a fresh DB.")
             return
 
+        # Create teams (reusing any that already exist)
+        team_names = sorted({team for _, _, team in EMPLOYEES})
+        result = await db.execute(select(Team).where(Team.name.in_(team_names)))
+        teams = {t.name: t for t in result.scalars().all()}
+        for name in team_names:
+            if name not in teams:
+                teams[name] = Team(name=name)
+                db.add(teams[name])
+
         # Create employees
         employees = []
         for first, last, team in EMPLOYEES:
-            emp = Employee(first_name=first, last_name=last, team=team)
+            emp = Employee(
+                first_name=first,
+                last_name=last,
+                team=teams[team],
+                capacities=[baseline_capacity()],
+            )
             db.add(emp)
             employees.append(emp)
         await db.flush()
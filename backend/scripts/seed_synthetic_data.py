@@ -0,0 +1,364 @@
+"""Seed a large synthetic dataset for performance testing.
+
+Generates employees with teams, technologies and capacity histories, projects,
+a realistic mix of assignments (all three allocation types, tentative work and
+placeholders) and vacations, then loads everything with multi-row INSERTs.
+
+    python scripts/seed_synthetic_data.py --employees 5000 --assignments 200000
+
+The generator is deterministic for a given --seed, and `generate_dataset` is
+importable on its own so benchmarks can build the same data in memory without
+a database.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import func, insert, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app.models import (  # noqa: E402
+    Assignment,
+    Employee,
+    EmployeeCapacity,
+    Project,
+    Team,
+    Technology,
+    Vacation,
+    employee_technologies,
+)
+from app.services.capacity_service import BASELINE_VALID_FROM  # noqa: E402
+from app.utils.polish_holidays import get_polish_holidays  # noqa: E402
+
+TEAMS = [
+    "Frontend", "Backend", "QA", "PM", "Mobile", "UX/UI", "DevOps",
+    "Data", "BA", "ML",
+]
+
+TECHNOLOGIES = [
+    "React", "TypeScript", "Vue", "Angular", "Python", "Django", "FastAPI",
+    "Java", "Spring", "Kotlin", "Swift", "Flutter", "Go", "Rust", "C#",
+    ".NET", "Node.js", "PostgreSQL", "AWS", "Azure", "GCP", "Kubernetes",
+    "Terraform", "Figma", "Selenium",
+]
+
+FIRST_NAMES = [
+    "Jan", "Anna", "Piotr", "Maria", "Tomasz", "Katarzyna", "Michał",
+    "Agnieszka", "Robert", "Ewa", "Paweł", "Joanna", "Krzysztof", "Magdalena",
+    "Łukasz", "Aleksandra", "Marcin", "Monika", "Grzegorz", "Natalia",
+    "Adam", "Karolina", "Jakub", "Zofia", "Mateusz", "Julia", "Kamil",
+    "Weronika", "Bartosz", "Barbara",
+]
+
+LAST_NAMES = [
+    "Kowalski", "Nowak", "Wiśniewski", "Wójcik", "Kamiński", "Lewandowski",
+    "Zieliński", "Szymański", "Woźniak", "Dąbrowski", "Kozłowski", "Jankowski",
+    "Mazur", "Krawczyk", "Piotrowski", "Grabowski", "Nowakowski", "Pawłowski",
+    "Michalski", "Adamczyk", "Dudek", "Zając", "Wieczorek", "Jabłoński",
+    "Król", "Majewski", "Olszewski", "Jaworski", "Wróbel", "Malinowski",
+]
+
+PROJECT_WORDS = [
+    "Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta", "Theta",
+    "Iota", "Kappa", "Lambda", "Sigma", "Omega", "Orion", "Vega", "Atlas",
+]
+
+LEAVE_TYPES = ["urlop", "urlop", "urlop", "chorobowe", "inne"]
+
+PERCENTAGE_VALUES = [10, 20, 25, 30, 40, 50, 50, 60, 75, 80, 100, 100]
+MONTHLY_HOURS_VALUES = [20, 40, 60, 80, 100, 120, 160]
+
+# Share of assignments per allocation type: mostly percentages, as in practice.
+ALLOCATION_WEIGHTS = {"percentage": 70, "monthly_hours": 20, "total_hours": 10}
+
+
+@dataclass
+class SyntheticDataset:
+    """Rows for every table, keyed by column name, with explicit ids.
+
+    Explicit ids let related rows reference each other without a round-trip
+    per insert; `insert_dataset` moves the sequences past them afterwards.
+    """
+
+    teams: list[dict] = field(default_factory=list)
+    technologies: list[dict] = field(default_factory=list)
+    employees: list[dict] = field(default_factory=list)
+    employee_technologies: list[dict] = field(default_factory=list)
+    capacities: list[dict] = field(default_factory=list)
+    projects: list[dict] = field(default_factory=list)
+    assignments: list[dict] = field(default_factory=list)
+    vacations: list[dict] = field(default_factory=list)
+
+
+class _WorkingDayIndex:
+    """Working days of the generation window, with O(1) range counts."""
+
+    def __init__(self, start: date, end: date):
+        holidays: set[date] = set()
+        for year in range(start.year, end.year + 1):
+            holidays.update(get_polish_holidays(year))
+        self.start = start
+        self.days: list[date] = []
+        # prefix[i] = working days in [start, start + i)
+        self.prefix = [0]
+        d = start
+        while d <= end:
+            if d.weekday() < 5 and d not in holidays:
+                self.days.append(d)
+            self.prefix.append(len(self.days))
+            d += timedelta(days=1)
+
+    def count(self, start: date, end: date) -> int:
+        return (
+            self.prefix[(end - self.start).days + 1]
+            - self.prefix[(start - self.start).days]
+        )
+
+
+def generate_dataset(
+    employees: int = 500,
+    projects: int = 50,
+    assignments: int = 5000,
+    start_date: date | None = None,
+    months: int = 24,
+    placeholder_ratio: float = 0.02,
+    tentative_ratio: float = 0.1,
+    part_time_ratio: float = 0.15,
+    late_start_ratio: float = 0.05,
+    vacations_per_employee: int = 3,
+    seed: int = 42,
+) -> SyntheticDataset:
+    """Build a deterministic synthetic dataset in memory.
+
+    Assignments start on working days, so each one satisfies the API's
+    "at least one working day" rule, and `total_hours` budgets are sized from
+    the real working-day count so daily figures stay plausible.
+    """
+    rng = random.Random(seed)
+    start_date = start_date or date(date.today().year, 1, 1)
+    end_date = start_date + timedelta(days=round(months * 30.44))
+    calendar = _WorkingDayIndex(start_date, end_date)
+    ds = SyntheticDataset()
+
+    ds.teams = [{"id": i + 1, "name": name} for i, name in enumerate(TEAMS)]
+    ds.technologies = [
+        {"id": i + 1, "name": name} for i, name in enumerate(TECHNOLOGIES)
+    ]
+
+    capacity_id = 0
+    for emp_id in range(1, employees + 1):
+        first = FIRST_NAMES[(emp_id - 1) % len(FIRST_NAMES)]
+        last_index = (emp_id - 1) // len(FIRST_NAMES)
+        last = LAST_NAMES[last_index % len(LAST_NAMES)]
+        # Names must stay unique (the API enforces it); suffix once the
+        # first x last combinations run out.
+        generation = last_index // len(LAST_NAMES)
+        if generation:
+            last = f"{last}-{generation + 1}"
+        ds.employees.append(
+            {
+                "id": emp_id,
+                "first_name": first,
+                "last_name": last,
+                "team_id": rng.choice(ds.teams)["id"] if rng.random() > 0.03 else None,
+                "email": f"employee{emp_id}@example.com",
+                "is_archived": False,
+            }
+        )
+        for tech in rng.sample(ds.technologies, rng.randint(1, 4)):
+            ds.employee_technologies.append(
+                {"employee_id": emp_id, "technology_id": tech["id"]}
+            )
+
+        # Capacity history: full time from always, optionally starting late
+        # (employment start inside the window) and/or going part time later.
+        first_from = BASELINE_VALID_FROM
+        if rng.random() < late_start_ratio:
+            first_from = rng.choice(calendar.days[: len(calendar.days) // 2])
+        capacity_id += 1
+        ds.capacities.append(
+            {
+                "id": capacity_id,
+                "employee_id": emp_id,
+                "valid_from": first_from,
+                "capacity_type": "percentage",
+                "capacity_value": Decimal("100"),
+            }
+        )
+        if rng.random() < part_time_ratio:
+            change = rng.choice(calendar.days)
+            if change > first_from:
+                capacity_id += 1
+                if rng.random() < 0.7:
+                    cap_type, cap_value = "percentage", rng.choice([50, 60, 75, 80])
+                else:
+                    cap_type, cap_value = "monthly_hours", rng.choice([40, 80, 120])
+                ds.capacities.append(
+                    {
+                        "id": capacity_id,
+                        "employee_id": emp_id,
+                        "valid_from": change,
+                        "capacity_type": cap_type,
+                        "capacity_value": Decimal(cap_value),
+                    }
+                )
+
+    for proj_id in range(1, projects + 1):
+        word = PROJECT_WORDS[(proj_id - 1) % len(PROJECT_WORDS)]
+        ds.projects.append(
+            {
+                "id": proj_id,
+                "name": f"Projekt {word} {proj_id}",
+                "color": f"#{rng.randrange(0x1000000):06X}",
+                "is_archived": False,
+            }
+        )
+
+    types = list(ALLOCATION_WEIGHTS)
+    weights = list(ALLOCATION_WEIGHTS.values())
+    last_day = calendar.days[-1]
+    for a_id in range(1, assignments + 1):
+        start = rng.choice(calendar.days)
+        length = rng.randint(5, 180)
+        end = min(start + timedelta(days=length), last_day)
+        alloc_type = rng.choices(types, weights)[0]
+        if alloc_type == "percentage":
+            value = Decimal(rng.choice(PERCENTAGE_VALUES))
+        elif alloc_type == "monthly_hours":
+            value = Decimal(rng.choice(MONTHLY_HOURS_VALUES))
+        else:
+            hours_per_day = rng.choice([2, 4, 4, 6, 8])
+            value = Decimal(calendar.count(start, end) * hours_per_day)
+        is_placeholder = rng.random() < placeholder_ratio
+        ds.assignments.append(
+            {
+                "id": a_id,
+                "employee_id": None if is_placeholder else rng.randint(1, employees),
+                "project_id": rng.randint(1, projects),
+                "start_date": start,
+                "end_date": end,
+                "allocation_type": alloc_type,
+                "allocation_value": value,
+                "note": None,
+                "is_tentative": rng.random() < tentative_ratio,
+            }
+        )
+
+    vac_id = 0
+    for emp in ds.employees:
+        for _ in range(rng.randint(0, vacations_per_employee * 2)):
+            vac_id += 1
+            start = rng.choice(calendar.days)
+            end = start + timedelta(days=rng.randint(0, 13))
+            ds.vacations.append(
+                {
+                    "id": vac_id,
+                    "employee_id": emp["id"],
+                    "employee_email": emp["email"],
+                    "start_date": start,
+                    "end_date": end,
+                    "leave_type": rng.choice(LEAVE_TYPES),
+                    "calamari_id": f"synthetic-{vac_id}",
+                }
+            )
+
+    return ds
+
+
+async def insert_dataset(
+    db: AsyncSession, ds: SyntheticDataset, batch_size: int = 5000
+) -> None:
+    """Bulk-insert a dataset in dependency order. Does not commit."""
+    tables = [
+        (Team.__table__, ds.teams),
+        (Technology.__table__, ds.technologies),
+        (Employee.__table__, ds.employees),
+        (employee_technologies, ds.employee_technologies),
+        (EmployeeCapacity.__table__, ds.capacities),
+        (Project.__table__, ds.projects),
+        (Assignment.__table__, ds.assignments),
+        (Vacation.__table__, ds.vacations),
+    ]
+    for table, rows in tables:
+        for i in range(0, len(rows), batch_size):
+            await db.execute(insert(table), rows[i : i + batch_size])
+
+    # Rows were inserted with explicit ids, so move each serial sequence past
+    # them; otherwise the next row created through the API would collide.
+    if db.bind.dialect.name == "postgresql":
+        for table, rows in tables:
+            if rows and "id" in table.c:
+                await db.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                        f"(SELECT MAX(id) FROM {table.name}))"
+                    )
+                )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=5000)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--assignments", type=int, default=200_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        default=None,
+        help="first day of the generated window (default: 1 January this year)",
+    )
+    parser.add_argument("--placeholder-ratio", type=float, default=0.02)
+    parser.add_argument("--tentative-ratio", type=float, default=0.1)
+    parser.add_argument("--part-time-ratio", type=float, default=0.15)
+    parser.add_argument("--vacations-per-employee", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from app.database import async_session_factory
+
+    started = time.perf_counter()
+    ds = generate_dataset(
+        employees=args.employees,
+        projects=args.projects,
+        assignments=args.assignments,
+        start_date=args.start_date,
+        months=args.months,
+        placeholder_ratio=args.placeholder_ratio,
+        tentative_ratio=args.tentative_ratio,
+        part_time_ratio=args.part_time_ratio,
+        vacations_per_employee=args.vacations_per_employee,
+        seed=args.seed,
+    )
+    generated = time.perf_counter()
+    print(f"Generated dataset in {generated - started:.1f}s")
+
+    async with async_session_factory() as db:
+        existing = await db.execute(select(func.count()).select_from(Employee))
+        if existing.scalar_one():
+            print("Data already exists. Delete existing data first or use a fresh DB.")
+            return
+
+        await insert_dataset(db, ds, batch_size=args.batch_size)
+        await db.commit()
+
+    print(
+        f"Inserted {len(ds.employees)} employees, {len(ds.capacities)} capacity "
+        f"periods, {len(ds.projects)} projects, {len(ds.assignments)} assignments "
+        f"and {len(ds.vacations)} vacations in {time.perf_counter() - generated:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,167 @@
+"""Tests for bulk assignment operations (POST /api/assignments/bulk).
+
+Schema-level tests plus the per-operation helper, run against in-memory
+Assignment objects and plain id -> row maps (no DB).
+"""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+
+from app.api.assignments import _apply_bulk_operation
+from app.models.assignment import AllocationType, Assignment
+from app.schemas.assignment import (
+    MAX_BULK_OPERATIONS,
+    BulkAssignmentRequest,
+    BulkCreateOperation,
+    BulkDeleteOperation,
+    BulkOperation,
+    BulkSplitOperation,
+    BulkUpdateOperation,
+)
+
+_op = TypeAdapter(BulkOperation).validate_python
+
+
+def _assignment(id=1, **overrides):
+    fields = {
+        "id": id,
+        "employee_id": 1,
+        "project_id": 1,
+        "start_date": date(2026, 3, 2),
+        "end_date": date(2026, 3, 31),
+        "allocation_type": AllocationType.percentage,
+        "allocation_value": Decimal("50"),
+        "note": None,
+        "is_tentative": False,
+    }
+    fields.update(overrides)
+    return Assignment(**fields)
+
+
+def _row(id, is_archived=False):
+    return SimpleNamespace(id=id, is_archived=is_archived)
+
+
+def _create(**overrides):
+    body = {
+        "op": "create",
+        "employee_id": 1,
+        "project_id": 1,
+        "start_date": "2026-04-01",
+        "end_date": "2026-04-30",
+        "allocation_type": "percentage",
+        "allocation_value": 100,
+    }
+    body.update(overrides)
+    return _op(body)
+
+
+class TestBulkSchema:
+    def test_op_selects_operation_type(self):
+        assert isinstance(_create(), BulkCreateOperation)
+        assert isinstance(_op({"op": "update", "id": 1}), BulkUpdateOperation)
+        assert isinstance(_op({"op": "delete", "id": 1}), BulkDeleteOperation)
+        assert isinstance(
+            _op({"op": "split", "id": 1, "split_date": "2026-03-16"}), BulkSplitOperation
+        )
+
+    def test_unknown_op_rejected(self):
+        with pytest.raises(ValidationError):
+            _op({"op": "merge", "id": 1})
+
+    def test_create_keeps_single_item_validation(self):
+        with pytest.raises(ValidationError):
+            _create(allocation_value=0)
+
+    def test_update_keeps_explicit_null_employee(self):
+        op = _op({"op": "update", "id": 1, "employee_id": None})
+        assert "employee_id" in op.model_fields_set
+
+    def test_empty_and_oversized_batches_rejected(self):
+        with pytest.raises(ValidationError):
+            BulkAssignmentRequest(operations=[])
+        with pytest.raises(ValidationError):
+            BulkAssignmentRequest(
+                operations=[{"op": "delete", "id": i} for i in range(MAX_BULK_OPERATIONS + 1)]
+            )
+
+
+class TestApplyBulkOperation:
+    def test_create_builds_unsaved_assignment(self):
+        (created,) = _apply_bulk_operation(_create(), {}, {1: _row(1)}, {1: _row(1)})
+        assert created.id is None
+        assert created.start_date == date(2026, 4, 1)
+
+    def test_create_placeholder_skips_employee_check(self):
+        (created,) = _apply_bulk_operation(
+            _create(employee_id=None), {}, {}, {1: _row(1)}
+        )
+        assert created.employee_id is None
+
+    @pytest.mark.parametrize(
+        "employees,projects,status",
+        [
+            ({}, {1: _row(1)}, 404),
+            ({1: _row(1, is_archived=True)}, {1: _row(1)}, 409),
+            ({1: _row(1)}, {}, 404),
+            ({1: _row(1)}, {1: _row(1, is_archived=True)}, 409),
+        ],
+    )
+    def test_create_guards_match_single_endpoint(self, employees, projects, status):
+        with pytest.raises(HTTPException) as exc:
+            _apply_bulk_operation(_create(), {}, employees, projects)
+        assert exc.value.status_code == status
+
+    def test_create_without_working_day_rejected(self):
+        # 2026-04-04/05 is a weekend.
+        with pytest.raises(HTTPException) as exc:
+            _apply_bulk_operation(
+                _create(start_date="2026-04-04", end_date="2026-04-05"),
+                {},
+                {1: _row(1)},
+                {1: _row(1)},
+            )
+        assert exc.value.status_code == 400
+
+    def test_unknown_assignment_is_404(self):
+        with pytest.raises(HTTPException) as exc:
+            _apply_bulk_operation(_op({"op": "delete", "id": 9}), {}, {}, {})
+        assert exc.value.status_code == 404
+
+    def test_update_applies_fields(self):
+        a = _assignment()
+        op = _op({"op": "update", "id": 1, "employee_id": None, "note": "  x  "})
+        assert _apply_bulk_operation(op, {1: a}, {}, {}) == [a]
+        assert a.employee_id is None
+        assert a.note == "x"
+
+    def test_failed_update_leaves_assignment_untouched(self):
+        """Validation runs before any field is changed."""
+        a = _assignment()
+        op = _op({"op": "update", "id": 1, "end_date": "2026-03-01", "note": "x"})
+        with pytest.raises(HTTPException):
+            _apply_bulk_operation(op, {1: a}, {}, {})
+        assert a.end_date == date(2026, 3, 31)
+        assert a.note is None
+
+    def test_split_returns_both_halves(self):
+        a = _assignment()
+        op = _op({"op": "split", "id": 1, "split_date": "2026-03-16"})
+        first, second = _apply_bulk_operation(op, {1: a}, {}, {})
+        assert first is a
+        assert first.end_date == date(2026, 3, 15)
+        assert second.start_date == date(2026, 3, 16)
+        assert second.end_date == date(2026, 3, 31)
+
+    def test_later_operations_see_delete(self):
+        a = _assignment()
+        assignments = {1: a}
+        assert _apply_bulk_operation(_op({"op": "delete", "id": 1}), assignments, {}, {}) == [a]
+        with pytest.raises(HTTPException) as exc:
+            _apply_bulk_operation(_op({"op": "update", "id": 1}), assignments, {}, {})
+        assert exc.value.status_code == 404
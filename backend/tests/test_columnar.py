@@ -0,0 +1,136 @@
+"""Tests for the timelines' columnar format (app.services.columnar_service)."""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.api.calendar import _serialize_timeline_assignment
+from app.models.assignment import AllocationType
+from app.models.employee import CapacityType
+from app.services.columnar_service import ProjectTimelineColumns, TimelineColumns
+
+ORIGIN = date(2026, 3, 1)
+ALPHA = SimpleNamespace(id=5, name="Alpha", color="#3B82F6")
+BETA = SimpleNamespace(id=6, name="Beta", color="#10B981")
+BACKEND = SimpleNamespace(id=2, name="Backend")
+PYTHON = SimpleNamespace(id=7, name="Python")
+HALF_TIME = [
+    SimpleNamespace(
+        valid_from=date(1900, 1, 1),
+        capacity_type=CapacityType.percentage,
+        capacity_value=Decimal("50"),
+    )
+]
+
+
+def make_assignment(id, project, start, end, allocation_type, value, employee=None):
+    return SimpleNamespace(
+        id=id,
+        project_id=project.id,
+        project=project,
+        employee=employee,
+        start_date=start,
+        end_date=end,
+        allocation_type=allocation_type,
+        allocation_value=Decimal(str(value)),
+        note=None,
+        is_tentative=False,
+    )
+
+
+def make_employee(id, last_name, team=None, technologies=()):
+    return SimpleNamespace(
+        id=id,
+        first_name="Jan",
+        last_name=last_name,
+        team=team,
+        technologies=list(technologies),
+        holiday_calendar="PL",
+        capacities=HALF_TIME,
+    )
+
+
+def test_timeline_columns_share_lookups_and_use_day_offsets():
+    emp = make_employee(1, "Kowalski", BACKEND, [PYTHON])
+    other = make_employee(2, "Nowak")
+    started_before = make_assignment(
+        10, ALPHA, date(2026, 2, 20), date(2026, 3, 31), AllocationType.percentage, 50
+    )
+    later = make_assignment(
+        11, ALPHA, date(2026, 3, 9), date(2026, 3, 13), AllocationType.total_hours, 20
+    )
+    vacation = SimpleNamespace(
+        start_date=date(2026, 3, 2),
+        end_date=date(2026, 3, 3),
+        leave_type="vacation",
+        employee_email="jan.kowalski@example.com",
+        synced_at=None,
+    )
+    occupancy = {
+        "2026-03": {"percentage": 25.0, "hours": 42.0, "available_hours": 168.0, "is_overbooked": False}
+    }
+    capacity_periods = [
+        {"from": "2026-03-01", "daily_hours": 4.0},
+        {"from": "2026-03-16", "daily_hours": 8.0},
+    ]
+
+    columns = TimelineColumns(ORIGIN, ["2026-03"])
+    columns.add_employee(emp, [started_before, later], [vacation], occupancy, capacity_periods, None)
+    columns.add_employee(other, [], [], occupancy, [], None)
+    columns.add_assignment(
+        make_assignment(12, BETA, date(2026, 3, 2), date(2026, 3, 6), AllocationType.percentage, 100)
+    )
+    payload = columns.payload(holidays=[])
+
+    assert payload["format"] == "columnar" and payload["origin"] == "2026-03-01"
+    assert payload["projects"] == {"id": [5, 6], "name": ["Alpha", "Beta"], "color": ["#3B82F6", "#10B981"]}
+    assert payload["teams"] == {"id": [2], "name": ["Backend"]}
+    assert payload["employees"]["team"] == [0, None]
+    assert payload["employees"]["technologies"] == [[0], []]
+    assert payload["employees"]["capacity_periods"] == [[[0, 4.0], [15, 8.0]], []]
+
+    assignments = payload["assignments"]
+    assert assignments["employee"] == [0, 0, None]
+    assert assignments["project"] == [0, 0, 1]
+    assert assignments["start"] == [-9, 8, 1]
+    assert payload["allocation_types"] == ["percentage", "total_hours"]
+    assert assignments["allocation_type"] == [0, 1, 0]
+    # Same figures as the row format: half of a part-timer's day, and a
+    # placeholder's percentage of the full-time norm.
+    assert assignments["daily_hours"] == [
+        _serialize_timeline_assignment(started_before, ORIGIN, HALF_TIME)["daily_hours"],
+        _serialize_timeline_assignment(later, ORIGIN, HALF_TIME)["daily_hours"],
+        8.0,
+    ]
+    assert assignments["daily_hours"][0] == 2.0
+
+    assert payload["vacations"]["employee"] == [0]
+    assert (payload["vacations"]["start"], payload["vacations"]["end"]) == ([1], [2])
+    assert payload["leave_types"] == ["vacation"]
+    assert payload["occupancy"]["percentage"] == [[25.0], [25.0]]
+    assert payload["holidays"] == []
+
+
+def test_project_columns_send_each_assignee_once():
+    emp = make_employee(1, "Kowalski", BACKEND)
+    columns = ProjectTimelineColumns(ORIGIN)
+    columns.add_project(
+        ALPHA,
+        [
+            make_assignment(10, ALPHA, ORIGIN, date(2026, 3, 31), AllocationType.percentage, 50, emp),
+            make_assignment(11, ALPHA, ORIGIN, date(2026, 3, 31), AllocationType.percentage, 50),
+        ],
+    )
+    columns.add_project(BETA, [])
+    columns.add_project(
+        SimpleNamespace(id=8, name="Gamma", color="#000000"),
+        [make_assignment(12, BETA, ORIGIN, date(2026, 3, 31), AllocationType.monthly_hours, 40, emp)],
+    )
+    payload = columns.payload()
+
+    assert payload["projects"]["id"] == [5, 6, 8]
+    assert payload["employees"] == {"id": [1], "name": ["Kowalski Jan"], "team": [0]}
+    assert payload["teams"]["name"] == ["Backend"]
+    assert payload["assignments"]["project"] == [0, 0, 2]
+    assert payload["assignments"]["employee"] == [0, None, 0]
+    assert payload["assignments"]["daily_hours"][:2] == [2.0, 4.0]
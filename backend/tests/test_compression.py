@@ -0,0 +1,95 @@
+"""Unit tests for response compression and the orjson response class."""
+
+import asyncio
+import gzip
+import json
+from datetime import date
+from decimal import Decimal
+
+import brotli
+from fastapi.responses import JSONResponse
+
+from app.core.compression import CompressionMiddleware, accepted_encodings
+from app.core.responses import FastJSONResponse
+
+PAYLOAD = {
+    "employees": [
+        {"id": i, "name": "Jan Kowalski", "start_date": "2026-01-01", "hours": 8.0}
+        for i in range(100)
+    ],
+    "working_days_per_month": {"2026-01": 20},
+}
+
+
+def _request(app, accept_encoding, path="/"):
+    """Run `app` for one GET and return (headers, body) of the response."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    asyncio.run(app(scope, receive, send))
+    headers = {k.decode(): v.decode() for k, v in sent[0]["headers"]}
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return headers, body
+
+
+def _app(response):
+    async def app(scope, receive, send):
+        await response(scope, receive, send)
+
+    return CompressionMiddleware(app)
+
+
+def test_fast_json_matches_the_stdlib_encoding():
+    assert FastJSONResponse(PAYLOAD).body == JSONResponse(PAYLOAD).body
+    body = FastJSONResponse(
+        {"d": date(2026, 5, 3), "h": Decimal("7.5"), 2026: "Święto"}
+    ).body
+    assert json.loads(body) == {"d": "2026-05-03", "h": 7.5, "2026": "Święto"}
+
+
+def test_brotli_is_preferred_then_gzip():
+    raw = FastJSONResponse(PAYLOAD).body
+
+    headers, body = _request(_app(FastJSONResponse(PAYLOAD)), "gzip, deflate, br")
+    assert headers["content-encoding"] == "br"
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(body) < len(raw)
+    assert brotli.decompress(body) == raw
+
+    headers, body = _request(_app(FastJSONResponse(PAYLOAD)), "gzip, br;q=0")
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == raw
+
+    headers, body = _request(_app(FastJSONResponse(PAYLOAD)), "identity")
+    assert "content-encoding" not in headers
+    assert body == raw
+
+
+def test_small_and_precompressed_bodies_are_left_alone():
+    headers, body = _request(_app(FastJSONResponse({"status": "ok"})), "br")
+    assert "content-encoding" not in headers
+    assert body == b'{"status":"ok"}'
+
+    xlsx = JSONResponse(
+        PAYLOAD,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
+    headers, _ = _request(_app(xlsx), "br")
+    assert "content-encoding" not in headers
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+    assert accepted_encodings("br;q=0, GZIP;q=0.5") == {"gzip"}
+    assert accepted_encodings("") == set()
@@ -0,0 +1,259 @@
+"""Tests for plan change events and the /api/events stream.
+
+The bulk write paths that publish events are run on an in-memory SQLite
+database; everything else needs no DB.
+"""
+
+import asyncio
+import io
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, UploadFile
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.events import router
+from app.api.imports import import_assignments_csv, import_employees_csv
+from app.api.projects import archive_project, delete_project, shift_project, stretch_project
+from app.core.dependencies import get_stream_user
+from app.core.events import (
+    ASSIGNMENT_CREATED,
+    ASSIGNMENT_UPDATED,
+    EMPLOYEE_CHANGED,
+    PROJECT_CHANGED,
+    QUEUE_SIZE,
+    RESYNC,
+    EventBroker,
+    PlanEvent,
+    assignment_event,
+    broker,
+)
+from app.database import Base
+from app.models.assignment import AllocationType, Assignment
+from app.models.employee import Employee
+from app.models.project import Project
+from app.schemas.project import ProjectShiftRequest, ProjectStretchRequest
+
+
+def _assignment(id, employee_id, project_id):
+    return SimpleNamespace(id=id, employee_id=employee_id, project_id=project_id)
+
+
+def test_assignment_event_names_old_and_new_rows():
+    event = assignment_event(
+        ASSIGNMENT_UPDATED,
+        [_assignment(7, 2, 10), _assignment(8, None, 11)],
+        employee_ids=[3, None],
+        project_ids=[10],
+    )
+
+    assert event.employee_ids == (2, 3)
+    assert event.project_ids == (10, 11)
+    assert event.assignment_ids == (7, 8)
+    assert PlanEvent.from_json(event.to_json()) == event
+    assert PlanEvent.from_json(PlanEvent(RESYNC, None, None, None).to_json()).employee_ids is None
+
+
+def test_subscriber_that_falls_behind_gets_a_single_resync():
+    async def scenario():
+        events = EventBroker()
+        with events.subscription() as slow, events.subscription() as fast:
+            for i in range(QUEUE_SIZE + 5):
+                await events.publish(PlanEvent(ASSIGNMENT_UPDATED, employee_ids=(i,)))
+                if not fast.empty():
+                    fast.get_nowait()
+            assert slow.qsize() == 5
+            assert slow.get_nowait().type == RESYNC
+            assert slow.get_nowait().employee_ids == (QUEUE_SIZE + 1,)
+        assert not events._subscribers
+
+    asyncio.run(scenario())
+
+
+def test_stream_sends_published_events():
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_stream_user] = lambda: None
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/events",
+        "query_string": b"",
+        "headers": [],
+    }
+
+    async def scenario():
+        chunks = []
+        received = asyncio.Event()
+
+        async def receive():
+            await asyncio.Event().wait()  # the client never hangs up
+
+        async def send(message):
+            if message.get("body"):
+                chunks.append(message["body"])
+                received.set()
+
+        task = asyncio.create_task(app(scope, receive, send))
+        await asyncio.wait_for(received.wait(), 1)
+        received.clear()
+        await broker.publish(assignment_event(ASSIGNMENT_UPDATED, [_assignment(5, 1, 2)]))
+        await asyncio.wait_for(received.wait(), 1)
+        task.cancel()
+        return chunks
+
+    chunks = asyncio.run(scenario())
+    assert chunks[0] == b": connected\nretry: 3000\n\n"
+    assert chunks[1] == (
+        b"event: assignment.updated\n"
+        b'data: {"type":"assignment.updated","employee_ids":[1],'
+        b'"project_ids":[2],"assignment_ids":[5]}\n\n'
+    )
+    assert not broker._subscribers
+
+
+def test_bridged_publish_goes_through_notify():
+    class Connection:
+        """Loops NOTIFY back like Postgres does to the listening worker."""
+
+        def __init__(self, events):
+            self.events = events
+            self.payloads = []
+
+        async def execute(self, query, channel, payload):
+            self.payloads.append(payload)
+            self.events._on_notification(self, 0, channel, payload)
+
+    async def scenario():
+        events = EventBroker()
+        connection = events._connection = Connection(events)
+        with events.subscription() as queue:
+            await events.publish(PlanEvent(ASSIGNMENT_UPDATED, employee_ids=(1,)))
+            # Too big for NOTIFY: sent as "anything may have changed".
+            await events.publish(
+                PlanEvent(ASSIGNMENT_UPDATED, employee_ids=tuple(range(5000)))
+            )
+            return connection.payloads, [queue.get_nowait() for _ in range(2)]
+
+    payloads, received = asyncio.run(scenario())
+    assert len(payloads) == 2
+    assert received[0].employee_ids == (1,)
+    assert received[1] == PlanEvent(ASSIGNMENT_UPDATED, None, None, None)
+
+
+# --- bulk write paths ---
+
+
+@pytest.fixture
+def factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as db:
+            project = Project(name="Apollo", color="#3B82F6")
+            emp = Employee(first_name="Jan", last_name="Kowalski")
+            db.add_all(
+                [
+                    Assignment(
+                        project=project,
+                        employee=employee,
+                        # Far ahead, so archiving deletes it.
+                        start_date=date(2099, 3, 2),
+                        end_date=date(2099, 3, 13),
+                        allocation_type=AllocationType.percentage,
+                        allocation_value=Decimal("50"),
+                    )
+                    for employee in (emp, None)
+                ]
+            )
+            await db.commit()
+            return project.id, emp.id
+
+    factory.project_id, factory.employee_id = asyncio.run(create())
+    return factory
+
+
+def published(factory, handler, **params) -> list[PlanEvent]:
+    """Events `handler` publishes when called with `params`."""
+
+    async def scenario():
+        with broker.subscription() as queue:
+            async with factory() as db:
+                await handler(**params, db=db, _user=None)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    return asyncio.run(scenario())
+
+
+def _project_event(factory, type):
+    return PlanEvent(
+        type,
+        employee_ids=(factory.employee_id,),
+        project_ids=(factory.project_id,),
+        assignment_ids=None,
+    )
+
+
+def test_shift_announces_the_project(factory):
+    events = published(
+        factory,
+        shift_project,
+        project_id=factory.project_id,
+        body=ProjectShiftRequest(working_days=5),
+    )
+    assert events == [_project_event(factory, ASSIGNMENT_UPDATED)]
+
+
+def test_stretch_announces_the_project(factory):
+    events = published(
+        factory,
+        stretch_project,
+        project_id=factory.project_id,
+        body=ProjectStretchRequest(start_date=date(2099, 3, 2), end_date=date(2099, 3, 31)),
+    )
+    assert events == [_project_event(factory, ASSIGNMENT_UPDATED)]
+
+
+def test_archive_announces_the_project_and_former_assignees(factory):
+    events = published(factory, archive_project, project_id=factory.project_id)
+    assert events == [_project_event(factory, PROJECT_CHANGED)]
+
+
+def test_delete_announces_the_project_and_former_assignees(factory):
+    unconfirmed = published(
+        factory, delete_project, project_id=factory.project_id, confirm=False
+    )
+    assert unconfirmed == []
+    events = published(factory, delete_project, project_id=factory.project_id, confirm=True)
+    assert events == [_project_event(factory, PROJECT_CHANGED)]
+
+
+def _upload(text: str) -> UploadFile:
+    return UploadFile(file=io.BytesIO(text.encode()), filename="import.csv")
+
+
+def test_assignment_import_announces_any_row(factory):
+    csv = (
+        "project,start_date,end_date,allocation_type,allocation_value\n"
+        "Apollo,2099-04-01,2099-04-30,monthly_hours,40\n"
+    )
+    dry = published(factory, import_assignments_csv, file=_upload(csv), dry_run=True)
+    assert dry == []
+    events = published(factory, import_assignments_csv, file=_upload(csv), dry_run=False)
+    assert events == [PlanEvent(ASSIGNMENT_CREATED, None, None, None)]
+
+
+def test_employee_import_announces_any_employee(factory):
+    events = published(
+        factory,
+        import_employees_csv,
+        file=_upload("first_name,last_name\nAnna,Nowak\n"),
+        dry_run=False,
+    )
+    assert events == [PlanEvent(EMPLOYEE_CHANGED, employee_ids=None)]
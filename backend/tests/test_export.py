@@ -0,0 +1,86 @@
+"""Unit tests for the streamed spreadsheet encoders (app.utils.spreadsheet)."""
+
+import asyncio
+import io
+import zipfile
+from datetime import date
+from decimal import Decimal
+from xml.etree import ElementTree
+
+from app.utils.spreadsheet import stream_csv, stream_xlsx
+
+NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+HEADER = ["id", "name", "day", "hours", "ok"]
+
+
+async def _batches():
+    yield [(1, "Żółć, \"Anna\"", date(2026, 3, 2), Decimal("12.5"), True)]
+    yield []
+    yield [(2, None, date(1900, 3, 1), 0.5, False)]
+
+
+def collect(stream) -> tuple[list[bytes], bytes]:
+    async def run():
+        return [chunk async for chunk in stream]
+
+    chunks = asyncio.run(run())
+    return chunks, b"".join(chunks)
+
+
+def test_csv_has_bom_and_plain_values():
+    _, data = collect(stream_csv(HEADER, _batches()))
+
+    assert data.startswith("\ufeff".encode())
+    assert data.decode("utf-8-sig").splitlines() == [
+        "id,name,day,hours,ok",
+        '1,"Żółć, ""Anna""",2026-03-02,12.5,true',
+        "2,,1900-03-01,0.5,false",
+    ]
+
+
+def test_csv_text_is_not_run_as_a_formula():
+    async def batches():
+        yield [(1, "=HYPERLINK(\"http://x\")", "-5", "@SUM(A1)", "a=b", -5)]
+
+    _, data = collect(stream_csv(["id", "a", "b", "c", "d", "e"], batches()))
+
+    assert data.decode("utf-8-sig").splitlines()[1] == (
+        '1,"\'=HYPERLINK(""http://x"")",\'-5,\'@SUM(A1),a=b,-5'
+    )
+
+
+def test_xlsx_is_a_readable_workbook():
+    chunks, data = collect(stream_xlsx("Occupancy", HEADER, _batches()))
+
+    assert len(chunks) > 1  # the prologue goes out before any row is read
+    workbook = zipfile.ZipFile(io.BytesIO(data))
+    assert workbook.testzip() is None
+    sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+    rows = sheet.findall("s:sheetData/s:row", NS)
+    assert len(rows) == 3
+
+    header = [c.find("s:is/s:t", NS).text for c in rows[0]]
+    assert header == HEADER
+
+    first = list(rows[1])
+    assert first[1].find("s:is/s:t", NS).text == 'Żółć, "Anna"'
+    assert first[2].get("s") == "1"  # date style
+    assert first[2].find("s:v", NS).text == "46083"
+    assert first[3].find("s:v", NS).text == "12.5"
+    assert first[4].get("t") == "b"
+
+    second = list(rows[2])
+    assert len(second) == 5
+    assert second[1].find("s:v", NS) is None  # empty cell keeps its column
+    assert second[2].find("s:v", NS).text == "61"
+
+
+def test_xlsx_drops_characters_xml_cannot_hold():
+    async def batches():
+        yield [("a\x00b\x1fc",)]
+
+    _, data = collect(stream_xlsx("Notes", ["note"], batches()))
+
+    sheet = zipfile.ZipFile(io.BytesIO(data)).read("xl/worksheets/sheet1.xml")
+    row = ElementTree.fromstring(sheet).findall("s:sheetData/s:row", NS)[1]
+    assert row[0].find("s:is/s:t", NS).text == "abc"
@@ -0,0 +1,178 @@
+"""Unit tests for the holiday calendar registry (app.utils.holiday_calendars)."""
+
+import asyncio
+import base64
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.calendar import get_working_days_bitmap
+from app.models.assignment import AllocationType
+from app.models.employee import CapacityType
+from app.schemas.employee import EmployeeCreate, EmployeeUpdate
+from app.services.assignment_service import calculate_daily_hours
+from app.services.occupancy_service import CalendarDays, compute_daily_load
+from app.utils import holiday_calendars
+from app.utils.holiday_calendars import (
+    DEFAULT_CALENDAR,
+    count_working_days,
+    holiday_name,
+    holiday_year,
+    is_working_day,
+    named_holidays,
+    register_calendar,
+    working_day_bitmap,
+)
+from app.utils.polish_holidays import get_holiday_name
+
+
+class MondaysInMarch:
+    """Every Monday of March off, nothing else."""
+
+    code = "XX"
+    name = "Test"
+
+    def holidays(self, year):
+        d = date(year, 3, 1)
+        result = {}
+        while d.month == 3:
+            if d.weekday() == 0:
+                result[d] = "Poniedziałek"
+            d += timedelta(days=1)
+        return result
+
+
+@pytest.fixture
+def test_calendar():
+    register_calendar(MondaysInMarch())
+    yield "XX"
+    del holiday_calendars._providers["XX"]
+    holiday_calendars._holiday_year.cache_clear()
+
+
+def test_tables_are_built_once_and_shared():
+    assert holiday_year(2026) is holiday_year(2026, DEFAULT_CALENDAR)
+    assert date(2026, 4, 6) in holiday_year(2026).dates
+    assert holiday_name(date(2026, 6, 4)) == "Boże Ciało"
+    assert get_holiday_name(date(2026, 12, 25)) == "Boże Narodzenie"
+    assert get_holiday_name(date(2026, 3, 2)) == ""
+
+
+def test_count_matches_day_by_day():
+    holidays = frozenset().union(*(holiday_year(y).dates for y in range(2025, 2029)))
+    start = date(2025, 1, 1)
+    for offset in range(0, 1000, 37):
+        for length in (0, 1, 6, 45, 400):
+            lo = start + timedelta(days=offset)
+            hi = lo + timedelta(days=length)
+            expected = sum(
+                1
+                for i in range(length + 1)
+                if (d := lo + timedelta(days=i)).weekday() < 5 and d not in holidays
+            )
+            assert count_working_days(lo, hi) == expected
+    assert count_working_days(date(2026, 3, 2), date(2026, 3, 1)) == 0
+
+
+def test_named_holidays_in_range():
+    assert named_holidays(date(2026, 12, 20), date(2027, 1, 6)) == [
+        (date(2026, 12, 25), "Boże Narodzenie"),
+        (date(2026, 12, 26), "Boże Narodzenie (2. dzień)"),
+        (date(2027, 1, 1), "Nowy Rok"),
+        (date(2027, 1, 6), "Trzech Króli"),
+    ]
+
+
+def test_unknown_calendar_is_rejected():
+    with pytest.raises(ValueError):
+        holiday_year(2026, "ZZ")
+    with pytest.raises(ValidationError):
+        EmployeeCreate(first_name="Jan", last_name="Kowalski", holiday_calendar="ZZ")
+    assert EmployeeCreate(first_name="Jan", last_name="Kowalski").holiday_calendar == "PL"
+    assert EmployeeUpdate().holiday_calendar is None
+
+
+def test_registered_calendar_drives_working_days(test_calendar):
+    # March 2026: 22 weekdays, no Polish holidays, five Mondays.
+    assert count_working_days(date(2026, 3, 1), date(2026, 3, 31)) == 22
+    assert count_working_days(date(2026, 3, 1), date(2026, 3, 31), test_calendar) == 17
+    # Polish holidays are working days there.
+    assert count_working_days(date(2026, 1, 1), date(2026, 1, 1), test_calendar) == 1
+    assert EmployeeCreate(
+        first_name="Jan", last_name="Kowalski", holiday_calendar=test_calendar
+    ).holiday_calendar == test_calendar
+
+    monthly = calculate_daily_hours(
+        "monthly_hours", 170, 2026, 3, calendar=test_calendar
+    )
+    assert monthly == Decimal("10")
+
+
+def test_daily_load_follows_the_employee_calendar(test_calendar):
+    days = CalendarDays(date(2026, 3, 1), date(2026, 3, 31))
+    capacities = [
+        SimpleNamespace(
+            valid_from=date(2026, 1, 1),
+            capacity_type=CapacityType.monthly_hours,
+            capacity_value=Decimal("136"),
+        )
+    ]
+    assignment = SimpleNamespace(
+        start_date=date(2026, 3, 1),
+        end_date=date(2026, 3, 31),
+        allocation_type=AllocationType.total_hours,
+        allocation_value=Decimal("34"),
+        is_tentative=False,
+    )
+    load = compute_daily_load(
+        [assignment], [], days[test_calendar], capacities, {}, test_calendar
+    )
+
+    assert len(load.days) == 17
+    assert date(2026, 3, 2) not in load.days
+    available, booked, _ = load.totals(date(2026, 3, 1), date(2026, 3, 31))
+    assert available == Decimal("136")
+    assert booked == Decimal("34")
+    assert len(days[DEFAULT_CALENDAR]) == 22
+
+
+def test_bitmap_marks_each_working_day():
+    start, end = date(2025, 12, 20), date(2027, 1, 10)
+    bitmap = working_day_bitmap(start, end)
+    n = (end - start).days + 1
+
+    assert len(bitmap) == (n + 7) // 8
+    for i in range(n):
+        d = start + timedelta(days=i)
+        assert bool(bitmap[i // 8] >> (i % 8) & 1) == is_working_day(d), d
+    assert working_day_bitmap(end, start) == b""
+
+
+def test_bitmap_endpoint_is_cacheable():
+    def call(if_none_match=None):
+        return asyncio.run(
+            get_working_days_bitmap(
+                start=date(2026, 1, 1),
+                end=date(2026, 12, 31),
+                calendar=DEFAULT_CALENDAR,
+                if_none_match=if_none_match,
+                _user=None,
+            )
+        )
+
+    response = call()
+    body = json.loads(response.body)
+    assert "immutable" in response.headers["cache-control"]
+    assert body["days"] == 365
+    assert body["holidays"]["2026-11-11"] == "Święto Niepodległości"
+    assert sum(bin(b).count("1") for b in base64.b64decode(body["bitmap"])) == (
+        count_working_days(date(2026, 1, 1), date(2026, 12, 31))
+    )
+    assert call(response.headers["etag"]).status_code == 304
+    # Intermediaries may send the tag back as a weak validator.
+    assert call(f'"other", W/{response.headers["etag"]}').status_code == 304
+    assert call('"other"').status_code == 200
@@ -0,0 +1,181 @@
+"""Unit tests for CSV imports (app.services.import_service).
+
+Row checks run against preloaded reference maps, as the import does after
+its set-based lookups (no DB).
+"""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.assignment import AllocationType
+from app.services.import_service import (
+    AssignmentReferences,
+    EmployeeReferences,
+    ImportFileError,
+    RowError,
+    check_assignment_row,
+    check_employee_row,
+    read_csv,
+)
+
+
+def _row(id, is_archived=False):
+    return SimpleNamespace(id=id, is_archived=is_archived)
+
+
+def _refs():
+    return AssignmentReferences(
+        employee_by_id={1: _row(1), 2: _row(2, is_archived=True)},
+        employee_by_name={"nowak anna": _row(1)},
+        project_by_id={5: _row(5), 6: _row(6, is_archived=True)},
+        project_by_name={"apollo": _row(5)},
+    )
+
+
+def _assignment(**overrides):
+    row = {
+        "employee_id": "1",
+        "project_id": "5",
+        "start_date": "2026-03-02",
+        "end_date": "2026-03-06",
+        "allocation_type": "percentage",
+        "allocation_value": "50",
+    }
+    row.update(overrides)
+    return row
+
+
+# --- read_csv ---
+
+
+def test_read_csv_sniffs_semicolons_and_keeps_line_numbers():
+    data = (
+        "\ufeffProject;Start_Date;end_date;allocation_type;allocation_value;note\n"
+        'Apollo;2026-03-02;2026-03-06;percentage;12,5;"two\nlines"\n'
+        "\n"
+        "Apollo;2026-03-09;2026-03-13;total_hours;8;\n"
+    ).encode()
+
+    rows = read_csv(data, [("project_id", "project"), ("start_date",)])
+
+    assert [line for line, _ in rows] == [3, 5]
+    assert rows[0][1]["project"] == "Apollo"
+    assert rows[0][1]["note"] == "two\nlines"
+    assert rows[1][1]["note"] is None
+
+
+def test_read_csv_removes_the_export_formula_guard():
+    data = "project,note\nApollo,'=2+2\nApollo,'quoted\n".encode()
+
+    rows = read_csv(data, [("project",)])
+
+    assert [row["note"] for _, row in rows] == ["=2+2", "'quoted"]
+
+
+def test_read_csv_rejects_missing_columns_and_other_encodings():
+    with pytest.raises(ImportFileError, match="project_id"):
+        read_csv(b"start_date\n2026-03-02\n", [("project_id", "project")])
+    with pytest.raises(ImportFileError):
+        read_csv("project\nŻółw\n".encode("cp1250"), [("project",)])
+
+
+# --- assignments ---
+
+
+def test_valid_row_becomes_table_values():
+    row = _assignment(
+        employee_id=None,
+        employee="NOWAK Anna",
+        project_id=None,
+        project="Apollo",
+        allocation_value="12,5",
+        is_tentative="true",
+    )
+    values = check_assignment_row(2, row, _refs())
+
+    assert values["employee_id"] == 1
+    assert values["project_id"] == 5
+    assert values["allocation_type"] == AllocationType.percentage
+    assert values["allocation_value"] == Decimal("12.5")
+    assert values["is_tentative"] is True
+    assert values["start_date"] == date(2026, 3, 2)
+
+
+def test_row_without_employee_is_a_placeholder():
+    values = check_assignment_row(2, _assignment(employee_id=None), _refs())
+    assert values["employee_id"] is None
+
+
+@pytest.mark.parametrize(
+    "overrides, column, detail",
+    [
+        ({"employee_id": "3"}, "employee_id", "Nie znaleziono pracownika"),
+        ({"employee_id": None, "employee": "Kowalski Jan"}, "employee", "Nie znaleziono pracownika"),
+        ({"employee_id": "2"}, "employee_id", "Nie można przypisać zarchiwizowanego pracownika"),
+        (
+            {"project_id": "6"},
+            "project_id",
+            "Nie można przypisać pracownika do zarchiwizowanego projektu",
+        ),
+        ({"project_id": "x"}, "project_id", "Invalid id value: x"),
+        # Saturday to Sunday
+        (
+            {"start_date": "2026-03-07", "end_date": "2026-03-08"},
+            "end_date",
+            "Assignment must contain at least 1 working day",
+        ),
+        ({"allocation_value": "0"}, "allocation_value", "allocation_value must be > 0"),
+    ],
+)
+def test_invalid_rows_report_the_endpoint_error(overrides, column, detail):
+    errors = check_assignment_row(7, _assignment(**overrides), _refs())
+    assert errors == [RowError(7, column, detail)]
+
+
+# --- employees ---
+
+
+def _employee_refs():
+    return EmployeeReferences(
+        teams={"backend": 3},
+        technologies={"python": 7, "go": 8},
+        taken_names={"nowak anna"},
+        taken_emails={"jan@example.com"},
+    )
+
+
+def test_employee_row_resolves_team_and_technologies_by_name():
+    refs = _employee_refs()
+    row = {
+        "first_name": "Ewa",
+        "last_name": "Lis",
+        "team": "BACKEND",
+        "technologies": "Python; go, python",
+    }
+    values, techs = check_employee_row(2, row, refs)
+
+    assert values == {"first_name": "Ewa", "last_name": "Lis", "email": None, "team_id": 3}
+    assert techs == [7, 8]
+    assert "lis ewa" in refs.taken_names
+
+
+def test_employee_duplicates_within_the_file_are_rejected():
+    refs = _employee_refs()
+    first = {"first_name": "Ewa", "last_name": "Lis", "email": "ewa@example.com"}
+    check_employee_row(2, first, refs)
+
+    assert check_employee_row(3, dict(first, email=None), refs) == [
+        RowError(3, "last_name", "Pracownik o tym imieniu i nazwisku już istnieje")
+    ]
+    assert check_employee_row(4, {**first, "first_name": "Eva"}, refs) == [
+        RowError(4, "email", "Pracownik z tym adresem email już istnieje")
+    ]
+
+
+def test_employee_unknown_technology_is_named():
+    row = {"first_name": "Ewa", "last_name": "Lis", "technologies": "Python, Cobol"}
+    errors = check_employee_row(2, row, _employee_refs())
+    assert errors == [RowError(2, "technologies", "Nie znaleziono technologii: Cobol")]
@@ -0,0 +1,145 @@
+"""Tests for the background job queue, on an in-memory SQLite database.
+
+SQLite ignores FOR UPDATE SKIP LOCKED, so these cover the job life cycle
+(claim, retry, lease takeover), not concurrent workers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.job import Job, JobStatus
+from app.services import job_service
+from app.services.job_service import (
+    claim_job,
+    enqueue,
+    register_job_handler,
+    retry_delay,
+    run_job,
+)
+
+calls = []
+
+
+async def _echo(db, payload):
+    calls.append(payload)
+    return {"echo": payload.get("value")}
+
+
+async def _broken(db, payload):
+    raise RuntimeError("Calamari is down")
+
+
+register_job_handler("test_echo", _echo)
+register_job_handler("test_broken", _broken)
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create())
+    monkeypatch.setattr(job_service, "async_session_factory", factory)
+    calls.clear()
+    return factory
+
+
+def _job(factory, job_id):
+    async def load():
+        async with factory() as db:
+            return (await db.execute(select(Job).where(Job.id == job_id))).scalar_one()
+
+    return asyncio.run(load())
+
+
+def test_job_runs_once_and_records_its_result(factory):
+    async def scenario():
+        async with factory() as db:
+            job = await enqueue(db, "test_echo", {"value": 7}, coalesce=True)
+            # Still waiting: asking again returns the same job.
+            again = await enqueue(db, "test_echo", {"value": 7}, coalesce=True)
+            other = await enqueue(db, "test_echo", {"value": 8}, coalesce=True)
+        assert again.id == job.id != other.id
+
+        async with factory() as db:
+            claimed = await claim_job(db)
+        assert (claimed.id, claimed.status, claimed.attempts) == (job.id, JobStatus.running, 1)
+        await run_job(claimed)
+        return job.id
+
+    job_id = asyncio.run(scenario())
+    job = _job(factory, job_id)
+    assert job.status == JobStatus.succeeded
+    assert job.result == {"echo": 7}
+    assert job.finished_at is not None and job.locked_until is None
+    assert calls == [{"value": 7}]
+
+
+def test_failed_attempts_are_retried_then_given_up(factory):
+    async def scenario():
+        async with factory() as db:
+            job = await enqueue(db, "test_broken", max_attempts=2)
+        async with factory() as db:
+            await run_job(await claim_job(db))
+        async with factory() as db:
+            # Backing off: not due yet.
+            assert await claim_job(db) is None
+            stored = await db.get(Job, job.id)
+            assert stored.status == JobStatus.queued
+            assert stored.error == "RuntimeError: Calamari is down"
+            stored.run_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            await db.commit()
+        async with factory() as db:
+            claimed = await claim_job(db)
+        assert claimed.attempts == 2
+        await run_job(claimed)
+        return job.id
+
+    job = _job(factory, asyncio.run(scenario()))
+    assert job.status == JobStatus.failed
+    assert job.attempts == 2
+    assert retry_delay(1) < retry_delay(2)
+
+
+def test_expired_lease_is_taken_over(factory):
+    async def scenario():
+        async with factory() as db:
+            first = await enqueue(db, "test_echo", max_attempts=2)
+            last = await enqueue(db, "test_echo", max_attempts=1)
+        async with factory() as db:
+            # Both claimed by workers that died.
+            for _ in range(2):
+                await claim_job(db)
+            assert await claim_job(db) is None
+            for job_id in (first.id, last.id):
+                job = await db.get(Job, job_id)
+                job.locked_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+            await db.commit()
+        async with factory() as db:
+            taken_over = await claim_job(db)
+            assert await claim_job(db) is None
+        return taken_over, first.id, last.id
+
+    taken_over, first_id, last_id = asyncio.run(scenario())
+    assert (taken_over.id, taken_over.attempts) == (first_id, 2)
+    # Its only attempt was lost with the worker.
+    assert _job(factory, last_id).status == JobStatus.failed
+
+
+def test_unknown_kinds_are_rejected(factory):
+    async def scenario():
+        async with factory() as db:
+            await enqueue(db, "no_such_job")
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
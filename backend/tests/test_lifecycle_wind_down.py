@@ -5,9 +5,18 @@ The rules are shared by project and employee archiving, and the boundary cases
 regress, so they are pinned explicitly.
 """
 
-from datetime import date
+from datetime import date, timedelta
 
-from app.services.lifecycle_service import WindDownAction, classify_for_wind_down
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.assignment import Assignment
+from app.services.lifecycle_service import (
+    WindDownAction,
+    classify_for_wind_down,
+    wind_down_filters,
+)
 
 TODAY = date(2026, 7, 18)
 
@@ -84,3 +93,42 @@ class TestIssueExample:
             classify(date(2026, 8, 1), date(2026, 9, 30))
             is WindDownAction.DELETE
         )
+
+
+class TestSqlFiltersMatchClassification:
+    """The set-based wind-down must classify exactly like the Python rules."""
+
+    def test_every_range_around_today(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[Assignment.__table__])
+        offsets = range(-3, 4)
+        ranges = [
+            (TODAY + timedelta(days=s), TODAY + timedelta(days=e))
+            for s in offsets
+            for e in offsets
+        ]  # includes malformed ranges (start after end)
+
+        with Session(engine) as db:
+            conn = db.connection()
+            conn.execute(
+                Assignment.__table__.insert(),
+                [
+                    {
+                        "id": i,
+                        "project_id": 1,
+                        "start_date": start,
+                        "end_date": end,
+                        "allocation_type": "percentage",
+                        "allocation_value": 100,
+                    }
+                    for i, (start, end) in enumerate(ranges)
+                ],
+            )
+            for action, condition in wind_down_filters(TODAY).items():
+                ids = set(db.scalars(select(Assignment.id).where(condition)))
+                expected = {
+                    i
+                    for i, (start, end) in enumerate(ranges)
+                    if classify(start, end) is action
+                }
+                assert ids == expected, action
@@ -0,0 +1,422 @@
+"""Unit tests for the shared daily load engine in app.services.occupancy_service.
+
+`period_totals` (used by the capacity rollup) and `overbooked_intervals`
+(the overbooking scan) must agree with the day-by-day `DailyLoad` the
+timeline uses, so most tests compare them on small hand-made employees.
+
+Fixed dates used below:
+- March 2026 has 22 working days, April 2026 has 21 (Easter Monday 04-06).
+"""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.assignment import AllocationType
+from app.models.employee import CapacityType
+from app.services.capacity_service import daily_capacity_hours
+from app.services.occupancy_service import (
+    GRANULARITIES,
+    assignment_period_units,
+    availability_runs,
+    compute_daily_load,
+    contracted_hours,
+    free_capacity,
+    is_overbooked,
+    overbooked_intervals,
+    period_day_bounds,
+    period_totals,
+    period_units,
+    period_windows,
+    working_days_between,
+)
+from app.utils.hour_units import div_round, percentage, round_units, to_units
+from app.utils.polish_holidays import get_polish_holidays
+from app.utils.query_params import parse_choice_csv
+
+START = date(2026, 3, 1)
+END = date(2026, 4, 30)
+HOLIDAYS = set(get_polish_holidays(2026))
+
+
+def make_assignment(start, end, allocation_type, value, is_tentative=False):
+    return SimpleNamespace(
+        start_date=start,
+        end_date=end,
+        allocation_type=allocation_type,
+        allocation_value=Decimal(str(value)),
+        is_tentative=is_tentative,
+    )
+
+
+def make_vacation(start, end):
+    return SimpleNamespace(start_date=start, end_date=end)
+
+
+def make_capacity(valid_from, capacity_type, value):
+    return SimpleNamespace(
+        valid_from=valid_from,
+        capacity_type=capacity_type,
+        capacity_value=Decimal(str(value)),
+    )
+
+
+def _compare(assignments, vacations, capacities, granularity):
+    periods = period_windows(START, END, granularity)
+    days = working_days_between(periods[0][1], periods[-1][2], HOLIDAYS)
+    load = compute_daily_load(assignments, vacations, days, capacities)
+    fast = period_totals(
+        assignments, vacations, days, period_day_bounds(days, periods), capacities
+    )
+    slow = [load.totals(s, e) for _, s, e in periods]
+    assert len(fast) == len(slow)
+    for got, expected in zip(fast, slow):
+        for g, e in zip(got, expected):
+            assert g == pytest.approx(e, abs=Decimal("1e-20"))
+
+
+# --- period helpers ---
+
+
+def test_period_windows_monthly_keys():
+    assert period_windows(date(2026, 3, 15), date(2026, 4, 2), "monthly") == [
+        ("2026-03", date(2026, 3, 1), date(2026, 3, 31)),
+        ("2026-04", date(2026, 4, 1), date(2026, 4, 30)),
+    ]
+
+
+def test_period_windows_weekly_aligned_to_monday():
+    periods = period_windows(date(2026, 3, 4), date(2026, 3, 10), "weekly")
+    assert periods == [
+        ("w-2026-10", date(2026, 3, 2), date(2026, 3, 8)),
+        ("w-2026-11", date(2026, 3, 9), date(2026, 3, 15)),
+    ]
+
+
+def test_period_windows_daily_covers_the_range_only():
+    periods = period_windows(date(2026, 3, 31), date(2026, 4, 2), "daily")
+    assert [key for key, _, _ in periods] == ["2026-03-31", "2026-04-01", "2026-04-02"]
+    assert all(s == e for _, s, e in periods)
+
+
+def test_granularity_lists_keep_order_and_reject_unknown_values():
+    assert parse_choice_csv("weekly, monthly,weekly", GRANULARITIES) == ["weekly", "monthly"]
+    for raw in ("hourly", " , "):
+        with pytest.raises(HTTPException) as exc:
+            parse_choice_csv(raw, GRANULARITIES)
+        assert exc.value.status_code == 400
+
+
+def test_summarize_periods_matches_summarize_for_every_granularity():
+    assignments = [
+        make_assignment(date(2026, 3, 10), date(2026, 4, 15), AllocationType.percentage, 60),
+        make_assignment(date(2026, 3, 2), date(2026, 3, 20), AllocationType.total_hours, 100),
+    ]
+    vacations = [make_vacation(date(2026, 3, 16), date(2026, 3, 18))]
+    periods = [
+        window
+        for granularity in ("monthly", "weekly", "daily")
+        for window in period_windows(START, END, granularity)
+    ]
+    days = working_days_between(
+        min(p[1] for p in periods), max(p[2] for p in periods), HOLIDAYS
+    )
+    load = compute_daily_load(assignments, vacations, days)
+
+    summary = load.summarize_periods(periods)
+    assert len(summary) == len(periods)  # keys of different granularities never collide
+    assert summary == {key: load.summarize(s, e) for key, s, e in periods}
+    assert summary["2026-03-17"]["is_overbooked"]  # total_hours keep booking on vacation
+    assert summary["2026-03-21"]["available_hours"] == 0  # Saturday
+
+
+def test_period_day_bounds_split_working_days():
+    periods = period_windows(START, END, "monthly")
+    days = working_days_between(START, END, HOLIDAYS)
+    assert period_day_bounds(days, periods) == [0, 22, 43]
+
+
+# --- contracted_hours ---
+
+
+def test_contracted_hours_matches_daily_capacity_hours():
+    capacities = [
+        make_capacity(date(2026, 3, 10), CapacityType.percentage, 80),
+        make_capacity(date(2026, 4, 1), CapacityType.monthly_hours, 100),
+    ]
+    days = working_days_between(START, END, HOLIDAYS)
+    assert contracted_hours(capacities, days) == [
+        daily_capacity_hours(capacities, d) for d in days
+    ]
+
+
+# --- period_totals vs DailyLoad ---
+
+
+@pytest.mark.parametrize("granularity", ["monthly", "weekly"])
+def test_period_totals_matches_daily_load(granularity):
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 4, 17), AllocationType.percentage, 50),
+        make_assignment(date(2026, 3, 16), date(2026, 4, 30), AllocationType.monthly_hours, 60),
+        make_assignment(
+            date(2026, 3, 20), date(2026, 4, 8), AllocationType.total_hours, 77,
+            is_tentative=True,
+        ),
+    ]
+    vacations = [
+        make_vacation(date(2026, 3, 9), date(2026, 3, 13)),
+        make_vacation(date(2026, 4, 29), date(2026, 5, 4)),
+    ]
+    _compare(assignments, vacations, None, granularity)
+
+
+@pytest.mark.parametrize("granularity", ["monthly", "weekly"])
+def test_period_totals_matches_daily_load_with_capacity_changes(granularity):
+    """Part-time capacity changing mid-period splits cells inside a period."""
+    capacities = [
+        make_capacity(date(2026, 3, 1), CapacityType.percentage, 100),
+        make_capacity(date(2026, 3, 18), CapacityType.percentage, 60),
+        make_capacity(date(2026, 4, 9), CapacityType.monthly_hours, 120),
+    ]
+    assignments = [
+        make_assignment(date(2026, 3, 1), date(2026, 4, 30), AllocationType.percentage, 75),
+        make_assignment(date(2026, 3, 25), date(2026, 4, 14), AllocationType.total_hours, 50),
+    ]
+    vacations = [make_vacation(date(2026, 4, 13), date(2026, 4, 15))]
+    _compare(assignments, vacations, capacities, granularity)
+
+
+def test_period_totals_before_first_capacity_is_unavailable():
+    """Work planned before someone joins is booked against zero availability."""
+    capacities = [make_capacity(date(2026, 4, 1), CapacityType.percentage, 100)]
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 3, 31), AllocationType.monthly_hours, 40)
+    ]
+    periods = period_windows(START, END, "monthly")
+    days = working_days_between(START, END, HOLIDAYS)
+
+    totals = period_totals(
+        assignments, [], days, period_day_bounds(days, periods), capacities
+    )
+
+    march, april = totals
+    assert march[0] == 0
+    assert round(march[1], 6) == 40
+    assert april == (Decimal(21 * 8), 0, 0)
+    _compare(assignments, [], capacities, "monthly")
+
+
+def test_period_totals_empty_range():
+    assert period_totals([], [], [], [0, 0]) == [(0, 0, 0)]
+
+
+def test_assignment_period_units_add_up_to_booked():
+    capacities = [
+        make_capacity(date(2026, 3, 1), CapacityType.percentage, 100),
+        make_capacity(date(2026, 3, 18), CapacityType.percentage, 60),
+    ]
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 4, 17), AllocationType.percentage, 50),
+        make_assignment(date(2026, 3, 20), date(2026, 4, 8), AllocationType.total_hours, 77),
+        make_assignment(date(2026, 5, 4), date(2026, 5, 29), AllocationType.monthly_hours, 60),
+    ]
+    vacations = [make_vacation(date(2026, 3, 9), date(2026, 3, 13))]
+    periods = period_windows(START, END, "monthly")
+    days = working_days_between(START, END, HOLIDAYS)
+    bounds = period_day_bounds(days, periods)
+
+    vectors = assignment_period_units(assignments, vacations, days, bounds, capacities)
+    booked = [b for _, b, _ in period_units(assignments, vacations, days, bounds, capacities)]
+
+    assert [sum(column) for column in zip(*vectors)] == booked
+    # A total_hours budget inside the range is planned in full.
+    assert round_units(sum(vectors[1]), 2) == 77
+    # Outside the range: nothing.
+    assert vectors[2] == [0, 0]
+
+
+# --- overbooked_intervals ---
+
+
+FULL_TIME = [make_capacity(date(2026, 1, 1), CapacityType.percentage, 100)]
+
+
+def _daily_runs(assignments, vacations, days, capacities):
+    """Reference: over-capacity runs found day by day."""
+    load = compute_daily_load(assignments, vacations, days, capacities)
+    runs, start = [], None
+    for i in range(len(days)):
+        if is_overbooked(load.available[i], load.booked(i)):
+            start = i if start is None else start
+        elif start is not None:
+            runs.append((start, i))
+            start = None
+    if start is not None:
+        runs.append((start, len(days)))
+    return runs
+
+
+def test_overbooked_intervals_bridge_weekends():
+    """Two 60% assignments over Mon 03-02 .. Tue 03-10 form one run."""
+    days = working_days_between(START, END, HOLIDAYS)
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 3, 10), AllocationType.percentage, 60),
+        make_assignment(date(2026, 3, 2), date(2026, 3, 31), AllocationType.percentage, 60),
+    ]
+
+    (interval,) = overbooked_intervals(assignments, [], days, FULL_TIME)
+
+    assert days[interval.start] == date(2026, 3, 2)
+    assert days[interval.end - 1] == date(2026, 3, 10)
+    assert interval.end - interval.start == 7
+    assert interval.peak_booked_hours == Decimal("9.6")
+    assert interval.peak_available_hours == 8
+    assert round(interval.excess_hours, 6) == Decimal("11.2")  # 7 * 1.6h
+
+
+def test_overbooked_intervals_percentage_pauses_on_vacation():
+    """Percentage work books nothing on vacation, so vacation splits the run."""
+    days = working_days_between(START, END, HOLIDAYS)
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 3, 13), AllocationType.percentage, 120)
+    ]
+    vacations = [make_vacation(date(2026, 3, 5), date(2026, 3, 6))]
+
+    intervals = overbooked_intervals(assignments, vacations, days, FULL_TIME)
+
+    assert [(days[i.start], days[i.end - 1]) for i in intervals] == [
+        (date(2026, 3, 2), date(2026, 3, 4)),
+        (date(2026, 3, 9), date(2026, 3, 13)),
+    ]
+
+
+def test_overbooked_intervals_zero_availability_is_the_peak():
+    """Hours-based work on a vacation day is over capacity with nothing available."""
+    days = working_days_between(START, END, HOLIDAYS)
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 3, 6), AllocationType.total_hours, 45)
+    ]
+    vacations = [make_vacation(date(2026, 3, 6), date(2026, 3, 6))]
+
+    (interval,) = overbooked_intervals(assignments, vacations, days, FULL_TIME)
+
+    assert (interval.start, interval.end) == (0, 5)  # 9h/day > 8h, then 9h > 0h
+    assert interval.peak_available_hours == 0
+    assert interval.peak_booked_hours == 9
+
+
+def test_overbooked_intervals_match_day_by_day_scan():
+    days = working_days_between(START, END, HOLIDAYS)
+    capacities = [
+        make_capacity(date(2026, 3, 1), CapacityType.percentage, 100),
+        make_capacity(date(2026, 3, 23), CapacityType.percentage, 50),
+    ]
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 4, 30), AllocationType.percentage, 70),
+        make_assignment(date(2026, 3, 12), date(2026, 4, 3), AllocationType.monthly_hours, 40),
+        make_assignment(date(2026, 4, 7), date(2026, 4, 21), AllocationType.total_hours, 30),
+    ]
+    vacations = [make_vacation(date(2026, 4, 13), date(2026, 4, 14))]
+
+    intervals = overbooked_intervals(assignments, vacations, days, capacities)
+
+    assert [(i.start, i.end) for i in intervals] == _daily_runs(
+        assignments, vacations, days, capacities
+    )
+
+
+# --- availability_runs ---
+
+
+def test_availability_runs_expand_to_the_daily_load():
+    days = working_days_between(START, END, HOLIDAYS)
+    capacities = [
+        make_capacity(date(2026, 3, 1), CapacityType.percentage, 100),
+        make_capacity(date(2026, 3, 23), CapacityType.monthly_hours, 100),
+    ]
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 4, 30), AllocationType.percentage, 70),
+        make_assignment(date(2026, 3, 12), date(2026, 4, 3), AllocationType.total_hours, 40),
+    ]
+    vacations = [make_vacation(date(2026, 4, 13), date(2026, 4, 14))]
+
+    runs = availability_runs(assignments, vacations, days, capacities)
+
+    load = compute_daily_load(assignments, vacations, days, capacities)
+    expected = [
+        (round_units(max(available - booked, 0), 2), round_units(booked, 2))
+        for available, booked in zip(load.available, load.committed)
+    ]
+    assert [(free, booked) for count, free, booked in runs for _ in range(count)] == expected
+    # Neighbouring runs always differ.
+    assert all(a[1:] != b[1:] for a, b in zip(runs, runs[1:]))
+
+
+def test_availability_runs_collapse_a_steady_schedule():
+    days = working_days_between(START, END, HOLIDAYS)
+    assignments = [make_assignment(START, END, AllocationType.percentage, 25)]
+
+    assert availability_runs(assignments, [], days, FULL_TIME) == [[len(days), 6.0, 2.0]]
+
+
+# --- free_capacity ---
+
+
+def test_free_capacity_floors_overbooked_days_at_zero():
+    """An overbooked week does not cancel out free time in the next one."""
+    days = working_days_between(date(2026, 3, 2), date(2026, 3, 13), HOLIDAYS)
+    assignments = [
+        make_assignment(date(2026, 3, 2), date(2026, 3, 6), AllocationType.percentage, 150),
+        make_assignment(date(2026, 3, 9), date(2026, 3, 13), AllocationType.percentage, 25),
+    ]
+
+    free = free_capacity(assignments, [], days, FULL_TIME)
+
+    assert free.available_hours == 80
+    assert free.booked_hours == 70  # 5 * 12h + 5 * 2h
+    assert free.free_hours == 30  # second week only: 5 * 6h
+    assert free.fit_days == 5
+
+
+def test_free_capacity_hours_per_day_and_vacation():
+    days = working_days_between(date(2026, 3, 2), date(2026, 3, 13), HOLIDAYS)
+    capacities = [make_capacity(date(2026, 1, 1), CapacityType.percentage, 50)]
+    assignments = [
+        make_assignment(date(2026, 3, 9), date(2026, 3, 13), AllocationType.percentage, 50)
+    ]
+    vacations = [make_vacation(date(2026, 3, 5), date(2026, 3, 6))]
+
+    free = free_capacity(assignments, vacations, days, capacities, hours_per_day=Decimal(3))
+
+    assert free.free_hours == 22  # 3 days * 4h + 5 days * 2h; vacation is not free
+    assert free.fit_days == 3  # only the first week has 3h free a day
+
+
+def test_hour_units_round_half_to_even():
+    assert to_units(Decimal("7.25")) == 7_250_000_000
+    assert to_units(8) == to_units(8.0) == 8_000_000_000
+    assert [div_round(n, 2) for n in (1, 3, 5, -1, -3)] == [0, 2, 2, 0, -2]
+    assert round_units(to_units(Decimal("0.25"))) == 0.2
+    assert percentage(40, 128) == 31.2  # 31.25
+    assert percentage(1, 3, 2) == 33.33
+
+
+def test_totals_are_exact_and_do_not_depend_on_order():
+    days = working_days_between(START, END, HOLIDAYS)
+    # 170h over March's 22 working days does not divide evenly.
+    assignments = [
+        make_assignment(date(2026, 3, 1), date(2026, 3, 31), AllocationType.monthly_hours, 170),
+        make_assignment(date(2026, 3, 1), date(2026, 4, 30), AllocationType.total_hours, 100),
+        make_assignment(date(2026, 3, 16), date(2026, 4, 10), AllocationType.percentage, 30),
+    ]
+
+    forward = compute_daily_load(assignments, [], days, FULL_TIME)
+    backward = compute_daily_load(assignments[::-1], [], days, FULL_TIME)
+
+    assert forward.committed == backward.committed
+    march = forward.totals(date(2026, 3, 1), date(2026, 3, 31))
+    expected = 170 + Decimal(100) * 22 / 43 + Decimal("0.3") * 8 * 12
+    assert round(march[1], 6) == round(expected, 6)
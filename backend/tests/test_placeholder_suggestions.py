@@ -0,0 +1,167 @@
+"""Unit tests for placeholder auto-fill matching (app.services.placeholder_service).
+
+Fixed dates used below: Mon 2026-03-02 .. Fri 2026-03-13, two weeks without
+Polish holidays -> 10 working days. The endpoint's range check runs on an
+in-memory SQLite database.
+"""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.assignments import suggest_placeholder_fills
+from app.database import Base
+from app.models.assignment import AllocationType, Assignment
+from app.models.employee import CapacityType
+from app.services.occupancy_service import working_days_between
+from app.models.project import Project
+from app.schemas.assignment import PlaceholderFillTarget, PlaceholderSuggestionRequest
+from app.services.placeholder_service import (
+    Candidate,
+    CandidateLoad,
+    FillRequirements,
+    suggest_fills,
+)
+
+START = date(2026, 3, 2)
+END = date(2026, 3, 13)
+DAYS = working_days_between(START, END, set())
+
+
+def make_assignment(start, end, allocation_type, value, id=None):
+    return SimpleNamespace(
+        id=id,
+        start_date=start,
+        end_date=end,
+        allocation_type=allocation_type,
+        allocation_value=Decimal(str(value)),
+        is_tentative=False,
+    )
+
+
+def make_capacity(value):
+    return SimpleNamespace(
+        valid_from=date(2026, 1, 1),
+        capacity_type=CapacityType.percentage,
+        capacity_value=Decimal(str(value)),
+    )
+
+
+def employee(employee_id, team_id=None, technologies=(), assignments=(), part_time=100):
+    return (
+        Candidate(employee_id, team_id, frozenset(technologies)),
+        CandidateLoad.build(list(assignments), [], DAYS, [make_capacity(part_time)]),
+    )
+
+
+def run(placeholders, employees, requirements=None, per_placeholder=3):
+    loads = {c.employee_id: load for c, load in employees}
+    return suggest_fills(
+        placeholders,
+        requirements or {},
+        [c for c, _ in employees],
+        loads.__getitem__,
+        DAYS,
+        per_placeholder,
+    )
+
+
+def test_freest_employee_ranks_first():
+    placeholder = make_assignment(START, END, AllocationType.percentage, 50, id=1)
+    busy = make_assignment(START, END, AllocationType.percentage, 80)
+    result = run([placeholder], [employee(1, assignments=[busy]), employee(2)])
+
+    first, second = result[1]
+    assert first.employee_id == 2
+    assert first.coverage == 1
+    assert second.employee_id == 1
+    assert second.hours == 40
+    assert second.covered_hours == 16  # 10 days * 1.6h free
+    assert second.short_days == 10
+
+
+def test_greedy_pick_is_booked_for_the_next_placeholder():
+    """Both want the one free person; the bigger one gets them."""
+    big = make_assignment(START, END, AllocationType.percentage, 100, id=1)
+    small = make_assignment(START, END, AllocationType.percentage, 50, id=2)
+    half_busy = make_assignment(START, END, AllocationType.percentage, 50)
+    result = run([small, big], [employee(1), employee(2, assignments=[half_busy])])
+
+    assert result[1][0].employee_id == 1
+    assert result[2][0].employee_id == 2
+    assert result[2][0].coverage == 1
+
+
+def test_technology_required_then_team_preferred():
+    placeholder = make_assignment(START, END, AllocationType.monthly_hours, 40, id=1)
+    requirements = {
+        1: FillRequirements(technology_ids=frozenset({7, 8}), team_ids=frozenset({3}))
+    }
+    employees = [
+        employee(1, team_id=3),  # no technology: excluded
+        employee(2, team_id=4, technologies={7}),
+        employee(3, team_id=3, technologies={8}),
+        employee(4, team_id=4, technologies={7, 8}),
+    ]
+
+    result = run([placeholder], employees, requirements)
+
+    assert [o.employee_id for o in result[1]] == [4, 3, 2]
+    assert [o.matched_technologies for o in result[1]] == [2, 1, 1]
+    assert [o.in_team for o in result[1]] == [False, True, False]
+
+
+def test_percentage_scales_with_part_time_contract():
+    """50% of a half-time person is 2h a day, as the timeline would show."""
+    placeholder = make_assignment(START, END, AllocationType.percentage, 50, id=1)
+    result = run([placeholder], [employee(1, part_time=50)])
+
+    (option,) = result[1]
+    assert option.hours == 20
+    assert option.coverage == 1
+
+
+def test_fully_booked_employee_is_not_an_option():
+    placeholder = make_assignment(START, END, AllocationType.total_hours, 20, id=1)
+    full = make_assignment(START, END, AllocationType.percentage, 100)
+    result = run([placeholder], [employee(1, assignments=[full])], per_placeholder=1)
+
+    assert result[1] == []
+
+
+def test_batch_spanning_more_than_three_years_is_rejected():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def suggest(*spans):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as db:
+            project = Project(name="Alpha", color="#3B82F6")
+            placeholders = [
+                Assignment(
+                    project=project,
+                    start_date=start,
+                    end_date=end,
+                    allocation_type=AllocationType.total_hours,
+                    allocation_value=Decimal("20"),
+                )
+                for start, end in spans
+            ]
+            db.add_all([project, *placeholders])
+            await db.commit()
+            body = PlaceholderSuggestionRequest(
+                placeholders=[PlaceholderFillTarget(assignment_id=p.id) for p in placeholders]
+            )
+            return await suggest_placeholder_fills(body, db=db, _user=None)
+
+    # Each placeholder is short, but together they span four years.
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(suggest((START, END), (date(2030, 3, 4), date(2030, 3, 8))))
+    assert exc.value.status_code == 400
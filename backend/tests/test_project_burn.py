@@ -0,0 +1,199 @@
+"""Tests for the project burn reports, on an in-memory SQLite database.
+
+March 2026 has 22 working days, April 2026 has 21 (Easter Monday 04-06).
+"""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.projects import get_project_burn, get_projects_burn
+from app.database import Base
+from app.models.assignment import AllocationType, Assignment
+from app.models.employee import CapacityType, Employee, EmployeeCapacity
+from app.models.project import Project
+from app.models.vacation import Vacation
+
+
+def make_assignment(project, employee, start, end, allocation_type, value):
+    return Assignment(
+        project=project,
+        employee=employee,
+        start_date=start,
+        end_date=end,
+        allocation_type=allocation_type,
+        allocation_value=Decimal(str(value)),
+    )
+
+
+@pytest.fixture
+def factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as db:
+            alpha = Project(name="Alpha", color="#3B82F6")
+            beta = Project(name="Beta", color="#10B981")
+            gamma = Project(name="Gamma", color="#000000", is_archived=True)
+            # Half-time: 4 h a day.
+            emp = Employee(first_name="Jan", last_name="Kowalski")
+            emp.capacities = [
+                EmployeeCapacity(
+                    valid_from=date(1900, 1, 1),
+                    capacity_type=CapacityType.percentage,
+                    capacity_value=Decimal("50"),
+                )
+            ]
+            db.add_all([alpha, beta, gamma, emp])
+            db.add_all(
+                [
+                    make_assignment(
+                        alpha, emp, date(2026, 3, 1), date(2026, 3, 31),
+                        AllocationType.percentage, 100,
+                    ),
+                    # 33 working days, 2 h each.
+                    make_assignment(
+                        alpha, emp, date(2026, 3, 16), date(2026, 4, 30),
+                        AllocationType.total_hours, 66,
+                    ),
+                    make_assignment(
+                        alpha, None, date(2026, 3, 2), date(2026, 4, 30),
+                        AllocationType.monthly_hours, 40,
+                    ),
+                    make_assignment(
+                        gamma, emp, date(2026, 3, 1), date(2026, 3, 31),
+                        AllocationType.monthly_hours, 10,
+                    ),
+                ]
+            )
+            await db.flush()
+            db.add(
+                Vacation(
+                    employee_id=emp.id,
+                    employee_email="jan.kowalski@example.com",
+                    start_date=date(2026, 3, 9),
+                    end_date=date(2026, 3, 10),
+                    leave_type="vacation",
+                    calamari_id="v-1",
+                )
+            )
+            await db.commit()
+            return alpha.id
+
+    factory.alpha_id = asyncio.run(create())
+    return factory
+
+
+def call(factory, handler, **params) -> dict:
+    async def run():
+        async with factory() as db:
+            response = await handler(**params, db=db, _user=None)
+        return orjson.loads(response.body)
+
+    return asyncio.run(run())
+
+
+def test_project_burn_per_month_and_assignment(factory):
+    burn = call(
+        factory, get_project_burn, project_id=factory.alpha_id, start_date=None, end_date=None
+    )
+
+    # Defaults to the months the assignments span.
+    assert (burn["start_date"], burn["end_date"]) == ("2026-03-01", "2026-04-30")
+    assert burn["months"] == ["2026-03", "2026-04"]
+    by_type = {a["allocation_type"]: a for a in burn["assignments"]}
+    # 100% of a 4 h day, except the two vacation days.
+    assert by_type["percentage"]["hours"] == [80.0, 0.0]
+    assert by_type["total_hours"]["hours"] == [24.0, 42.0]
+    assert by_type["total_hours"]["total_hours"] == 66.0
+    assert by_type["monthly_hours"]["employee_name"] is None
+    assert by_type["monthly_hours"]["hours"] == [40.0, 40.0]
+    assert burn["hours"] == [144.0, 82.0]
+    assert burn["cumulative_hours"] == [144.0, 226.0]
+    assert burn["total_hours"] == 226.0
+
+    # A range is widened to whole months; assignments outside it are left out.
+    april = call(
+        factory,
+        get_project_burn,
+        project_id=factory.alpha_id,
+        start_date=date(2026, 4, 10),
+        end_date=date(2026, 4, 20),
+    )
+    assert april["months"] == ["2026-04"]
+    assert april["hours"] == [82.0]
+    assert len(april["assignments"]) == 2
+
+
+def test_batch_burn_shares_the_months(factory):
+    burn = call(
+        factory,
+        get_projects_burn,
+        start_date=date(2026, 2, 1),
+        end_date=date(2026, 4, 30),
+        project_status="active",
+        include_assignments=True,
+    )
+    assert burn["months"] == ["2026-02", "2026-03", "2026-04"]
+    assert [(p["name"], p["hours"]) for p in burn["projects"]] == [
+        ("Alpha", [0.0, 144.0, 82.0]),
+        ("Beta", [0.0, 0.0, 0.0]),
+    ]
+
+    everything = call(
+        factory,
+        get_projects_burn,
+        start_date=date(2026, 3, 1),
+        end_date=date(2026, 3, 31),
+        project_status="all",
+        include_assignments=False,
+    )
+    assert [p["total_hours"] for p in everything["projects"]] == [144.0, 0.0, 10.0]
+    assert "assignments" not in everything["projects"][0]
+
+
+def test_burn_errors(factory):
+    with pytest.raises(HTTPException) as exc:
+        call(factory, get_project_burn, project_id=999, start_date=None, end_date=None)
+    assert exc.value.status_code == 404
+
+    with pytest.raises(HTTPException) as exc:
+        call(
+            factory,
+            get_projects_burn,
+            start_date=date(2026, 4, 1),
+            end_date=date(2026, 3, 1),
+            project_status="active",
+            include_assignments=True,
+        )
+    assert exc.value.status_code == 400
+
+    # The default range is checked too: a placeholder running to 2099.
+    async def add_long_placeholder():
+        async with factory() as db:
+            db.add(
+                Assignment(
+                    project_id=factory.alpha_id,
+                    start_date=date(2026, 3, 1),
+                    end_date=date(2099, 12, 31),
+                    allocation_type=AllocationType.percentage,
+                    allocation_value=Decimal("50"),
+                )
+            )
+            await db.commit()
+
+    asyncio.run(add_long_placeholder())
+    with pytest.raises(HTTPException) as exc:
+        call(
+            factory, get_project_burn, project_id=factory.alpha_id, start_date=None, end_date=None
+        )
+    assert exc.value.status_code == 400
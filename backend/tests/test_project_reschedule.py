@@ -0,0 +1,138 @@
+"""Tests for project shift/stretch date mappings (app.services.reschedule_service).
+
+The mappings are pure, so they are tested without a DB; the endpoints only
+load the distinct dates and apply the maps in one UPDATE, which is checked on
+an in-memory SQLite database.
+"""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.assignment import AllocationType, Assignment
+from app.models.project import Project
+from app.services.reschedule_service import (
+    ProjectDates,
+    apply_date_maps,
+    shift_date_map,
+    stretch_date_maps,
+)
+from app.utils.working_days import get_working_days
+
+
+class TestShiftDateMap:
+    def test_preserves_working_day_length(self):
+        # Mon 2026-03-02 .. Fri 2026-03-13: 10 working days.
+        start, end = date(2026, 3, 2), date(2026, 3, 13)
+        for n in (1, 5, 23, -7):
+            (new_start,) = shift_date_map({start}, n).values()
+            (new_end,) = shift_date_map({end}, n).values()
+            assert get_working_days(new_start, new_end) == 10
+
+    def test_shift_over_holiday(self):
+        """Thu 2026-04-30 + 1: May 1 (Fri) holiday and weekend -> Mon 05-04."""
+        assert shift_date_map({date(2026, 4, 30)}, 1) == {
+            date(2026, 4, 30): date(2026, 5, 4)
+        }
+
+
+class TestStretchDateMaps:
+    # March 2026: 22 working days (Mon 2 .. Tue 31).
+    MARCH = ProjectDates(
+        starts={date(2026, 3, 2), date(2026, 3, 16)},
+        ends={date(2026, 3, 13), date(2026, 3, 31)},
+    )
+
+    def test_window_maps_onto_new_window(self):
+        # March + April 2026 (April has Easter Monday) -> new first/last working day.
+        start_map, end_map = stretch_date_maps(
+            self.MARCH, date(2026, 3, 1), date(2026, 4, 30)
+        )
+        assert start_map[date(2026, 3, 2)] == date(2026, 3, 2)
+        assert end_map[date(2026, 3, 31)] == date(2026, 4, 30)
+
+    def test_identity_when_window_unchanged(self):
+        start_map, end_map = stretch_date_maps(
+            self.MARCH, date(2026, 3, 2), date(2026, 3, 31)
+        )
+        assert all(k == v for k, v in start_map.items())
+        assert all(k == v for k, v in end_map.items())
+
+    def test_doubling_doubles_single_day(self):
+        """A one-working-day assignment covers two working days after doubling."""
+        dates = ProjectDates(
+            starts={date(2026, 3, 2), date(2026, 3, 3)},
+            ends={date(2026, 3, 2), date(2026, 3, 3)},
+        )  # window: 2 working days -> 4 working days
+        start_map, end_map = stretch_date_maps(dates, date(2026, 3, 2), date(2026, 3, 5))
+        assert (start_map[date(2026, 3, 3)], end_map[date(2026, 3, 3)]) == (
+            date(2026, 3, 4),
+            date(2026, 3, 5),
+        )
+
+    def test_compress_keeps_at_least_one_day(self):
+        start_map, end_map = stretch_date_maps(
+            self.MARCH, date(2026, 3, 2), date(2026, 3, 2)
+        )
+        assert set(start_map.values()) == {date(2026, 3, 2)}
+        assert set(end_map.values()) == {date(2026, 3, 2)}
+
+    def test_new_window_without_working_days_rejected(self):
+        with pytest.raises(ValueError):
+            stretch_date_maps(self.MARCH, date(2026, 3, 7), date(2026, 3, 8))
+
+
+def test_apply_date_maps_keeps_dates_missing_from_the_maps():
+    """An assignment added after the maps were built keeps its dates."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    def assignment(project, start, end):
+        return Assignment(
+            project=project,
+            start_date=start,
+            end_date=end,
+            allocation_type=AllocationType.percentage,
+            allocation_value=Decimal("50"),
+        )
+
+    async def scenario():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as db:
+            project = Project(name="Alpha", color="#3B82F6")
+            db.add_all(
+                [
+                    assignment(project, date(2026, 3, 2), date(2026, 3, 13)),
+                    assignment(project, date(2026, 3, 16), date(2026, 3, 20)),
+                ]
+            )
+            await db.commit()
+            updated = await apply_date_maps(
+                db,
+                project.id,
+                {date(2026, 3, 2): date(2026, 3, 3)},
+                {date(2026, 3, 13): date(2026, 3, 16)},
+            )
+            await db.commit()
+            rows = (
+                await db.execute(
+                    select(Assignment.start_date, Assignment.end_date).order_by(
+                        Assignment.start_date
+                    )
+                )
+            ).all()
+        return updated, [tuple(r) for r in rows]
+
+    updated, rows = asyncio.run(scenario())
+    assert updated == 2
+    assert rows == [
+        (date(2026, 3, 3), date(2026, 3, 16)),
+        (date(2026, 3, 16), date(2026, 3, 20)),
+    ]
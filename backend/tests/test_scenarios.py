@@ -0,0 +1,197 @@
+"""Unit tests for what-if scenarios (app.services.scenario_service).
+
+Scenarios are built from in-memory data directly (no database). Fixed dates:
+March 2026 has 22 working days, April 2026 has 21 (Easter Monday 04-06).
+"""
+
+import time
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.assignment import AllocationType
+from app.models.employee import CapacityType
+from app.schemas.assignment import (
+    BulkCreateOperation,
+    BulkDeleteOperation,
+    BulkUpdateOperation,
+)
+from app.schemas.scenario import ScenarioLeave, ScenarioShiftProject
+from app.services.scenario_service import (
+    Scenario,
+    ScenarioAssignment,
+    ScenarioCapacity,
+    ScenarioEditError,
+    ScenarioStore,
+)
+
+FULL_TIME = [ScenarioCapacity(date(2020, 1, 1), CapacityType.percentage, Decimal(100))]
+
+
+def make_assignment(id, employee_id, start, end, value=50, project_id=1):
+    return ScenarioAssignment(
+        id=id,
+        employee_id=employee_id,
+        project_id=project_id,
+        start_date=start,
+        end_date=end,
+        allocation_type=AllocationType.percentage,
+        allocation_value=Decimal(value),
+        is_tentative=False,
+        seq=id,
+    )
+
+
+def make_scenario(assignments, owner_id=1):
+    return Scenario(
+        id="s1",
+        owner_id=owner_id,
+        start_date=date(2026, 3, 1),
+        end_date=date(2026, 4, 30),
+        granularity="monthly",
+        employees={1: ("Nowak Anna", "Backend"), 2: ("Kowalski Jan", "Backend")},
+        archived_employees={9},
+        projects={1: False, 2: False, 3: True},
+        capacities={1: FULL_TIME, 2: FULL_TIME},
+        vacations={},
+        assignments={a.id: a for a in assignments},
+    )
+
+
+def test_moving_an_assignment_changes_both_employees():
+    scenario = make_scenario(
+        [make_assignment(10, 1, date(2026, 3, 2), date(2026, 3, 31), value=100)]
+    )
+
+    scenario.apply([BulkUpdateOperation(op="update", id=10, employee_id=2)])
+    assert scenario.evaluate() == 2
+    diff = scenario.diff()
+
+    by_id = {e["id"]: e for e in diff["employees"]}
+    assert set(by_id) == {1, 2}
+    assert set(by_id[1]["periods"]) == {"2026-03"}
+    assert by_id[1]["periods"]["2026-03"]["baseline"]["percentage"] == 100.0
+    assert by_id[1]["periods"]["2026-03"]["scenario"]["percentage"] == 0.0
+    assert by_id[2]["periods"]["2026-03"]["scenario"]["hours"] == 176.0  # 22 * 8h
+
+
+def test_only_touched_employees_are_recomputed():
+    scenario = make_scenario(
+        [
+            make_assignment(10, 1, date(2026, 3, 2), date(2026, 3, 31)),
+            make_assignment(11, 2, date(2026, 3, 2), date(2026, 3, 31)),
+        ]
+    )
+    scenario.apply([BulkDeleteOperation(op="delete", id=10)])
+    assert scenario.evaluate() == 1
+    assert scenario.evaluate() == 0
+
+    scenario.apply([BulkDeleteOperation(op="delete", id=11)])
+    assert scenario.evaluate() == 1
+    assert {e["id"] for e in scenario.diff()["employees"]} == {1, 2}
+
+
+def test_failed_edit_undoes_the_whole_batch():
+    scenario = make_scenario([make_assignment(10, 1, date(2026, 3, 2), date(2026, 3, 31))])
+    create = BulkCreateOperation(
+        op="create",
+        employee_id=2,
+        project_id=1,
+        start_date=date(2026, 4, 1),
+        end_date=date(2026, 4, 30),
+        allocation_type="percentage",
+        allocation_value=Decimal(50),
+    )
+
+    with pytest.raises(ScenarioEditError) as exc:
+        scenario.apply(
+            [
+                create,
+                BulkUpdateOperation(op="update", id=10, start_date=date(2026, 3, 9)),
+                BulkUpdateOperation(op="update", id=10, project_id=3),
+            ]
+        )
+
+    assert exc.value.index == 2
+    assert exc.value.status_code == 409
+    assert set(scenario.assignments) == {10}
+    assert scenario.assignments[10].start_date == date(2026, 3, 2)
+    assert scenario.edit_count == 0
+    scenario.evaluate()
+    assert scenario.diff()["employees"] == []
+
+
+def test_edit_errors_mirror_the_endpoints():
+    scenario = make_scenario([])
+    with pytest.raises(ScenarioEditError) as exc:
+        scenario.apply([BulkDeleteOperation(op="delete", id=404)])
+    assert exc.value.status_code == 404
+    with pytest.raises(ScenarioEditError) as exc:
+        scenario.apply([ScenarioLeave(op="leave", employee_id=9, last_day=date(2026, 3, 1))])
+    assert exc.value.status_code == 409
+
+
+def test_leave_winds_down_work_and_zeroes_capacity():
+    scenario = make_scenario(
+        [
+            make_assignment(10, 1, date(2026, 3, 2), date(2026, 4, 30)),  # trimmed
+            make_assignment(11, 1, date(2026, 4, 13), date(2026, 4, 30)),  # deleted
+        ]
+    )
+
+    scenario.apply([ScenarioLeave(op="leave", employee_id=1, last_day=date(2026, 3, 31))])
+    scenario.evaluate()
+
+    assert set(scenario.assignments) == {10}
+    assert scenario.assignments[10].end_date == date(2026, 3, 31)
+    (employee,) = scenario.diff()["employees"]
+    assert set(employee["periods"]) == {"2026-04"}
+    april = employee["periods"]["2026-04"]["scenario"]
+    assert april["available_hours"] == 0.0
+    assert april["hours"] == 0.0
+
+
+def test_shift_project_moves_only_its_assignments():
+    scenario = make_scenario(
+        [
+            make_assignment(10, 1, date(2026, 3, 2), date(2026, 3, 6), project_id=1),
+            make_assignment(11, 2, date(2026, 3, 2), date(2026, 3, 6), project_id=2),
+        ]
+    )
+
+    scenario.apply([ScenarioShiftProject(op="shift_project", project_id=1, working_days=5)])
+
+    assert scenario.assignments[10].start_date == date(2026, 3, 9)
+    assert scenario.assignments[10].end_date == date(2026, 3, 13)
+    assert scenario.assignments[11].start_date == date(2026, 3, 2)
+    assert scenario.evaluate() == 1
+
+
+# --- ScenarioStore ---
+
+
+def test_store_hides_other_users_scenarios():
+    store = ScenarioStore()
+    store.add(make_scenario([], owner_id=1))
+
+    assert store.get("s1", 2) is None
+    assert not store.remove("s1", 2)
+    assert store.get("s1", 1) is not None
+    assert store.remove("s1", 1)
+    assert store.get("s1", 1) is None
+
+
+def test_store_evicts_least_recently_used_and_expired():
+    store = ScenarioStore(max_scenarios=2, ttl_seconds=60)
+    for scenario_id in ("a", "b"):
+        store.add(SimpleNamespace(id=scenario_id, owner_id=1, last_used=time.monotonic()))
+    assert store.get("a", 1) is not None  # now "b" is the least recently used
+    store.add(SimpleNamespace(id="c", owner_id=1, last_used=time.monotonic()))
+    assert store.get("b", 1) is None
+    assert store.get("a", 1) is not None
+
+    store = ScenarioStore(ttl_seconds=0)
+    store.add(SimpleNamespace(id="a", owner_id=1, last_used=0.0))
+    assert store.get("a", 1) is None
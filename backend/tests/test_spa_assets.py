@@ -0,0 +1,67 @@
+"""Unit tests for serving the frontend build from memory (app.core.spa)."""
+
+import brotli
+import pytest
+from starlette.requests import Request
+
+from app.core.spa import IMMUTABLE_CACHE_CONTROL, SpaAssets
+
+BUNDLE = "export const x = 1;\n" * 200
+
+
+def _request(**headers):
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def spa(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<!doctype html><div id=root></div>")
+    (tmp_path / "assets" / "index-3f2a1b.js").write_text(BUNDLE)
+    (tmp_path / "assets" / "logo-9c8d7e.png").write_bytes(bytes(range(256)))
+    return SpaAssets.load(tmp_path)
+
+
+def test_hashed_assets_are_precompressed_and_immutable(spa):
+    response = spa.response(
+        "assets/index-3f2a1b.js", _request(accept_encoding="gzip, br")
+    )
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert brotli.decompress(response.body) == BUNDLE.encode()
+    assert "javascript" in response.headers["content-type"]
+
+    plain = spa.response("assets/index-3f2a1b.js", _request())
+    assert "content-encoding" not in plain.headers
+    assert plain.body == BUNDLE.encode()
+    assert plain.headers["etag"] != response.headers["etag"]
+
+    image = spa.response("assets/logo-9c8d7e.png", _request(accept_encoding="br"))
+    assert "content-encoding" not in image.headers
+
+
+def test_routes_fall_back_to_index_and_revalidate(spa):
+    response = spa.response("projects/12", _request())
+    assert response.body.startswith(b"<!doctype html>")
+    assert response.headers["cache-control"] == "no-cache"
+
+    revalidated = spa.response(
+        "projects/12", _request(if_none_match=response.headers["etag"])
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
+
+
+def test_missing_and_outside_paths(spa):
+    assert spa.response("assets/gone-000000.js", _request()).status_code == 404
+    outside = spa.response("../../etc/passwd", _request())
+    assert outside.body.startswith(b"<!doctype html>")
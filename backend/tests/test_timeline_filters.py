@@ -0,0 +1,176 @@
+"""Tests for the timeline's occupancy filters and sort, on an in-memory SQLite database."""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.calendar import get_timeline
+from app.database import Base
+from app.models.assignment import AllocationType, Assignment
+from app.models.employee import CapacityType, Employee, EmployeeCapacity
+from app.models.project import Project
+
+START = date(2026, 3, 1)
+END = date(2026, 3, 31)
+APRIL = (date(2026, 4, 1), date(2026, 4, 30))
+NO_FILTER = {
+    "min_occupancy": None,
+    "max_occupancy": None,
+    "overbooked_only": False,
+    "occupancy_from": None,
+    "occupancy_to": None,
+    "sort": "name",
+}
+
+
+@pytest.fixture
+def factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    def employee(last_name, *allocations):
+        emp = Employee(first_name="Jan", last_name=last_name)
+        emp.capacities = [
+            EmployeeCapacity(
+                valid_from=date(1900, 1, 1),
+                capacity_type=CapacityType.percentage,
+                capacity_value=Decimal("100"),
+            )
+        ]
+        assignments = [
+            Assignment(
+                employee=emp,
+                project=project,
+                start_date=start,
+                end_date=end,
+                allocation_type=AllocationType.percentage,
+                allocation_value=Decimal(str(value)),
+            )
+            for start, end, value in allocations
+        ]
+        return [emp, *assignments]
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as db:
+            db.add(project)
+            # Busy in March, free in April
+            db.add_all(employee("Adamski", (START, END, 100)))
+            # Half-booked in both months
+            db.add_all(employee("Borowa", (START, APRIL[1], 50)))
+            # Overbooked for one April week only
+            db.add_all(
+                employee(
+                    "Celiński",
+                    (START, APRIL[1], 20),
+                    (date(2026, 4, 13), date(2026, 4, 17), 100),
+                )
+            )
+            await db.commit()
+
+    project = Project(name="Alpha", color="#3B82F6")
+    asyncio.run(create())
+    return factory
+
+
+def timeline(factory, **filters) -> dict:
+    async def call():
+        async with factory() as db:
+            response = await get_timeline(
+                start_date=START,
+                end_date=END,
+                team_ids=None,
+                technology_ids=None,
+                search=None,
+                granularity="monthly",
+                format="rows",
+                **{**NO_FILTER, **filters},
+                db=db,
+                _user=None,
+            )
+        return orjson.loads(response.body)
+
+    return asyncio.run(call())
+
+
+def names(payload: dict) -> list[str]:
+    return [e["name"].split()[0] for e in payload["employees"]]
+
+
+def test_window_outside_the_range_filters_without_widening_it(factory):
+    free_in_april = timeline(
+        factory, occupancy_from=APRIL[0], occupancy_to=APRIL[1], max_occupancy=30
+    )
+    assert names(free_in_april) == ["Adamski"]
+    # Only March is reported, and only March's assignments are listed.
+    adamski = free_in_april["employees"][0]
+    assert list(adamski["occupancy"]) == ["2026-03"]
+    assert adamski["occupancy"]["2026-03"]["percentage"] == 100
+    everyone = timeline(factory, occupancy_from=APRIL[0], occupancy_to=APRIL[1])
+    assert [len(e["assignments"]) for e in everyone["employees"]] == [1, 1, 1]
+
+    busy_in_march = timeline(factory, min_occupancy=90)
+    assert names(busy_in_march) == ["Adamski"]
+
+
+def test_overbooked_only_looks_at_single_days(factory):
+    # Celiński's April is under 50% on average, but one week is 120%.
+    overbooked = timeline(
+        factory, occupancy_from=APRIL[0], occupancy_to=APRIL[1], overbooked_only=True
+    )
+    assert names(overbooked) == ["Celiński"]
+    assert names(timeline(factory, overbooked_only=True)) == []
+
+
+def test_sort_by_window_occupancy(factory):
+    assert names(timeline(factory, sort="occupancy_desc")) == ["Adamski", "Borowa", "Celiński"]
+    assert names(
+        timeline(factory, occupancy_from=APRIL[0], occupancy_to=APRIL[1], sort="occupancy_desc")
+    ) == ["Borowa", "Celiński", "Adamski"]
+    assert names(timeline(factory, sort="occupancy_asc")) == ["Celiński", "Borowa", "Adamski"]
+
+
+def test_booked_without_capacity_is_over_any_limit(factory):
+    async def add():
+        async with factory() as db:
+            emp = Employee(first_name="Jan", last_name="Dąbek")
+            emp.capacities = [
+                EmployeeCapacity(
+                    valid_from=date(1900, 1, 1),
+                    capacity_type=CapacityType.percentage,
+                    capacity_value=Decimal("0"),
+                )
+            ]
+            db.add_all(
+                [
+                    emp,
+                    Assignment(
+                        employee=emp,
+                        project=Project(name="Beta", color="#10B981"),
+                        start_date=APRIL[0],
+                        end_date=APRIL[1],
+                        allocation_type=AllocationType.monthly_hours,
+                        allocation_value=Decimal("40"),
+                    ),
+                ]
+            )
+            await db.commit()
+
+    asyncio.run(add())
+    april = {"occupancy_from": APRIL[0], "occupancy_to": APRIL[1]}
+    # 40 h booked against no capacity: reported as 0%, filtered as overbooked.
+    assert names(timeline(factory, **april, max_occupancy=30)) == ["Adamski"]
+    assert names(timeline(factory, **april, min_occupancy=90)) == ["Dąbek"]
+
+
+def test_inverted_window_is_rejected(factory):
+    with pytest.raises(HTTPException) as exc:
+        timeline(factory, occupancy_from=APRIL[1], occupancy_to=APRIL[0])
+    assert exc.value.status_code == 400
@@ -1,6 +1,10 @@
 from datetime import date
 
-from app.utils.working_days import get_working_days, get_working_days_in_month
+from app.utils.working_days import (
+    add_working_days,
+    get_working_days,
+    get_working_days_in_month,
+)
 
 
 def test_january_2026():
@@ -59,3 +63,22 @@ def test_cross_month_range():
     Total = 5
     """
     assert get_working_days(date(2026, 1, 28), date(2026, 2, 3)) == 5
+
+
+def test_add_working_days_skips_weekend_and_easter():
+    """Fri 2026-04-03 + 1: Sat, Sun (Easter), Mon (Easter Monday) skipped -> Tue 04-07."""
+    assert add_working_days(date(2026, 4, 3), 1) == date(2026, 4, 7)
+
+
+def test_add_working_days_backwards_across_year():
+    """Fri 2026-01-02 - 1: Jan 1 is a holiday -> Wed 2025-12-31."""
+    assert add_working_days(date(2026, 1, 2), -1) == date(2025, 12, 31)
+
+
+def test_add_working_days_zero_keeps_date():
+    assert add_working_days(date(2026, 1, 3), 0) == date(2026, 1, 3)
+
+
+def test_add_working_days_non_working_start():
+    """Sat 2026-01-10 + 1 -> Mon 2026-01-12 (first working day after)."""
+    assert add_working_days(date(2026, 1, 10), 1) == date(2026, 1, 12)
@@ -1,5 +1,6 @@
 import { apiFetch } from "./client";
 import type { TimelineData, AssignmentCreateData } from "@/types/assignment";
+import type { OccupancyFilter } from "@/types/timeline";
 
 export function fetchTimeline(
   startDate: string,
@@ -8,6 +9,7 @@ export function fetchTimeline(
   technologyIds?: number[],
   search?: string,
   granularity: "monthly" | "weekly" = "monthly",
+  occupancyFilter?: OccupancyFilter | null,
 ): Promise<TimelineData> {
   const params = new URLSearchParams({
     start_date: startDate,
@@ -23,6 +25,18 @@ export function fetchTimeline(
   if (search) {
     params.set("search", search);
   }
+  // Filtered on the server, which leaves out non-matching employees entirely.
+  // Without a percentage bound the window alone filters nothing.
+  if (
+    occupancyFilter &&
+    (occupancyFilter.minPct !== null || occupancyFilter.maxPct !== null)
+  ) {
+    const { dateFrom, dateTo, minPct, maxPct } = occupancyFilter;
+    if (dateFrom) params.set("occupancy_from", dateFrom);
+    if (dateTo) params.set("occupancy_to", dateTo);
+    if (minPct !== null) params.set("min_occupancy", String(minPct));
+    if (maxPct !== null) params.set("max_occupancy", String(maxPct));
+  }
   return apiFetch<TimelineData>(`/api/assignments/timeline?${params}`);
 }
 
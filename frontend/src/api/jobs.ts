@@ -0,0 +1,22 @@
+import { apiFetch } from "./client";
+import type { Job } from "@/types/job";
+
+const POLL_INTERVAL_MS = 1000;
+
+export function fetchJob<TResult>(id: number): Promise<Job<TResult>> {
+  return apiFetch<Job<TResult>>(`/api/jobs/${id}`);
+}
+
+/** Poll a background job until it finishes; rejects if it failed. */
+export async function waitForJob<TResult>(
+  job: Job<TResult>,
+): Promise<TResult> {
+  while (job.status === "queued" || job.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    job = await fetchJob<TResult>(job.id);
+  }
+  if (job.status === "failed") {
+    throw new Error(job.error ?? "Zadanie nie powiodło się");
+  }
+  return job.result as TResult;
+}
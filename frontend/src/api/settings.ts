@@ -1,4 +1,6 @@
 import { apiFetch } from "./client";
+import { waitForJob } from "./jobs";
+import type { Job } from "@/types/job";
 import type { CalamariConfig } from "@/types/settings";
 
 export function fetchCalamariConfig(): Promise<CalamariConfig> {
@@ -19,6 +21,11 @@ export function deleteCalamariConfig(): Promise<{ status: string; message: strin
   return apiFetch("/api/settings/calamari", { method: "DELETE" });
 }
 
-export function triggerVacationSync(): Promise<{ status: string; synced: number }> {
-  return apiFetch("/api/calendar/vacations/sync", { method: "POST" });
+/** Queue a vacation sync and wait for it to finish. */
+export async function triggerVacationSync(): Promise<{ synced: number }> {
+  const job = await apiFetch<Job<{ synced: number }>>(
+    "/api/calendar/vacations/sync",
+    { method: "POST" },
+  );
+  return waitForJob(job);
 }
@@ -15,7 +15,7 @@ import {
   useSensor,
   useSensors,
 } from "@dnd-kit/core";
-import { addDays, parseISO, format, getDay } from "date-fns";
+import { addDays, parseISO, format } from "date-fns";
 import { pl } from "date-fns/locale";
 import { Copy, Plus, Scissors } from "lucide-react";
 import { useMutation, useQueryClient } from "@tanstack/react-query";
@@ -39,67 +39,16 @@ import type { TimelineAssignment, VacationInfo } from "@/types/assignment";
 import { triggerVacationSync } from "@/api/settings";
 import { VacationDialog } from "./VacationDialog";
 import { TimelineEmptyState } from "./TimelineEmptyState";
-import type { VacationRange } from "@/types/timeline";
 import {
   TIMELINE_LEFT_PANEL_WIDTH,
   PLACEHOLDER_EMPLOYEE_ID,
 } from "@/lib/constants";
-import { dailyCapacityHours } from "@/lib/capacity";
-import type { CapacityPeriod } from "@/types/employee";
 import { TimelineBarDragPreview } from "./TimelineBarDragPreview";
 
 type TimelineProps = {
   onNavigate?: (path: string) => void;
 };
 
-function calcOccupancyInRange(
-  assignments: TimelineAssignment[],
-  vacations: VacationRange[],
-  holidayMap: Record<string, string>,
-  dateFrom: string | null,
-  dateTo: string | null,
-  visibleStart: Date,
-  visibleEnd: Date,
-  capacityPeriods: CapacityPeriod[] | undefined,
-): number {
-  const rangeStart = dateFrom ? parseISO(dateFrom) : visibleStart;
-  const rangeEnd = dateTo ? parseISO(dateTo) : visibleEnd;
-
-  let totalHours = 0;
-  // Measured against what the person is contracted for, so a part-timer with a
-  // full plate reads as 100% and survives a "busier than 80%" filter.
-  let availableHours = 0;
-
-  let current = rangeStart;
-  while (current <= rangeEnd) {
-    const dow = getDay(current); // 0=Sun, 6=Sat
-    const dateKey = format(current, "yyyy-MM-dd");
-    if (dow !== 0 && dow !== 6 && !holidayMap[dateKey]) {
-      availableHours += dailyCapacityHours(capacityPeriods, dateKey);
-
-      const isOnVacation = vacations.some((v) => {
-        const vStart = parseISO(v.start_date);
-        const vEnd = parseISO(v.end_date);
-        return current >= vStart && current <= vEnd;
-      });
-
-      if (!isOnVacation) {
-        for (const a of assignments) {
-          const aStart = parseISO(a.start_date);
-          const aEnd = parseISO(a.end_date);
-          if (current >= aStart && current <= aEnd) {
-            totalHours += a.daily_hours;
-          }
-        }
-      }
-    }
-    current = addDays(current, 1);
-  }
-
-  if (availableHours === 0) return 0;
-  return Math.round((totalHours / availableHours) * 100);
-}
-
 export function Timeline({ onNavigate }: TimelineProps = {}) {
   const queryClient = useQueryClient();
   const {
@@ -109,11 +58,8 @@ export function Timeline({ onNavigate }: TimelineProps = {}) {
     weeks,
     allDays,
     viewMode,
-    startDate,
-    endDate,
   } = useTimeline();
   const searchQuery = useTimelineStore((s) => s.searchQuery);
-  const occupancyFilter = useTimelineStore((s) => s.occupancyFilter);
   const currentUser = useAuthStore((s) => s.user);
   const isViewer = currentUser?.role === "viewer";
   const isAdmin = currentUser?.role === "admin";
@@ -443,27 +389,8 @@ export function Timeline({ onNavigate }: TimelineProps = {}) {
     setModalOpen(true);
   };
 
-  const displayedEmployees = useMemo(() => {
-    const employees = data?.employees ?? [];
-    if (!occupancyFilter) return employees;
-    const { dateFrom, dateTo, minPct, maxPct } = occupancyFilter;
-    if (minPct === null && maxPct === null) return employees;
-    return employees.filter((emp) => {
-      const pct = calcOccupancyInRange(
-        emp.assignments,
-        emp.vacations ?? [],
-        holidayMap,
-        dateFrom,
-        dateTo,
-        startDate,
-        endDate,
-        emp.capacity_periods,
-      );
-      if (minPct !== null && pct < minPct) return false;
-      if (maxPct !== null && pct > maxPct) return false;
-      return true;
-    });
-  }, [data, occupancyFilter, startDate, endDate, holidayMap]);
+  // The occupancy filter is applied by the server (see useTimeline).
+  const displayedEmployees = data?.employees ?? [];
 
   return (
     <div>
@@ -1,6 +1,6 @@
 import { useQuery } from "@tanstack/react-query";
 import { useDebouncedValue } from "./useDebouncedValue";
-import { addMonths, addWeeks, format, parseISO } from "date-fns";
+import { addMonths, addWeeks, format } from "date-fns";
 import { pl } from "date-fns/locale";
 import { fetchTimeline } from "@/api/assignments";
 import { useTimelineStore } from "@/stores/timelineStore";
@@ -27,20 +27,10 @@ export function useTimeline() {
       ? addMonths(startDate, MONTHS_VISIBLE)
       : addWeeks(startDate, WEEKS_VISIBLE);
 
-  // Extend API query range to cover occupancy filter dates if they exceed visible range
-  let queryStart = startDate;
-  let queryEnd = endDate;
-  if (occupancyFilter?.dateFrom) {
-    const f = parseISO(occupancyFilter.dateFrom);
-    if (f < queryStart) queryStart = f;
-  }
-  if (occupancyFilter?.dateTo) {
-    const t = parseISO(occupancyFilter.dateTo);
-    if (t > queryEnd) queryEnd = t;
-  }
-
-  const startStr = format(queryStart, "yyyy-MM-dd");
-  const endStr = format(queryEnd, "yyyy-MM-dd");
+  // The occupancy filter's dates may lie outside the visible range; the
+  // server reads what it needs for them without widening the response.
+  const startStr = format(startDate, "yyyy-MM-dd");
+  const endStr = format(endDate, "yyyy-MM-dd");
 
   const granularity = viewMode === "weekly" ? "weekly" : "monthly";
 
@@ -53,6 +43,7 @@ export function useTimeline() {
       selectedTechnologyIds,
       debouncedSearch,
       viewMode,
+      occupancyFilter,
     ],
     queryFn: () =>
       fetchTimeline(
@@ -62,6 +53,7 @@ export function useTimeline() {
         selectedTechnologyIds.length > 0 ? selectedTechnologyIds : undefined,
         debouncedSearch || undefined,
         granularity,
+        occupancyFilter,
       ),
   });
 
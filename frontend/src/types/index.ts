@@ -5,6 +5,7 @@ export * from "./employee";
 export * from "./project";
 export * from "./assignment";
 export * from "./settings";
+export * from "./job";
 export * from "./timeline";
 export * from "./layout";
 export * from "./ui";
@@ -0,0 +1,14 @@
+export type JobStatus = "queued" | "running" | "succeeded" | "failed";
+
+export interface Job<TResult = unknown> {
+  id: number;
+  kind: string;
+  status: JobStatus;
+  attempts: number;
+  max_attempts: number;
+  result: TResult | null;
+  error: string | null;
+  created_at: string | null;
+  started_at: string | null;
+  finished_at: string | null;
+}